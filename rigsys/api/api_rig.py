@@ -1,6 +1,6 @@
 """Rig API module."""
 
-import json
+import contextlib
 import logging
 import os
 
@@ -9,6 +9,10 @@ import maya.cmds as cmds
 import rigsys.modules.motion as motion
 import rigsys.modules.utility as utility
 import rigsys.modules.deformer as deformer
+import rigsys.lib.ctrl as ctrl
+import rigsys.lib.nodeBudget as nodeBudget
+import rigsys.lib.proxyFile as proxyFile
+import rigsys.lib.proxySession as proxySession
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +37,13 @@ class Rig:
         self.utilityNodes = None
         self.proxyNodes = None
 
+        # Module full name: node summary, filled in when a build tracks nodes
+        self.nodeReport: dict = {}
+        # Proxy data validation report of the last build that used saved proxy data, see proxyFile.validate
+        self.proxyReport: dict = {}
+        # Live proxy edit tracking, see startProxySession
+        self.proxySession = None
+
     def preBuild(self) -> list:
         """Run any pre-build steps.
 
@@ -88,7 +99,8 @@ class Rig:
         return allModules
 
     def build(self, buildLevel: int = -1, buildProxiesOnly: bool = False, usedSavedProxyData: bool = False,
-              proxyDataFile: str = "") -> bool:
+              proxyDataFile: str = "", trackNodes: bool = False, nodeBudgets: dict = None,
+              duplicateMirrors: bool = False) -> bool:
         """Build the rig up to the specified level.
 
         Args:
@@ -96,7 +108,18 @@ class Rig:
                 modules will be built.
             buildProxiesOnly (bool, optional): If True, only the proxies will be built. Defaults to False.
             useSavedProxyData (bool, optional): If True, the proxy data will be loaded from a file. Defaults to True.
-            proxyDataFile (str, optional): The file to load the proxy data from. Defaults to "".
+            proxyDataFile (str, optional): The file to load the proxy data from, .json or .npz (see
+                rigsys.lib.proxyFile). Defaults to "".
+            trackNodes (bool, optional): If True, the nodes created by each module are counted into self.nodeReport.
+                Defaults to False.
+            nodeBudgets (dict, optional): Maximum node counts per module, see rigsys.lib.nodeBudget. Implies
+                trackNodes. The build raises an exception if a module exceeds its budget. Defaults to None.
+            duplicateMirrors (bool, optional): If True, mirrored motion modules with symmetric proxies are built by
+                duplicating the nodes of their L side instead of running their build again, see
+                rigsys.lib.mirrorNetwork. Only modules made of node types known to survive the reflection are
+                duplicated (no ribbons, pins, skinClusters, IK handles, aim constraints or constraint offsets); the
+                others, such as Limb and Hand, are built as usual. The duplicated joints and controls are re-oriented
+                to what a rebuilt R side gets, without negative scale. Defaults to False.
 
         Returns:
             bool: True if successful, False otherwise.
@@ -105,16 +128,19 @@ class Rig:
 
         proxyData = None
 
+        if nodeBudgets is not None:
+            trackNodes = True
+        self.nodeReport = {}
+        self.stopProxySession()
+
         if usedSavedProxyData:
             if proxyDataFile == "":
                 raise Exception("No proxy data file specified.")
             elif not os.path.exists(proxyDataFile):
                 raise Exception(f"Proxy data file {proxyDataFile} does not exist.")
-            else:
-                with open(proxyDataFile, "r") as file:
-                    proxyData = json.load(file)
 
         cmds.file(new=True, force=True)
+        ctrl.clearShapeCache()
 
         # Create a group node for the rig
         if not cmds.objExists(self.name):
@@ -125,6 +151,10 @@ class Rig:
 
         allModules = self.preBuild()
 
+        if usedSavedProxyData:
+            builtModules = [module for module in allModules if buildLevel == -1 or module.buildOrder <= buildLevel]
+            proxyData = self.loadProxyData(proxyDataFile, builtModules)
+
         for module in allModules:
             if buildLevel != -1 and module.buildOrder > buildLevel:
                 break
@@ -138,20 +168,56 @@ class Rig:
                     continue
             logger.info(f"Building module {module.getFullName()}...")
 
-            if isinstance(module, motion.MotionModuleBase):
-                module.run(buildProxiesOnly=buildProxiesOnly, usedSavedProxyData=usedSavedProxyData,
-                           proxyData=proxyData)
+            tracker = nodeBudget.NodeTracker() if trackNodes else contextlib.nullcontext()
+            with tracker:
+                if isinstance(module, motion.MotionModuleBase):
+                    module.run(buildProxiesOnly=buildProxiesOnly, usedSavedProxyData=usedSavedProxyData,
+                               proxyData=proxyData, duplicateMirror=duplicateMirrors)
+
+                else:
+                    module.run()
 
-            else:
-                module.run()
+            if trackNodes:
+                self.nodeReport[module.getFullName()] = nodeBudget.summarizeNodes(tracker.nodes())
 
             module.isRun = True
 
             logger.info(f"Module {module.getFullName()} built.")
 
+        if trackNodes:
+            nodeBudget.logReport(self.nodeReport)
+        if nodeBudgets is not None:
+            nodeBudget.enforceBudgets(self.nodeReport, nodeBudgets)
+
         # TODO: Do something with the success variable
         return success
 
+    def loadProxyData(self, fileName: str, modules: list = None) -> proxyFile.ProxyStore:
+        """Load and validate proxy data, for the given modules only.
+
+        The file is checked against the proxies of every motion module in one pass, and orphaned or missing entries
+        are logged and kept in self.proxyReport. Only the proxy data of the given (built) motion modules can be read
+        from the returned store, so .npz files never deserialize the other modules.
+
+        Args:
+            fileName (str): The proxy data file, .json or .npz.
+            modules (list, optional): The modules being built. Defaults to None, all motion modules.
+        """
+        if modules is None:
+            modules = list(self.motionModules.values())
+
+        proxyData = proxyFile.load(fileName)
+
+        expected = {module.getFullName(): list(module.proxies) for module in self.motionModules.values()}
+        self.proxyReport = proxyFile.validate(proxyData, expected)
+        report = proxyFile.formatReport(self.proxyReport)
+        if report:
+            logger.warning(f"Proxy data {fileName} does not match the rig:\n{report}")
+
+        builtNames = [module.getFullName() for module in modules
+                      if isinstance(module, motion.MotionModuleBase) and not module.isMuted]
+        return proxyData.restrict(builtNames)
+
     def setParent(self, childModuleName: str, parentModuleName: str):
         """Set the parent of childModule to parentModule."""
         if childModuleName not in self.motionModules:
@@ -180,8 +246,38 @@ class Rig:
 
         cmds.parent(coreNodes, self.rigNode)
 
-    def saveProxyTransformations(self, fileName):
-        """Save proxy transformations to a given file."""
+    def startProxySession(self, fileName: str = None, autosaveDelay: float = None) -> proxySession.ProxySession:
+        """Start tracking proxy edits, after building the proxies. See rigsys.lib.proxySession.
+
+        While the session is active, saveProxyTransformations only reads the proxies that were moved.
+
+        Args:
+            fileName (str, optional): The proxy data file to save and autosave to. Defaults to None.
+            autosaveDelay (float, optional): Save to fileName after this many seconds without edits. Defaults to None,
+                no autosave.
+        """
+        self.stopProxySession()
+        self.proxySession = proxySession.ProxySession(self, fileName, autosaveDelay)
+        self.proxySession.start()
+        return self.proxySession
+
+    def stopProxySession(self, save: bool = False) -> None:
+        """Stop tracking proxy edits, optionally saving the proxy data first."""
+        if self.proxySession is not None:
+            self.proxySession.stop(save=save)
+        self.proxySession = None
+
+    def saveProxyTransformations(self, fileName, mirrorTolerance: float = 1e-6):
+        """Save proxy transformations to a given file.
+
+        .json files are written as indented JSON, any other extension as a compact .npz file, see rigsys.lib.proxyFile.
+        mirrorTolerance applies to .npz files only. With an active proxy session, only the moved proxies are read.
+        """
+        if self.proxySession is not None and self.proxySession.isActive:
+            self.proxySession.flush()
+            proxyFile.write(fileName, self.proxySession.proxyData, mirrorTolerance)
+            return
+
         proxyData = {}
 
         # Ensure we get proxies from mirrored modules as well
@@ -204,5 +300,4 @@ class Rig:
                     "rotation": proxyRotation,
                 }
 
-        with open(fileName, "w") as file:
-            json.dump(proxyData, file, indent=4)
+        proxyFile.write(fileName, proxyData, mirrorTolerance)
@@ -1,6 +1,18 @@
 """Helper classes and function for building controls."""
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
 
+# (shape, scale, orient, offset): list of (nameSuffix, degree, form, cvs, knots)
+_shapeTemplateCache = {}
+
+
+def clearShapeCache():
+    """Clear the cached control shape templates.
+
+    The rig calls this at the start of every build, so each unique shape is built once per build.
+    """
+    _shapeTemplateCache.clear()
+
 
 class Ctrl:
     """Class to hold information on a control."""
@@ -28,10 +40,39 @@ class Ctrl:
         self.offset = offset
 
     def giveCtrlShape(self):
-        """Give the control a shape."""
+        """Give the control a shape.
+
+        The curves for each unique (shape, scale, orient, offset) combination are built once and cached. Every
+        control after that creates its shapes directly from the cached CVs.
+        """
+        parent = om.MSelectionList().add(self.node).getDependNode(0)
+        curveFn = om.MFnNurbsCurve()
+        for nameSuffix, degree, form, cvs, knots in self.getShapeTemplate():
+            shapeObj = curveFn.create(cvs, knots, degree, form, False, False, parent)
+            cmds.rename(om.MFnDagNode(shapeObj).partialPathName(), self.node + nameSuffix)
+
+    def getShapeTemplate(self):
+        """Return the cached curve data for this control's shape, building it if necessary."""
+        key = (self.shape, tuple(self.scale), tuple(self.orient), tuple(self.offset))
+        if key not in _shapeTemplateCache:
+            _shapeTemplateCache[key] = self.buildShapeTemplate()
+        return _shapeTemplateCache[key]
+
+    def buildShapeTemplate(self):
+        """Build the shape with the curve library and read back its curve data."""
+        template = []
         shapes, crvNodes = self.curveLibrary(self.shape)
-        cmds.parent(shapes, self.node, s=True, r=True)
+        for index, shape in enumerate(shapes):
+            curveFn = om.MFnNurbsCurve(om.MSelectionList().add(shape).getDagPath(0))
+            template.append((
+                "Shape" if len(shapes) == 1 else f"_{index}Shape",
+                curveFn.degree,
+                curveFn.form,
+                om.MPointArray(curveFn.cvPositions(om.MSpace.kObject)),
+                om.MDoubleArray(curveFn.knots()),
+            ))
         cmds.delete(crvNodes)
+        return template
 
     def curveLibrary(self, shape):
         """Curve library for the control shapes.
@@ -0,0 +1,339 @@
+"""Lightweight matrix-network replacements for Maya constraints.
+
+The functions in this module share their call signature with the matching ``cmds`` constraint commands, so a module
+can swap ``cmds.parentConstraint(ctrl, jnt, n=f"{jnt}_ptc", mo=0)`` for
+``matrixConstraint.parentConstraint(ctrl, jnt, n=f"{jnt}_ptc", mo=0)`` without any other changes.
+
+When matrix constraints are disabled (the default), every call is forwarded to the regular ``cmds`` command. When they
+are enabled, a small multMatrix / decomposeMatrix network is built instead, which evaluates faster and parallelizes
+better than a constraint node.
+
+Example usage:
+
+import rigsys.lib.matrixConstraint as matrixConstraint
+
+matrixConstraint.setEnabled(True)
+matrixConstraint.parentConstraint("L_Arm_Shoulder_CTRL", "L_Arm_Shoulder", n="L_Arm_Shoulder_ptc", interpType=2)
+"""
+
+import logging
+
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
+
+logger = logging.getLogger(__name__)
+
+# Global switch. Modules should not change this; it is set per build or per session.
+_ENABLED = False
+
+# aimMatrix and blendMatrix were added in Maya 2020
+_MATRIX_NODES_API_VERSION = 20200000
+
+
+def setEnabled(enabled: bool = True) -> None:
+    """Turn matrix constraints on or off for every subsequent call."""
+    global _ENABLED
+    _ENABLED = bool(enabled)
+
+
+def isEnabled() -> bool:
+    """Return True if matrix constraints are currently enabled."""
+    return _ENABLED
+
+
+def hasMatrixNodes() -> bool:
+    """Return True if the running Maya version provides the aimMatrix and blendMatrix nodes."""
+    return cmds.about(apiVersion=True) >= _MATRIX_NODES_API_VERSION
+
+
+def parentConstraint(*args, **kwargs):
+    """Matrix equivalent of cmds.parentConstraint.
+
+    Supported flags: n/name, mo/maintainOffset, w/weight, st/skipTranslate, sr/skipRotate, interpType.
+
+    Returns:
+        list: The name of the node driving the constrained object, matching the cmds return value.
+    """
+    return _constrain("parent", args, kwargs)
+
+
+def pointConstraint(*args, **kwargs):
+    """Matrix equivalent of cmds.pointConstraint.
+
+    Supported flags: n/name, mo/maintainOffset, w/weight, sk/skip.
+    """
+    return _constrain("point", args, kwargs)
+
+
+def orientConstraint(*args, **kwargs):
+    """Matrix equivalent of cmds.orientConstraint.
+
+    Supported flags: n/name, mo/maintainOffset, w/weight, sk/skip, interpType.
+    """
+    return _constrain("orient", args, kwargs)
+
+
+def scaleConstraint(*args, **kwargs):
+    """Matrix equivalent of cmds.scaleConstraint.
+
+    Supported flags: n/name, mo/maintainOffset, w/weight, sk/skip.
+    """
+    return _constrain("scale", args, kwargs)
+
+
+def aimConstraint(*args, **kwargs):
+    """Matrix equivalent of cmds.aimConstraint.
+
+    Supported flags: n/name, mo/maintainOffset, aim/aimVector, u/upVector, wut/worldUpType, wuo/worldUpObject,
+    wu/worldUpVector, sk/skip. Falls back to cmds.aimConstraint on Maya versions without the aimMatrix node.
+    """
+    return _constrain("aim", args, kwargs)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Internals
+# ----------------------------------------------------------------------------------------------------------------------
+_CMDS_CONSTRAINTS = {
+    "parent": cmds.parentConstraint,
+    "point": cmds.pointConstraint,
+    "orient": cmds.orientConstraint,
+    "scale": cmds.scaleConstraint,
+    "aim": cmds.aimConstraint,
+}
+
+_AXES = ["X", "Y", "Z"]
+
+
+def _flag(kwargs, short, long, default=None):
+    """Pop a flag from kwargs, accepting either its short or long name."""
+    value = default
+    if long in kwargs:
+        value = kwargs.pop(long)
+    if short in kwargs:
+        value = kwargs.pop(short)
+    return value
+
+
+def _splitTargets(args):
+    """Split cmds-style positional arguments into a list of targets and the driven node."""
+    flat = []
+    for arg in args:
+        if isinstance(arg, (list, tuple)):
+            flat.extend(arg)
+        else:
+            flat.append(arg)
+
+    if len(flat) < 2:
+        cmds.error("At least one target and one constrained object must be given.")
+
+    return flat[:-1], flat[-1]
+
+
+def _skipAxes(value):
+    """Normalize a cmds skip flag ("x", ["x", "y"], "none") into a set of upper case axes."""
+    if value is None:
+        return set()
+    if isinstance(value, str):
+        value = [value]
+    return {axis.upper() for axis in value if axis.lower() != "none"}
+
+
+def _constrain(kind, args, kwargs):
+    """Build a constraint of the given kind, either as a matrix network or through cmds."""
+    kwargs = dict(kwargs)
+    interpType = kwargs.pop("interpType", None)
+
+    if not _ENABLED or (kind == "aim" and not hasMatrixNodes()):
+        result = _CMDS_CONSTRAINTS[kind](*args, **kwargs)
+        if interpType is not None and kind in ("parent", "orient"):
+            cmds.setAttr(f"{result[0]}.interpType", interpType)
+        return result
+
+    targets, driven = _splitTargets(args)
+    name = _flag(kwargs, "n", "name", f"{driven}_{kind}Matrix")
+    maintainOffset = bool(_flag(kwargs, "mo", "maintainOffset", False))
+    weights = _flag(kwargs, "w", "weight", 1.0)
+    if not isinstance(weights, (list, tuple)):
+        weights = [weights] * len(targets)
+
+    if kind == "aim":
+        node = _buildAim(targets, driven, name, maintainOffset, kwargs)
+        return [node]
+
+    if kind == "parent":
+        skipTranslate = _skipAxes(_flag(kwargs, "st", "skipTranslate"))
+        skipRotate = _skipAxes(_flag(kwargs, "sr", "skipRotate"))
+        channels = {"translate": skipTranslate, "rotate": skipRotate}
+    else:
+        skip = _skipAxes(_flag(kwargs, "sk", "skip"))
+        channels = {{"point": "translate", "orient": "rotate", "scale": "scale"}[kind]: skip}
+
+    if kwargs:
+        logger.warning(f"Unsupported flags ignored for matrix {kind}Constraint {name}: {list(kwargs)}")
+
+    targetPlugs = []
+    for index, target in enumerate(targets):
+        targetPlugs.append(_targetPlug(target, driven, f"{name}_tgt{index}", maintainOffset))
+
+    worldPlug = _blendTargets(targetPlugs, weights, name)
+    localMatrix = cmds.createNode("multMatrix", n=name)
+    cmds.connectAttr(worldPlug, f"{localMatrix}.matrixIn[0]")
+    cmds.connectAttr(f"{driven}.parentInverseMatrix[0]", f"{localMatrix}.matrixIn[1]")
+
+    _connectOutputs(f"{localMatrix}.matrixSum", driven, name, channels)
+
+    return [localMatrix]
+
+
+def _worldMatrix(node):
+    """Return the current world matrix of a node as an MMatrix."""
+    return om.MMatrix(cmds.xform(node, q=True, ws=True, m=True))
+
+
+def _targetPlug(target, driven, name, maintainOffset):
+    """Return the world matrix plug of a target, including the maintain-offset matrix if requested."""
+    if not maintainOffset:
+        return f"{target}.worldMatrix[0]"
+
+    offset = _worldMatrix(driven) * _worldMatrix(target).inverse()
+    offsetMatrix = cmds.createNode("multMatrix", n=f"{name}_mm")
+    cmds.setAttr(f"{offsetMatrix}.matrixIn[0]", list(offset), type="matrix")
+    cmds.connectAttr(f"{target}.worldMatrix[0]", f"{offsetMatrix}.matrixIn[1]")
+    return f"{offsetMatrix}.matrixSum"
+
+
+def _blendTargets(targetPlugs, weights, name):
+    """Blend several target matrices into one, returning the output plug."""
+    if len(targetPlugs) == 1:
+        return targetPlugs[0]
+
+    total = float(sum(weights))
+    if total == 0.0:
+        cmds.error(f"Target weights for {name} sum to zero.")
+
+    if hasMatrixNodes():
+        # blendMatrix blends each target onto the running result, so weight each one by its share of the
+        # accumulated total to get the same result as a normalized weighted average.
+        blend = cmds.createNode("blendMatrix", n=f"{name}_bm")
+        cmds.connectAttr(targetPlugs[0], f"{blend}.inputMatrix")
+        accumulated = float(weights[0])
+        for index, plug in enumerate(targetPlugs[1:]):
+            weight = float(weights[index + 1])
+            accumulated += weight
+            cmds.connectAttr(plug, f"{blend}.target[{index}].targetMatrix")
+            cmds.setAttr(f"{blend}.target[{index}].weight", weight / accumulated if accumulated else 0.0)
+        return f"{blend}.outputMatrix"
+
+    blend = cmds.createNode("wtAddMatrix", n=f"{name}_wam")
+    for index, plug in enumerate(targetPlugs):
+        cmds.connectAttr(plug, f"{blend}.wtMatrix[{index}].matrixIn")
+        cmds.setAttr(f"{blend}.wtMatrix[{index}].weightIn", float(weights[index]) / total)
+    return f"{blend}.matrixSum"
+
+
+def _jointOrientInverse(driven):
+    """Return the inverse joint orient matrix of a joint, or None if the joint orient is zero."""
+    if cmds.objectType(driven) != "joint":
+        return None
+
+    jointOrient = cmds.getAttr(f"{driven}.jointOrient")[0]
+    if not any(abs(value) > 1e-6 for value in jointOrient):
+        return None
+
+    euler = om.MEulerRotation([om.MAngle(value, om.MAngle.kDegrees).asRadians() for value in jointOrient])
+    return euler.asMatrix().inverse()
+
+
+def _connectOutputs(localPlug, driven, name, channels):
+    """Decompose a local matrix and connect the requested channels to the driven node."""
+    decompose = cmds.createNode("decomposeMatrix", n=f"{name}_dm")
+    cmds.connectAttr(localPlug, f"{decompose}.inputMatrix")
+    cmds.connectAttr(f"{driven}.rotateOrder", f"{decompose}.inputRotateOrder")
+
+    rotateSource = decompose
+    jointOrientInverse = _jointOrientInverse(driven) if "rotate" in channels else None
+    if jointOrientInverse is not None:
+        # Joints rotate on top of their joint orient, so take it back out before driving .rotate
+        orientMatrix = cmds.createNode("multMatrix", n=f"{name}_jo_mm")
+        cmds.connectAttr(localPlug, f"{orientMatrix}.matrixIn[0]")
+        cmds.setAttr(f"{orientMatrix}.matrixIn[1]", list(jointOrientInverse), type="matrix")
+        rotateSource = cmds.createNode("decomposeMatrix", n=f"{name}_jo_dm")
+        cmds.connectAttr(f"{orientMatrix}.matrixSum", f"{rotateSource}.inputMatrix")
+        cmds.connectAttr(f"{driven}.rotateOrder", f"{rotateSource}.inputRotateOrder")
+
+    for channel, skip in channels.items():
+        source = rotateSource if channel == "rotate" else decompose
+        outputName = f"output{channel.capitalize()}"
+        if not skip:
+            cmds.connectAttr(f"{source}.{outputName}", f"{driven}.{channel}", f=True)
+            continue
+        for axis in _AXES:
+            if axis not in skip:
+                cmds.connectAttr(f"{source}.{outputName}{axis}", f"{driven}.{channel}{axis}", f=True)
+
+
+def _buildAim(targets, driven, name, maintainOffset, kwargs):
+    """Build an aimMatrix network driving the rotation of the driven node."""
+    aimVector = _flag(kwargs, "aim", "aimVector", [1.0, 0.0, 0.0])
+    upVector = _flag(kwargs, "u", "upVector", [0.0, 1.0, 0.0])
+    worldUpType = _flag(kwargs, "wut", "worldUpType", "vector")
+    worldUpObject = _flag(kwargs, "wuo", "worldUpObject")
+    worldUpVector = _flag(kwargs, "wu", "worldUpVector", [0.0, 1.0, 0.0])
+    skip = _skipAxes(_flag(kwargs, "sk", "skip"))
+
+    if kwargs:
+        logger.warning(f"Unsupported flags ignored for matrix aimConstraint {name}: {list(kwargs)}")
+
+    if len(targets) > 1:
+        targetPlug = _blendTargets([f"{target}.worldMatrix[0]" for target in targets], [1.0] * len(targets), name)
+    else:
+        targetPlug = f"{targets[0]}.worldMatrix[0]"
+
+    # The aim input follows the driven node's parent and translation, but not its rotation, so the network does
+    # not feed back into itself.
+    inputCompose = cmds.createNode("composeMatrix", n=f"{name}_input_cm")
+    cmds.connectAttr(f"{driven}.translate", f"{inputCompose}.inputTranslate")
+    inputMatrix = cmds.createNode("multMatrix", n=f"{name}_input_mm")
+    cmds.connectAttr(f"{inputCompose}.outputMatrix", f"{inputMatrix}.matrixIn[0]")
+    cmds.connectAttr(f"{driven}.parentMatrix[0]", f"{inputMatrix}.matrixIn[1]")
+
+    aimNode = cmds.createNode("aimMatrix", n=f"{name}_am")
+    cmds.connectAttr(f"{inputMatrix}.matrixSum", f"{aimNode}.inputMatrix")
+    cmds.setAttr(f"{aimNode}.primaryInputAxis", *aimVector)
+    cmds.connectAttr(targetPlug, f"{aimNode}.primaryTargetMatrix")
+    cmds.setAttr(f"{aimNode}.secondaryInputAxis", *upVector)
+
+    # secondaryMode: 0 = none, 1 = aim, 2 = align
+    worldUpType = worldUpType.lower()
+    if worldUpType == "object":
+        cmds.setAttr(f"{aimNode}.secondaryMode", 1)
+        cmds.connectAttr(f"{worldUpObject}.worldMatrix[0]", f"{aimNode}.secondaryTargetMatrix")
+    elif worldUpType == "objectrotation":
+        cmds.setAttr(f"{aimNode}.secondaryMode", 2)
+        cmds.setAttr(f"{aimNode}.secondaryTargetVector", *worldUpVector)
+        cmds.connectAttr(f"{worldUpObject}.worldMatrix[0]", f"{aimNode}.secondaryTargetMatrix")
+    elif worldUpType == "none":
+        cmds.setAttr(f"{aimNode}.secondaryMode", 0)
+    else:
+        # "vector" and "scene" align with a world space vector
+        if worldUpType == "scene":
+            worldUpVector = [0.0, 1.0, 0.0]
+        cmds.setAttr(f"{aimNode}.secondaryMode", 2)
+        cmds.setAttr(f"{aimNode}.secondaryTargetVector", *worldUpVector)
+
+    worldPlug = f"{aimNode}.outputMatrix"
+    if maintainOffset:
+        aimed = om.MMatrix(cmds.getAttr(f"{aimNode}.outputMatrix"))
+        offset = _worldMatrix(driven) * aimed.inverse()
+        offsetMatrix = cmds.createNode("multMatrix", n=f"{name}_offset_mm")
+        cmds.setAttr(f"{offsetMatrix}.matrixIn[0]", list(offset), type="matrix")
+        cmds.connectAttr(worldPlug, f"{offsetMatrix}.matrixIn[1]")
+        worldPlug = f"{offsetMatrix}.matrixSum"
+
+    localMatrix = cmds.createNode("multMatrix", n=name)
+    cmds.connectAttr(worldPlug, f"{localMatrix}.matrixIn[0]")
+    cmds.connectAttr(f"{driven}.parentInverseMatrix[0]", f"{localMatrix}.matrixIn[1]")
+
+    _connectOutputs(f"{localMatrix}.matrixSum", driven, name, {"rotate": skip})
+
+    return localMatrix
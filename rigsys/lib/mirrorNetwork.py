@@ -0,0 +1,472 @@
+"""Mirror a built module by duplicating its node network.
+
+Rebuilding the R side of a mirrored module runs its whole buildModule again, temporary constraints and lofts included.
+For symmetric modules the result is a reflected copy of the L side, so it can be made by duplication instead:
+
+1. Every node the L side created (recorded with a rigsys.lib.nodeBudget.NodeTracker) is duplicated in one pass, DAG
+   hierarchies from their top-level transforms and DG nodes on their own. Each duplicated hierarchy is paired with its
+   source by walking both together.
+2. Every duplicate is renamed with stringUtils.mirrorString, so L_Arm_elbow_JNT becomes R_Arm_elbow_JNT.
+3. The connections of the network are re-created between the duplicates. Connections from outside the network come
+   from the R_ counterpart of the outside node if it exists, and from the same node otherwise. Connections to outside
+   nodes are only re-created if the R_ counterpart exists.
+4. Node names stored in string and enum attributes (socket metadata) are renamed.
+5. Every duplicated transform is re-oriented to the world matrix a rebuilt R side gives it, see getMirroredMatrix,
+   by setting its local translate and rotate (jointOrient for joints) parents first. The reflection is frozen into
+   those values, so no negative scale reaches the rig.
+
+A rebuilt R side aims its joints along the flipped aimAxis and upAxis, which negates all three of their axes. Controls
+and groups placed on a joint follow it. Other transforms, such as world aligned groups, keep their axes.
+
+Only networks made entirely of SAFE_NODE_TYPES are duplicated: transforms, joints, control curves, parent, point,
+orient and scale constraints, and math utility nodes, all of which either work in their parent's space or compensate
+with parentInverseMatrix. Scalar utility nodes are expected to carry control attribute values, which are the same on
+both sides, rather than translations. Constraints must have no offsets and multMatrix nodes no constant matrices, as
+those would need re-deriving for the R side. Anything else, such as ribbon surfaces, uvPin and follicle pins (world
+space outputs), skinClusters and their sets, IK handles and aim constraints (world up vectors), makes canDuplicate
+return False so the module is built as usual. Limb and Hand use ribbons and IK, so they are always rebuilt.
+
+Example usage:
+
+import rigsys.lib.mirrorNetwork as mirrorNetwork
+
+with nodeBudget.NodeTracker() as tracker:
+    module.buildModule()
+nameMap = mirrorNetwork.duplicateNetwork(tracker.nodes())
+"""
+
+import logging
+import math
+
+import numpy as np
+
+import rigsys.lib.proxyFile as proxyFile
+import rigsys.utils.stringUtils as stringUtils
+
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
+
+logger = logging.getLogger(__name__)
+
+# Largest proxy position (and rotation, in degrees) difference from the mirrored L side for a module to be duplicated
+SYMMETRY_TOLERANCE = 1e-4
+
+# Node types that are duplicated. They work in their parent's space, or compensate for it, so re-orienting the
+# duplicated transforms carries them over
+SAFE_NODE_TYPES = frozenset([
+    "transform", "joint", "nurbsCurve", "locator",
+    "parentConstraint", "pointConstraint", "orientConstraint", "scaleConstraint",
+    "multMatrix", "decomposeMatrix", "inverseMatrix", "pickMatrix",
+    "multiplyDivide", "multDoubleLinear", "reverse", "condition", "clamp", "setRange", "remapValue", "blendColors",
+    "blendTwoAttr", "unitConversion",
+])
+
+# Reflection across the YZ plane
+MIRROR_MATRIX = om.MMatrix([-1.0, 0.0, 0.0, 0.0,
+                            0.0, 1.0, 0.0, 0.0,
+                            0.0, 0.0, 1.0, 0.0,
+                            0.0, 0.0, 0.0, 1.0])
+
+# Negation of the three local axes, which flipping aimAxis and upAxis does to a joint
+FLIP_AXES_MATRIX = om.MMatrix([-1.0, 0.0, 0.0, 0.0,
+                               0.0, -1.0, 0.0, 0.0,
+                               0.0, 0.0, -1.0, 0.0,
+                               0.0, 0.0, 0.0, 1.0])
+
+
+def getName(node) -> str:
+    """Return the shortest unique name of an MObject, as cmds returns it."""
+    if node.hasFn(om.MFn.kDagNode):
+        return om.MDagPath.getAPathTo(node).partialPathName()
+    return om.MFnDependencyNode(node).name()
+
+
+def _toObjects(names: list) -> list:
+    """Return the MObjects of node names."""
+    selection = om.MSelectionList()
+    for name in names:
+        selection.add(name)
+    return [selection.getDependNode(index) for index in range(selection.length())]
+
+
+def getNetwork(nodes: list) -> tuple:
+    """Split recorded nodes into the top-level DAG nodes and the DG nodes.
+
+    Args:
+        nodes (list): MObjects, as returned by NodeTracker.nodes().
+
+    Returns:
+        tuple: (roots, dgNodes), the full paths of the DAG nodes whose parent is not in nodes, and the names of the
+            DG nodes.
+    """
+    dagPaths = {}
+    dgNodes = []
+    for node in nodes:
+        if node.hasFn(om.MFn.kDagNode):
+            dagPaths[om.MDagPath.getAPathTo(node).fullPathName()] = node
+        else:
+            dgNodes.append(om.MFnDependencyNode(node).name())
+
+    roots = [path for path in dagPaths if path.rsplit("|", 1)[0] not in dagPaths]
+    return roots, dgNodes
+
+
+def _hasOffset(node) -> bool:
+    """Return True if a constraint has an offset, or a multMatrix node a constant matrix other than identity."""
+    name = getName(node)
+    nodeType = om.MFnDependencyNode(node).typeName
+    if nodeType == "multMatrix":
+        for index in cmds.getAttr(f"{name}.matrixIn", multiIndices=True) or []:
+            plug = f"{name}.matrixIn[{index}]"
+            if _getPlug(plug).isDestination:
+                continue
+            if not om.MMatrix(cmds.getAttr(plug)).isEquivalent(om.MMatrix.kIdentity, SYMMETRY_TOLERANCE):
+                return True
+        return False
+
+    if nodeType == "parentConstraint":
+        plugs = [f"{name}.target[{index}].{attribute}"
+                 for index in cmds.getAttr(f"{name}.target", multiIndices=True) or []
+                 for attribute in ("targetOffsetTranslate", "targetOffsetRotate")]
+    elif nodeType in ("pointConstraint", "orientConstraint"):
+        plugs = [f"{name}.offset"]
+    else:
+        return False
+    return any(abs(value) > SYMMETRY_TOLERANCE for plug in plugs for value in cmds.getAttr(plug)[0])
+
+
+def canDuplicate(nodes: list) -> bool:
+    """Return True if a network can be duplicated.
+
+    Every node must be of a type in SAFE_NODE_TYPES, without offsets, and no shape may have been added to a transform
+    outside of it.
+    """
+    unsafe = sorted({om.MFnDependencyNode(node).typeName for node in nodes} - SAFE_NODE_TYPES)
+    if unsafe:
+        logger.info(f"Cannot duplicate node types {unsafe}.")
+        return False
+
+    offsets = [getName(node) for node in nodes if _hasOffset(node)]
+    if offsets:
+        logger.info(f"Cannot duplicate nodes with offsets {offsets}.")
+        return False
+
+    roots, dgNodes = getNetwork(nodes)
+    shapes = [root for root in roots if om.MSelectionList().add(root).getDependNode(0).hasFn(om.MFn.kShape)]
+    if shapes:
+        logger.info(f"Cannot duplicate shapes without their transform: {shapes}")
+    return not shapes
+
+
+def _pairHierarchies(source, duplicate) -> list:
+    """Return (source, duplicate) MObject pairs for a hierarchy and its duplicate, parents first.
+
+    Both hierarchies are walked together, pairing the children at the same index, so every node is paired with the
+    node at the same relative path.
+    """
+    pairs = [(source, duplicate)]
+    sourceFn = om.MFnDagNode(source)
+    duplicateFn = om.MFnDagNode(duplicate)
+    if sourceFn.childCount() != duplicateFn.childCount():
+        cmds.error(f"Duplicate of {sourceFn.fullPathName()} does not match its hierarchy")
+
+    for index in range(sourceFn.childCount()):
+        pairs.extend(_pairHierarchies(sourceFn.child(index), duplicateFn.child(index)))
+    return pairs
+
+
+def _duplicateNodes(roots: list, dgNodes: list) -> list:
+    """Duplicate the roots with their hierarchies, and the DG nodes.
+
+    Returns:
+        list: (source, duplicate) MObject pairs, with DAG parents before their children.
+    """
+    pairs = []
+    for root in roots:
+        newRoot = cmds.duplicate(root, returnRootsOnly=True)[0]
+        pairs.extend(_pairHierarchies(*_toObjects([root, newRoot])))
+
+    if dgNodes:
+        duplicates = [cmds.duplicate(node)[0] for node in dgNodes]
+        pairs.extend(zip(_toObjects(dgNodes), _toObjects(duplicates)))
+
+    cmds.select(clear=True)
+    return pairs
+
+
+def _mapPlug(plug: str, nameMap: dict) -> str:
+    """Return the plug on the duplicate of its node, or on the R_ counterpart of an outside node if it exists."""
+    node, attribute = plug.split(".", 1)
+    if node in nameMap:
+        return f"{nameMap[node]}.{attribute}"
+
+    mirrored = stringUtils.mirrorString(node)
+    if mirrored != node and cmds.objExists(mirrored):
+        return f"{mirrored}.{attribute}"
+    return plug
+
+
+def _getPlug(name: str):
+    """Return the MPlug of a plug name."""
+    return om.MSelectionList().add(name).getPlug(0)
+
+
+def _rewire(nameMap: dict) -> None:
+    """Re-create the connections of the source network on its duplicates, in one DG modifier.
+
+    The connections of the whole network are listed with one query per direction.
+    """
+    nodes = list(nameMap)
+    incoming = cmds.listConnections(nodes, source=True, destination=False, connections=True, plugs=True,
+                                    skipConversionNodes=False) or []
+    outgoing = cmds.listConnections(nodes, source=False, destination=True, connections=True, plugs=True,
+                                    skipConversionNodes=False) or []
+
+    connections = [(_mapPlug(source, nameMap), _mapPlug(destination, nameMap))
+                   for destination, source in zip(incoming[::2], incoming[1::2])]
+    for source, destination in zip(outgoing[::2], outgoing[1::2]):
+        # Connections inside the network are already listed as incoming
+        if destination.split(".", 1)[0] in nameMap:
+            continue
+        mappedDestination = _mapPlug(destination, nameMap)
+        if mappedDestination != destination:
+            connections.append((_mapPlug(source, nameMap), mappedDestination))
+
+    modifier = om.MDGModifier()
+    connected = set()
+    for source, destination in connections:
+        if destination in connected:
+            continue
+        sourcePlug = _getPlug(source)
+        destinationPlug = _getPlug(destination)
+        if destinationPlug.isDestination:
+            if destinationPlug.source() != sourcePlug:
+                logger.warning(f"Not connecting {source} to {destination}, it is already connected.")
+            continue
+        modifier.connect(sourcePlug, destinationPlug)
+        connected.add(destination)
+    modifier.doIt()
+
+
+def _renameAttributes(nodes: list, nameMap: dict) -> None:
+    """Rename the node names stored in the string and enum attributes of the duplicates."""
+    for node in nodes:
+        for attribute in cmds.listAttr(node, userDefined=True) or []:
+            plug = f"{node}.{attribute}"
+            attributeType = cmds.getAttr(plug, type=True)
+            if attributeType == "string":
+                value = cmds.getAttr(plug)
+                if value in nameMap:
+                    cmds.setAttr(plug, nameMap[value], type="string")
+            elif attributeType == "enum":
+                names = cmds.attributeQuery(attribute, node=node, listEnum=True)[0].split(":")
+                mapped = [nameMap.get(name, name) for name in names]
+                if mapped != names:
+                    cmds.addAttr(plug, edit=True, enumName=":".join(mapped))
+
+
+def getMirroredMatrix(matrix, flipAxes: bool):
+    """Return the world matrix of the mirror of a transform, as a rebuilt R side places it.
+
+    The position is reflected across the YZ plane. With flipAxes, as for joints aimed along the flipped aimAxis and
+    upAxis, all three axes are negated. Otherwise the axes are reflected, so world aligned transforms stay aligned.
+    Either way the result has the positive scale of the source.
+
+    Args:
+        matrix (MMatrix): The world matrix of the L side transform.
+        flipAxes (bool): Negate the axes of the transform.
+
+    Returns:
+        MMatrix: The world matrix of the R side transform.
+    """
+    return (FLIP_AXES_MATRIX if flipAxes else MIRROR_MATRIX) * om.MMatrix(matrix) * MIRROR_MATRIX
+
+
+def _worldMatrix(node: str):
+    """Return the world matrix of a transform."""
+    return om.MMatrix(cmds.xform(node, query=True, worldSpace=True, matrix=True))
+
+
+def _frame(matrix) -> np.ndarray:
+    """Return the axes (without scale) and position of a matrix, flattened."""
+    frame = np.array(list(matrix), dtype=np.float64).reshape(4, 4)
+    frame[:3] /= np.linalg.norm(frame[:3], axis=1, keepdims=True)
+    return frame.ravel()
+
+
+def _getConstrainedGroups(constraints: list) -> list:
+    """Return the set of driven node and targets of each parent and orient constraint."""
+    groups = []
+    for constraint in constraints:
+        if cmds.objectType(constraint) not in ("parentConstraint", "orientConstraint"):
+            continue
+        driven = cmds.listConnections(f"{constraint}.constraintParentInverseMatrix", source=True,
+                                      destination=False) or []
+        targets = cmds.listConnections(f"{constraint}.target", source=True, destination=False) or []
+        groups.append(set(driven + targets) - {constraint})
+    return groups
+
+
+def _getMirroredMatrices(sources: list, constraints: list) -> list:
+    """Return the mirrored world matrix of each source transform, see getMirroredMatrix.
+
+    Joints have their axes flipped, and so do transforms placed on a joint of the network (same position and axes),
+    such as controls and their groups. The targets and driven node of a parent or orient constraint share their axes,
+    so if one of them is flipped, all of them are.
+    """
+    matrices = [_worldMatrix(source) for source in sources]
+    isJoint = [cmds.objectType(source) == "joint" for source in sources]
+    jointFrames = np.array([_frame(matrix) for matrix, joint in zip(matrices, isJoint) if joint]).reshape(-1, 16)
+
+    flipAxes = {}
+    for source, matrix, joint in zip(sources, matrices, isJoint):
+        onJoint = len(jointFrames) and np.abs(jointFrames - _frame(matrix)).max(axis=1).min() < SYMMETRY_TOLERANCE
+        flipAxes[source] = joint or bool(onJoint)
+
+    groups = [[node for node in group if node in flipAxes] for group in _getConstrainedGroups(constraints)]
+    changed = True
+    while changed:
+        changed = False
+        for group in groups:
+            if any(flipAxes[node] for node in group) and not all(flipAxes[node] for node in group):
+                flipAxes.update(dict.fromkeys(group, True))
+                changed = True
+
+    return [getMirroredMatrix(matrix, flipAxes[source]) for source, matrix in zip(sources, matrices)]
+
+
+def _isDriven(node: str, attribute: str) -> bool:
+    """Return True if an attribute or any of its children is driven by a connection."""
+    plug = _getPlug(f"{node}.{attribute}")
+    return plug.isDestination or any(plug.child(index).isDestination for index in range(plug.numChildren()))
+
+
+def _setVector(node: str, attribute: str, values) -> None:
+    """Set a double3 attribute, unlocking it while it is set, unless it is driven by a connection."""
+    if _isDriven(node, attribute):
+        return
+
+    plugs = [f"{node}.{attribute}"] + [f"{node}.{attribute}{axis}" for axis in "XYZ"]
+    locked = [plug for plug in plugs if cmds.getAttr(plug, lock=True)]
+    for plug in locked:
+        cmds.setAttr(plug, lock=False)
+    cmds.setAttr(f"{node}.{attribute}", *values)
+    for plug in locked:
+        cmds.setAttr(plug, lock=True)
+
+
+def _eulerMatrix(degrees, order: int = om.MEulerRotation.kXYZ):
+    """Return the rotation matrix of euler angles in degrees."""
+    return om.MEulerRotation(*[math.radians(angle) for angle in degrees], order).asMatrix()
+
+
+def _toDegrees(rotation, order: int = om.MEulerRotation.kXYZ) -> list:
+    """Return the euler angles in degrees of a rotation matrix, in the given rotate order."""
+    euler = om.MTransformationMatrix(rotation).rotation().reorder(order)
+    return [math.degrees(angle) for angle in (euler.x, euler.y, euler.z)]
+
+
+def _setLocalMatrix(node: str, source: str, matrix) -> None:
+    """Set the translate and rotate of a transform from its local matrix; channels driven by connections are skipped.
+
+    A joint whose source is frozen (zero rotate), or whose rotate is driven, gets the whole rotation in its
+    jointOrient, as a rebuilt joint does. Pivots and scale are left as duplicated.
+    """
+    transformation = om.MTransformationMatrix(matrix)
+    translation = transformation.translation(om.MSpace.kTransform)
+    _setVector(node, "translate", [translation.x, translation.y, translation.z])
+    rotation = transformation.rotation(asQuaternion=True).asMatrix()
+
+    if cmds.objectType(node) == "joint":
+        frozen = all(abs(value) < SYMMETRY_TOLERANCE for value in cmds.getAttr(f"{source}.rotate")[0])
+        if frozen or _isDriven(node, "rotate"):
+            _setVector(node, "jointOrient", _toDegrees(rotation))
+            _setVector(node, "rotate", [0.0, 0.0, 0.0])
+            return
+        rotation = rotation * _eulerMatrix(cmds.getAttr(f"{node}.jointOrient")[0]).inverse()
+    else:
+        rotation = _eulerMatrix(cmds.getAttr(f"{node}.rotateAxis")[0]).inverse() * rotation
+
+    _setVector(node, "rotate", _toDegrees(rotation, cmds.getAttr(f"{node}.rotateOrder")))
+
+
+def reorient(pairs: list) -> None:
+    """Place duplicated transforms at the mirrored world matrices of their sources, see getMirroredMatrix.
+
+    Transforms are processed parents first. The local matrix of each one is found from the mirrored world matrix of
+    its parent (or the current one, for parents outside the network) and its offsetParentMatrix.
+
+    Args:
+        pairs (list): (source, duplicate) MObject pairs, with DAG parents before their children.
+    """
+    transforms = [(getName(source), om.MDagPath.getAPathTo(duplicate).fullPathName())
+                  for source, duplicate in pairs
+                  if duplicate.hasFn(om.MFn.kTransform) and not duplicate.hasFn(om.MFn.kConstraint)]
+    constraints = [getName(source) for source, _ in pairs if source.hasFn(om.MFn.kConstraint)]
+    matrices = _getMirroredMatrices([source for source, _ in transforms], constraints)
+
+    mirrored = {}
+    for (source, duplicate), matrix in zip(transforms, matrices):
+        parent = duplicate.rsplit("|", 1)[0]
+        if parent in mirrored:
+            parentMatrix = mirrored[parent]
+        else:
+            parentMatrix = _worldMatrix(parent) if parent else om.MMatrix()
+        local = matrix * parentMatrix.inverse()
+        if cmds.attributeQuery("offsetParentMatrix", node=duplicate, exists=True):
+            local = local * om.MMatrix(cmds.getAttr(f"{duplicate}.offsetParentMatrix")).inverse()
+
+        _setLocalMatrix(duplicate, source, local)
+        mirrored[duplicate] = matrix
+
+
+def duplicateNetwork(nodes: list) -> dict:
+    """Duplicate a module's node network as its mirrored counterpart.
+
+    Args:
+        nodes (list): MObjects created by the source module, as returned by NodeTracker.nodes().
+
+    Returns:
+        dict: Source node name to duplicate node name, for every duplicated node.
+    """
+    roots, dgNodes = getNetwork(nodes)
+    pairs = _duplicateNodes(roots, dgNodes)
+
+    for source, duplicate in pairs:
+        name = om.MFnDependencyNode(source).name()
+        mirrored = stringUtils.mirrorString(name)
+        if mirrored != name:
+            om.MFnDependencyNode(duplicate).setName(mirrored)
+
+    nameMap = {getName(source): getName(duplicate) for source, duplicate in pairs}
+
+    _rewire(nameMap)
+    _renameAttributes(list(nameMap.values()), nameMap)
+    reorient(pairs)
+
+    logger.info(f"Duplicated {len(nameMap)} nodes.")
+    return nameMap
+
+
+def mirrorValue(value, nameMap: dict):
+    """Return the value with the node names it holds, also inside lists, tuples and dicts, renamed by nameMap."""
+    if isinstance(value, str):
+        return nameMap.get(value, value)
+    if isinstance(value, (list, tuple)):
+        return type(value)(mirrorValue(item, nameMap) for item in value)
+    if isinstance(value, dict):
+        return {mirrorValue(key, nameMap): mirrorValue(item, nameMap) for key, item in value.items()}
+    return value
+
+
+def isSymmetric(sourceProxies: dict, proxies: dict, tolerance: float = SYMMETRY_TOLERANCE) -> bool:
+    """Return True if proxies mirror sourceProxies (as Proxy.doMirror computes it) within tolerance."""
+    if list(sourceProxies) != list(proxies):
+        return False
+
+    def transforms(proxyDict):
+        return proxyFile.toArray({key: {"position": proxy.position, "rotation": proxy.rotation}
+                                  for key, proxy in proxyDict.items()})[1]
+
+    return bool(np.allclose(proxyFile.mirrorTransforms(transforms(sourceProxies)), transforms(proxies),
+                            rtol=0.0, atol=tolerance))
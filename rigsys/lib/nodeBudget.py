@@ -0,0 +1,145 @@
+"""Attribute created DG nodes to the module that made them, and enforce node budgets.
+
+A NodeTracker records every node created while it is active. The rig wraps each module's run() in a tracker, then
+summarizes the surviving nodes per module: counts by node type, constraint count and outgoing connection count.
+
+Budgets are a dictionary keyed by module full name, with "*" applying to every module. Each budget maps a category to
+its maximum. Categories are "total", "constraints", "connections", or any node type name:
+
+budgets = {
+    "*": {"total": 500, "constraints": 40},
+    "L_Hand": {"multiplyDivide": 10, "follicle": 0},
+}
+"""
+
+import json
+import logging
+
+import maya.api.OpenMaya as om
+
+logger = logging.getLogger(__name__)
+
+TOTAL = "total"
+CONSTRAINTS = "constraints"
+CONNECTIONS = "connections"
+
+
+class NodeTracker:
+    """Context manager that records every node created while it is active."""
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._handles = []
+        self._callbackId = None
+
+    def __enter__(self):
+        """Start recording created nodes."""
+        self._callbackId = om.MDGMessage.addNodeAddedCallback(self._nodeAdded, "dependNode")
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        """Stop recording created nodes."""
+        om.MMessage.removeCallback(self._callbackId)
+        self._callbackId = None
+        return False
+
+    def _nodeAdded(self, node, clientData):
+        """Node added callback."""
+        self._handles.append(om.MObjectHandle(node))
+
+    def nodes(self) -> list:
+        """Return the recorded nodes that still exist, as MObjects."""
+        return [handle.object() for handle in self._handles if handle.isValid() and handle.isAlive()]
+
+
+def summarizeNodes(nodes: list) -> dict:
+    """Count nodes by type, plus constraints and outgoing connections.
+
+    Args:
+        nodes (list): MObjects, as returned by NodeTracker.nodes().
+
+    Returns:
+        dict: {"total": int, "constraints": int, "connections": int, "types": {nodeType: int}}
+    """
+    types = {}
+    constraints = 0
+    connections = 0
+
+    for node in nodes:
+        fn = om.MFnDependencyNode(node)
+        nodeType = fn.typeName
+        types[nodeType] = types.get(nodeType, 0) + 1
+
+        if node.hasFn(om.MFn.kConstraint):
+            constraints += 1
+
+        for plug in fn.getConnections():
+            connections += len(plug.connectedTo(False, True))
+
+    return {
+        TOTAL: len(nodes),
+        CONSTRAINTS: constraints,
+        CONNECTIONS: connections,
+        "types": dict(sorted(types.items())),
+    }
+
+
+def getBudgetViolations(report: dict, budgets: dict) -> list:
+    """Compare a node report against budgets.
+
+    Args:
+        report (dict): Module full name to summary, as built by summarizeNodes().
+        budgets (dict): Module full name (or "*") to {category: maximum}.
+
+    Returns:
+        list: (moduleName, category, count, maximum) for every exceeded budget.
+    """
+    violations = []
+    for moduleName, summary in report.items():
+        moduleBudget = dict(budgets.get("*", {}))
+        moduleBudget.update(budgets.get(moduleName, {}))
+
+        for category, maximum in moduleBudget.items():
+            if category in (TOTAL, CONSTRAINTS, CONNECTIONS):
+                count = summary[category]
+            else:
+                count = summary["types"].get(category, 0)
+
+            if count > maximum:
+                violations.append((moduleName, category, count, maximum))
+
+    return violations
+
+
+def enforceBudgets(report: dict, budgets: dict) -> None:
+    """Raise an exception if any module exceeds its node budget."""
+    violations = getBudgetViolations(report, budgets)
+    if not violations:
+        return
+
+    for moduleName, category, count, maximum in violations:
+        logger.error(f"Module {moduleName} exceeds its {category} budget: {count} > {maximum}")
+
+    raise Exception(f"{len(violations)} node budget(s) exceeded: {sorted({v[0] for v in violations})}")
+
+
+def logReport(report: dict, nodeTypes: list = None) -> None:
+    """Log a node report, one line per module.
+
+    Args:
+        report (dict): The node report.
+        nodeTypes (list, optional): Node types to list per module. Defaults to the usual suspects for rig cost.
+    """
+    if nodeTypes is None:
+        nodeTypes = ["follicle", "uvPin", "multiplyDivide", "skinCluster"]
+
+    for moduleName, summary in report.items():
+        typeCounts = ", ".join(f"{nodeType}: {summary['types'].get(nodeType, 0)}" for nodeType in nodeTypes)
+        logger.info(f"{moduleName}: {summary[TOTAL]} nodes, {summary[CONSTRAINTS]} constraints, "
+                    f"{summary[CONNECTIONS]} connections ({typeCounts})")
+
+
+def writeReport(report: dict, fileName: str) -> None:
+    """Write a node report to a JSON file."""
+    with open(fileName, "w") as file:
+        json.dump(report, file, indent=4)
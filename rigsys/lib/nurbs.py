@@ -1,12 +1,84 @@
 """Functions for working with nurbs."""
 
+import numpy as np
+
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
 
+import rigsys.utils.componentCodec as componentCodec
 import rigsys.utils.listUtils as listUtils
 
 
-def returnNurbsCVs(target, orderRows=False, direction="u"):
-    """Find all the components of a nurbs, curve, or poly object."""
+def getComponentCounts(shape: str) -> tuple:
+    """Return the component counts of a mesh, nurbs curve or nurbs surface shape.
+
+    Counts come straight from the API, without touching the selection. Periodic curves and surfaces only count their
+    unique CVs, like cmds does.
+
+    Returns:
+        tuple: (vertexCount,) for meshes, (cvCount,) for curves and (cvCountU, cvCountV) for surfaces.
+    """
+    dagPath = om.MSelectionList().add(shape).getDagPath(0)
+
+    if dagPath.hasFn(om.MFn.kMesh):
+        return (om.MFnMesh(dagPath).numVertices,)
+
+    if dagPath.hasFn(om.MFn.kNurbsCurve):
+        curveFn = om.MFnNurbsCurve(dagPath)
+        count = curveFn.numCVs
+        if curveFn.form == om.MFnNurbsCurve.kPeriodic:
+            count -= curveFn.degree
+        return (count,)
+
+    if dagPath.hasFn(om.MFn.kNurbsSurface):
+        surfaceFn = om.MFnNurbsSurface(dagPath)
+        countU = surfaceFn.numCVsInU
+        countV = surfaceFn.numCVsInV
+        if surfaceFn.formInU == om.MFnNurbsSurface.kPeriodic:
+            countU -= surfaceFn.degreeInU
+        if surfaceFn.formInV == om.MFnNurbsSurface.kPeriodic:
+            countV -= surfaceFn.degreeInV
+        return (countU, countV)
+
+    raise ValueError(f"{shape} is not a mesh, nurbs curve or nurbs surface.")
+
+
+def getComponentIndices(shape: str, direction: str = "u"):
+    """Return the component indices of a shape as a NumPy array.
+
+    Meshes and curves return a 1D array of indices. Surfaces return an integer grid of (u, v) index pairs, of shape
+    (cvCountU, cvCountV, 2) for direction "u" (one row per U) or (cvCountV, cvCountU, 2) for direction "v".
+    """
+    counts = getComponentCounts(shape)
+    if len(counts) == 1:
+        return np.arange(counts[0])
+
+    grid = np.stack(np.indices(counts), axis=-1)
+    if direction.lower() == "v":
+        grid = grid.transpose(1, 0, 2)
+    return grid
+
+
+def getComponentNames(shape: str) -> list:
+    """Return compact component range names covering every component of a shape.
+
+    For example ["pCubeShape1.vtx[0:7]"], ["curveShape1.cv[0:3]"] or ["surfaceShape1.cv[0:3][0:7]"]. cmds commands
+    accept these in place of one name per component.
+    """
+    indices = getComponentIndices(shape)
+    if indices.ndim == 3:
+        return componentCodec.encodeGrid(shape, "cv", indices)
+
+    component = "vtx" if cmds.objectType(shape) == "mesh" else "cv"
+    return componentCodec.encode(shape, component, indices)
+
+
+def returnNurbsCVs(target, orderRows=False, direction="u", compact=False):
+    """Find all the components of a nurbs, curve, or poly object.
+
+    This returns one name per component, or with compact=True a few range names per shape (see getComponentNames),
+    which cmds commands accept just the same. Prefer compact or getComponentIndices for large shapes.
+    """
     # Get all the shapes of the target object
     shapes = cmds.listRelatives(target, shapes=True)
 
@@ -17,9 +89,6 @@ def returnNurbsCVs(target, orderRows=False, direction="u"):
     # Initialize an empty list to store the components
     results = []
 
-    # Store the current selection so we can restore it later
-    orig = cmds.ls(sl=True)
-
     # Loop over each shape and retrieve its components
     for shape in shapes:
         # Check if the shape is not an intermediate shape
@@ -28,91 +97,36 @@ def returnNurbsCVs(target, orderRows=False, direction="u"):
             # Get the type of the shape
             sType = cmds.objectType(shape)
 
+            # Compact range names cover every component of the shape in one or two strings
+            if compact and sType in ("mesh", "nurbsCurve", "nurbsSurface"):
+                results.append(getComponentNames(shape))
+
             # If the shape is a mesh, retrieve its vertices
-            if sType == "mesh":
-                components = []
-                vCount = cmds.polyEvaluate((shape), v=1)
-                for x in range(0, vCount):
-                    comp = "{}.vtx[{}]".format(shape, x)
-                    components.append(comp)
-                results.append(components)
+            elif sType == "mesh":
+                results.append([f"{shape}.vtx[{x}]" for x in getComponentIndices(shape).tolist()])
 
             # If the shape is a nurbs curve, retrieve its control vertices (CVs)
             elif sType == "nurbsCurve":
-                components = []
-                cvs = cmds.getAttr("{}.cv[*]".format(shape))
-                cvNum = len(cvs)
-                for x in range(0, cvNum):
-                    comp = "{}.cv[{}]".format(shape, x)
-                    components.append(comp)
-                results.append(components)
+                results.append([f"{shape}.cv[{x}]" for x in getComponentIndices(shape).tolist()])
 
             # If the shape is a nurbs surface, retrieve its CVs
             elif sType == "nurbsSurface":
-                # Select all the CVs of the surface
-                cmds.select("{}.cv[*][*]".format(shape))
-                cvs = cmds.ls(sl=True, flatten=True)
-
-                # Determine the maximum U and V values of the CVs
-                sU = 0
-                sV = 0
-                for cv in cvs:
-                    toks = cv.split("[")
-                    uval = toks[1].split("]")
-                    uval = int(uval[0])
-                    vval = toks[2].split("]")
-                    vval = int(vval[0])
-                    if uval > sU:
-                        sU = uval
-                    if vval > sV:
-                        sV = vval
-                sU += 1
-                sV += 1
-
-                # Build the list of CVs
-                for x in range(0, sU):
-                    for y in range(0, sV):
-                        comp = "{}.cv[{}][{}]".format(shape, x, y)
-                        results.append(comp)
-
-                # Restore the original selection
-                cmds.select(orig)
+                grid = getComponentIndices(shape).reshape(-1, 2).tolist()
+                results.append([f"{shape}.cv[{u}][{v}]" for u, v in grid])
 
     # Flatten the list of components
     results = listUtils.flattenList(results)
 
     # If orderRows is True, order the components into rows based on the direction argument
     if orderRows:
-        rowU = 0
-        rowV = 0
-        for component in results:
-            toks = component.split("[")
-            uVal = toks[1].split("]")
-            uVal = int(uVal[0])
-            vVal = toks[2].split("]")
-            vVal = int(vVal[0])
-            if uVal > rowU:
-                rowU = uVal
-            if vVal > rowV:
-                rowV = vVal
-        rowU += 1
-        rowV += 1
-        rows = []
-        if direction.lower() == "u":
-            for u in range(0, rowU):
-                row = []
-                for v in range(0, rowV):
-                    component = "{}.cv[{}][{}]".format(target, u, v)
-                    row.append(component)
-                rows.append(row)
-        elif direction.lower() == "v":
-            for x in range(0, rowV):
-                row = []
-                for y in range(0, rowU):
-                    component = "{}.cv[{}][{}]".format(target, y, x)
-                    row.append(component)
-                rows.append(row)
-        results = rows
+        surfaces = [shape for shape in shapes if cmds.objectType(shape) == "nurbsSurface"]
+        if not surfaces or direction.lower() not in ("u", "v"):
+            return []
+        grid = getComponentIndices(surfaces[-1], direction)
+        if compact:
+            results = [componentCodec.encodeGrid(target, "cv", row) for row in grid]
+        else:
+            results = [[f"{target}.cv[{u}][{v}]" for u, v in row] for row in grid.tolist()]
 
     # Return the list of components
     return results
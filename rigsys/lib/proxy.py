@@ -1,8 +1,15 @@
-"""Proxy class for rigsys modules."""
+"""Proxy class for rigsys modules.
+
+buildProxies builds all the proxies of a module at once: every proxy module node is created once, proxy joints are
+created directly under their parent in hierarchy order, and all transforms are then set through the API without any
+further commands.
+"""
 
 import copy
 import logging
+import math
 
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
 
 logger = logging.getLogger(__name__)
@@ -33,6 +40,23 @@ class Proxy:
         """Return the full name of the proxy."""
         return f"{self.side}_{self.label}"
 
+    def getSceneName(self):
+        """Return the name of the proxy joint in the scene."""
+        return f"{self.side}_{self.label}_{self.name}_proxy"
+
+    def getParentSceneName(self):
+        """Return the name of the parent proxy joint in the scene, or None."""
+        if not self.parent:
+            return None
+        return f"{self.side}_{self.label}_{self.parent}_proxy"
+
+    def getWorldMatrix(self):
+        """Return the world matrix given by the proxy's position and rotation, as an MMatrix."""
+        transformation = om.MTransformationMatrix()
+        transformation.setRotation(om.MEulerRotation([math.radians(angle) for angle in self.rotation]))
+        transformation.setTranslation(om.MVector(self.position), om.MSpace.kWorld)
+        return transformation.asMatrix()
+
     def doMirror(self):
         """Mirror the proxy, returning a new proxy object."""
         if self.side == "M":
@@ -76,4 +100,63 @@ class Proxy:
             self.proxyModuleNode = cmds.createNode("transform", n="{}_{}_proxyMODULE".format(self.side, self.label))
             cmds.parent(self.proxyModuleNode, "proxies")
 
-            
+
+def sortProxies(proxies: list) -> list:
+    """Return the proxies ordered so every proxy comes after its parent, keeping the given order otherwise."""
+    proxiesByName = {proxy.getSceneName(): proxy for proxy in proxies}
+    ordered = []
+    visited = set()
+
+    for proxy in proxies:
+        chain = []
+        while proxy is not None and proxy.getSceneName() not in visited:
+            visited.add(proxy.getSceneName())
+            chain.append(proxy)
+            proxy = proxiesByName.get(proxy.getParentSceneName())
+        ordered.extend(reversed(chain))
+
+    return ordered
+
+
+def buildProxies(proxies: list) -> list:
+    """Build many proxies at once, returning their scene names in build order.
+
+    Equivalent to calling Proxy.build on each proxy, but every proxy module node is looked up or created once, each
+    joint is created directly under its parent, and the world transforms are set in one pass through the API.
+    """
+    proxies = sortProxies(proxies)
+
+    # One proxy module node per side and label
+    moduleNodes = {}
+    for proxy in proxies:
+        key = (proxy.side, proxy.label)
+        if key not in moduleNodes:
+            if proxy.proxyModuleNode is None:
+                proxy.buildProxyModule()
+            moduleNodes[key] = proxy.proxyModuleNode
+        proxy.proxyModuleNode = moduleNodes[key]
+
+    names = []
+    parents = []
+    built = set()
+    for proxy in proxies:
+        parent = proxy.getParentSceneName() or proxy.proxyModuleNode
+        names.append(cmds.createNode("joint", n=proxy.getSceneName(), p=parent, skipSelect=True))
+        parents.append(parent)
+        built.add(proxy.getSceneName())
+
+    # World matrices of the parents that are not proxies built here
+    selection = om.MSelectionList()
+    for name in names:
+        selection.add(name)
+    worldMatrices = {}
+    for parent in set(parents).difference(built):
+        worldMatrices[parent] = om.MMatrix(cmds.xform(parent, q=True, ws=True, matrix=True))
+
+    for index, proxy in enumerate(proxies):
+        worldMatrix = proxy.getWorldMatrix()
+        worldMatrices[proxy.getSceneName()] = worldMatrix
+        localMatrix = worldMatrix * worldMatrices[parents[index]].inverse()
+        om.MFnTransform(selection.getDagPath(index)).setTransformation(om.MTransformationMatrix(localMatrix))
+
+    return names
@@ -0,0 +1,200 @@
+"""Compare and merge proxy data.
+
+This module does not need Maya. It works on the proxy data written by Rig.saveProxyTransformations, as a dict, a
+rigsys.lib.proxyFile.ProxyStore or a file name (.json or .npz). Every module is compared as a whole (proxyCount, 6)
+array of positions and rotations, with separate tolerances for positions (scene units) and rotations (degrees).
+
+diff() reports the modules and proxies that were added, removed or moved between two versions. merge() combines two
+edited versions of the same base file, the way a version control merge would: a proxy changed on one side only takes
+that change, and a proxy changed differently on both sides is a conflict.
+
+Example usage:
+
+import rigsys.lib.proxyData as proxyData
+
+changes = proxyData.diff("proxies_v1.json", "proxies_v2.json")
+print(proxyData.formatDiff(changes))
+
+merged, conflicts = proxyData.merge("base.json", "mine.json", "theirs.json")
+"""
+
+import numpy as np
+
+import rigsys.lib.proxyFile as proxyFile
+
+POSITION_TOLERANCE = 1e-4
+ROTATION_TOLERANCE = 1e-3
+
+
+def _load(data):
+    """Return proxy data from a dict, ProxyStore or file name."""
+    if isinstance(data, str):
+        return proxyFile.load(data)
+    return data
+
+
+def _getModule(data, name: str) -> tuple:
+    """Return the proxy keys and (proxyCount, 6) transforms of a module, or empty ones if it is not in the data."""
+    if name not in data:
+        return [], np.zeros((0, 6))
+    if isinstance(data, proxyFile.ProxyStore):
+        return data.getProxyKeys(name), data.getTransforms(name)
+    return proxyFile.toArray(data[name])
+
+
+def _align(keys: list, moduleKeys: list, transforms) -> tuple:
+    """Return transforms reordered to keys, with NaN rows for missing proxies, and a mask of the present proxies."""
+    rows = {key: index for index, key in enumerate(moduleKeys)}
+    present = np.array([key in rows for key in keys], dtype=bool)
+    aligned = np.full((len(keys), 6), np.nan)
+    aligned[present] = transforms[[rows[key] for key in keys if key in rows]]
+    return aligned, present
+
+
+def _unionKeys(*keyLists) -> list:
+    """Return the union of key lists, in first-seen order."""
+    return list(dict.fromkeys(key for keys in keyLists for key in keys))
+
+
+def _differs(a, aPresent, b, bPresent, positionTolerance: float, rotationTolerance: float):
+    """Return a mask of the rows that differ in presence, position or rotation."""
+    delta = np.abs(a - b)
+    moved = (np.nan_to_num(delta[:, :3]) > positionTolerance).any(axis=1)
+    rotated = (np.nan_to_num(delta[:, 3:]) > rotationTolerance).any(axis=1)
+    return (aPresent != bPresent) | (aPresent & bPresent & (moved | rotated))
+
+
+def diff(base, other, positionTolerance: float = POSITION_TOLERANCE,
+         rotationTolerance: float = ROTATION_TOLERANCE) -> dict:
+    """Return the differences between two versions of proxy data.
+
+    Args:
+        base (dict | ProxyStore | str): The old proxy data.
+        other (dict | ProxyStore | str): The new proxy data.
+        positionTolerance (float, optional): Position changes up to this distance are ignored.
+        rotationTolerance (float, optional): Rotation changes up to this many degrees are ignored.
+
+    Returns:
+        dict: {"addedModules": [...], "removedModules": [...], "modules": {moduleName: {"added": [...],
+            "removed": [...], "changed": {proxyKey: {"position": distance, "rotation": largest angle change}}}}},
+            only listing modules that have differences.
+    """
+    base = _load(base)
+    other = _load(other)
+
+    result = {
+        "addedModules": [name for name in other if name not in base],
+        "removedModules": [name for name in base if name not in other],
+        "modules": {},
+    }
+
+    for name in base:
+        if name not in other:
+            continue
+
+        baseKeys, baseTransforms = _getModule(base, name)
+        otherKeys, otherTransforms = _getModule(other, name)
+        keys = _unionKeys(baseKeys, otherKeys)
+        a, aPresent = _align(keys, baseKeys, baseTransforms)
+        b, bPresent = _align(keys, otherKeys, otherTransforms)
+
+        changed = _differs(a, aPresent, b, bPresent, positionTolerance, rotationTolerance) & aPresent & bPresent
+        if not (changed.any() or (aPresent != bPresent).any()):
+            continue
+
+        distances = np.linalg.norm(b[:, :3] - a[:, :3], axis=1)
+        angles = np.abs(b[:, 3:] - a[:, 3:]).max(axis=1)
+        result["modules"][name] = {
+            "added": [key for key, isNew in zip(keys, bPresent & ~aPresent) if isNew],
+            "removed": [key for key, isGone in zip(keys, aPresent & ~bPresent) if isGone],
+            "changed": {keys[index]: {"position": float(distances[index]), "rotation": float(angles[index])}
+                        for index in np.flatnonzero(changed)},
+        }
+
+    return result
+
+
+def isEmpty(changes: dict) -> bool:
+    """Return True if a diff found no differences."""
+    return not (changes["addedModules"] or changes["removedModules"] or changes["modules"])
+
+
+def formatDiff(changes: dict) -> str:
+    """Return a diff as readable text, one line per change."""
+    lines = [f"+ {name}" for name in changes["addedModules"]]
+    lines.extend(f"- {name}" for name in changes["removedModules"])
+    for name, moduleChanges in changes["modules"].items():
+        lines.extend(f"+ {name}.{key}" for key in moduleChanges["added"])
+        lines.extend(f"- {name}.{key}" for key in moduleChanges["removed"])
+        lines.extend(f"~ {name}.{key}: moved {delta['position']:.4f}, rotated {delta['rotation']:.3f}"
+                     for key, delta in moduleChanges["changed"].items())
+    return "\n".join(lines)
+
+
+def merge(base, ours, theirs, positionTolerance: float = POSITION_TOLERANCE,
+          rotationTolerance: float = ROTATION_TOLERANCE, prefer: str = "ours") -> tuple:
+    """Three-way merge two edited versions of the same proxy data.
+
+    A proxy (or module) changed, added or removed on one side only takes that change. A proxy changed on both sides
+    within tolerance of each other takes our version. A proxy changed differently on both sides, or removed on one side
+    and changed on the other, is a conflict and takes the preferred side's version.
+
+    Args:
+        base (dict | ProxyStore | str): The common ancestor.
+        ours (dict | ProxyStore | str): Our edited version.
+        theirs (dict | ProxyStore | str): Their edited version.
+        positionTolerance (float, optional): Position changes up to this distance are ignored.
+        rotationTolerance (float, optional): Rotation changes up to this many degrees are ignored.
+        prefer (str, optional): "ours" or "theirs", the version kept for conflicts. Defaults to "ours".
+
+    Returns:
+        tuple: (merged, conflicts), where merged is the merged proxy data dict and conflicts a list of
+            (moduleName, proxyKey) pairs.
+    """
+    if prefer not in ("ours", "theirs"):
+        raise ValueError(f"prefer must be 'ours' or 'theirs', not {prefer}")
+
+    base = _load(base)
+    ours = _load(ours)
+    theirs = _load(theirs)
+    tolerances = (positionTolerance, rotationTolerance)
+
+    merged = {}
+    conflicts = []
+    for name in _unionKeys(ours, theirs, base):
+        baseKeys, baseTransforms = _getModule(base, name)
+        ourKeys, ourTransforms = _getModule(ours, name)
+        theirKeys, theirTransforms = _getModule(theirs, name)
+        keys = _unionKeys(ourKeys, theirKeys, baseKeys)
+
+        b, bPresent = _align(keys, baseKeys, baseTransforms)
+        o, oPresent = _align(keys, ourKeys, ourTransforms)
+        t, tPresent = _align(keys, theirKeys, theirTransforms)
+
+        oursChanged = _differs(b, bPresent, o, oPresent, *tolerances)
+        theirsChanged = _differs(b, bPresent, t, tPresent, *tolerances)
+        conflicting = oursChanged & theirsChanged & _differs(o, oPresent, t, tPresent, *tolerances)
+
+        takeTheirs = theirsChanged & ~oursChanged
+        if prefer == "theirs":
+            takeTheirs |= conflicting
+
+        result = np.where(takeTheirs[:, None], t, o)
+        present = np.where(takeTheirs, tPresent, oPresent)
+        conflicts.extend((name, keys[index]) for index in np.flatnonzero(conflicting))
+
+        # A module removed on one side and left alone on the other stays removed
+        if name in base and not present.any() and (name not in ours or name not in theirs):
+            continue
+
+        merged[name] = proxyFile.fromArray([key for key, isPresent in zip(keys, present) if isPresent],
+                                           result[present])
+
+    return merged, conflicts
+
+
+def mergeFiles(baseFile: str, ourFile: str, theirFile: str, outputFile: str, **kwargs) -> list:
+    """Merge two edited proxy files into outputFile, see merge. Returns the conflicts."""
+    merged, conflicts = merge(baseFile, ourFile, theirFile, **kwargs)
+    proxyFile.write(outputFile, merged)
+    return conflicts
@@ -0,0 +1,245 @@
+"""Proxy transformation files.
+
+This module does not need Maya. Proxy data is the nested dict written by Rig.saveProxyTransformations:
+
+    {moduleName: {proxyKey: {"position": [x, y, z], "rotation": [x, y, z]}}}
+
+It can be saved as indented JSON (.json) or as a compact, compressed .npz file. In a .npz file every module is a
+separate (proxyCount, 6) float64 array of positions and rotations, listed in a JSON header with its proxy keys, so a
+module can be read without decompressing the others. R_ modules that mirror their L_ module (as Proxy.doMirror
+computes it: position X, and every rotation axis, negated) within mirrorTolerance are stored once; the header records
+the module they mirror, and they are reflected on load.
+
+ProxyStore reads either format behind the same read-only dict interface, loading .npz modules on first access.
+validate() checks proxy data against the modules and proxy keys of a rig from the file's index alone, and
+ProxyStore.restrict() hides every module that is not being built, so only those are ever deserialized.
+
+Example usage:
+
+import rigsys.lib.proxyFile as proxyFile
+
+proxyFile.write("path/to/proxies.npz", proxyData)
+store = proxyFile.load("path/to/proxies.npz")
+store["L_Arm"]["Shoulder"]["position"]
+proxyFile.convert("path/to/proxies.npz", "path/to/proxies.json")
+report = proxyFile.validate(store, {"L_Arm": ["Shoulder", "Elbow", "Wrist"]})
+"""
+
+import collections.abc
+import copy
+import json
+import os
+
+import numpy as np
+
+import rigsys.utils.stringUtils as stringUtils
+
+FORMAT_VERSION = 1
+EXTENSION = ".npz"
+JSON_EXTENSION = ".json"
+
+# Proxy.doMirror negates position X and all three rotation axes
+_MIRROR_SIGNS = np.array([-1.0, 1.0, 1.0, -1.0, -1.0, -1.0])
+
+
+def toArray(moduleData: dict) -> tuple:
+    """Return the proxy keys and a (proxyCount, 6) array of positions and rotations of one module's proxy data."""
+    keys = list(moduleData)
+    transforms = np.array([list(moduleData[key]["position"]) + list(moduleData[key]["rotation"]) for key in keys],
+                          dtype=np.float64).reshape(-1, 6)
+    return keys, transforms
+
+
+def fromArray(keys: list, transforms) -> dict:
+    """Return one module's proxy data from its proxy keys and (proxyCount, 6) transform array."""
+    transforms = np.asarray(transforms, dtype=np.float64).tolist()
+    return {key: {"position": row[:3], "rotation": row[3:]} for key, row in zip(keys, transforms)}
+
+
+def mirrorTransforms(transforms):
+    """Return the transforms of the other side, matching Proxy.doMirror."""
+    return np.asarray(transforms, dtype=np.float64) * _MIRROR_SIGNS
+
+
+def _findMirrorSources(arrays: dict, tolerance: float) -> dict:
+    """Return R_ module name to L_ module name, for R_ modules that mirror their L_ module within tolerance."""
+    sources = {}
+    for name, (keys, transforms) in arrays.items():
+        source = stringUtils.mirrorString(name)
+        if not name.startswith("R_") or source not in arrays:
+            continue
+
+        sourceKeys, sourceTransforms = arrays[source]
+        if sourceKeys == keys and np.allclose(mirrorTransforms(sourceTransforms), transforms, rtol=0.0, atol=tolerance):
+            sources[name] = source
+    return sources
+
+
+def write(fileName: str, proxyData: dict, mirrorTolerance: float = 1e-6) -> None:
+    """Write proxy data, as JSON for .json files and as a compressed .npz file otherwise.
+
+    Args:
+        fileName (str): The file to write.
+        proxyData (dict): The proxy data.
+        mirrorTolerance (float, optional): R_ modules whose transforms are within this distance of the mirrored L_
+            module are stored as a reference to it (.npz only). Defaults to 1e-6.
+    """
+    if isinstance(proxyData, ProxyStore):
+        proxyData = proxyData.toDict()
+
+    if fileName.endswith(JSON_EXTENSION):
+        with open(fileName, "w") as file:
+            json.dump(proxyData, file, indent=4)
+        return
+
+    arrays = {name: toArray(moduleData) for name, moduleData in proxyData.items()}
+    mirrorSources = _findMirrorSources(arrays, mirrorTolerance)
+
+    modules = {}
+    payload = {}
+    for index, (name, (keys, transforms)) in enumerate(arrays.items()):
+        if name in mirrorSources:
+            modules[name] = {"proxies": keys, "mirrorOf": mirrorSources[name]}
+            continue
+
+        modules[name] = {"proxies": keys, "array": f"module{index}"}
+        payload[f"module{index}"] = transforms
+
+    header = {"version": FORMAT_VERSION, "modules": modules}
+    with open(fileName, "wb") as file:
+        np.savez_compressed(file, header=np.array(json.dumps(header)), **payload)
+
+
+def readHeader(fileName: str) -> dict:
+    """Read only the header of a .npz proxy file."""
+    with np.load(fileName) as archive:
+        header = json.loads(str(archive["header"]))
+
+    if header.get("version", FORMAT_VERSION) > FORMAT_VERSION:
+        raise ValueError(f"{fileName} was written by a newer version of rigsys ({header['version']}).")
+    return header
+
+
+class ProxyStore(collections.abc.Mapping):
+    """Read-only proxy data, loaded from a .json or .npz proxy file.
+
+    Behaves like the proxy data dict. .npz modules are only read and decompressed when first accessed.
+    """
+
+    def __init__(self, fileName: str) -> None:
+        """Open a proxy file, reading only its header for .npz files."""
+        self.fileName = fileName
+        self._cache = {}
+
+        if fileName.endswith(JSON_EXTENSION):
+            with open(fileName, "r") as file:
+                self._cache = json.load(file)
+            self._modules = {name: {"proxies": list(moduleData)} for name, moduleData in self._cache.items()}
+        else:
+            self._modules = readHeader(fileName)["modules"]
+
+        # Every module in the file, including those hidden by restrict, as mirrored modules may read them
+        self._index = self._modules
+
+    def __getitem__(self, name: str) -> dict:
+        """Return the proxy data of a module, reading it on first access."""
+        if name not in self._modules:
+            raise KeyError(name)
+        if name not in self._cache:
+            self._cache[name] = fromArray(self._modules[name]["proxies"], self.getTransforms(name))
+        return self._cache[name]
+
+    def __contains__(self, name) -> bool:
+        """Return True if the store holds a module, without reading it."""
+        return name in self._modules
+
+    def __iter__(self):
+        """Iterate over the module names."""
+        return iter(self._modules)
+
+    def __len__(self) -> int:
+        """Return the number of modules."""
+        return len(self._modules)
+
+    def restrict(self, names) -> "ProxyStore":
+        """Return a view of the store holding only the given modules. Modules missing from the file are ignored."""
+        view = copy.copy(self)
+        view._modules = {name: self._index[name] for name in names if name in self._index}
+        return view
+
+    def getProxyKeys(self, name: str) -> list:
+        """Return the proxy keys of a module, without reading its transforms."""
+        return list(self._modules[name]["proxies"])
+
+    def getTransforms(self, name: str):
+        """Return a module's transforms as a (proxyCount, 6) array of positions and rotations."""
+        module = self._index[name]
+        if name in self._cache:
+            return toArray(self._cache[name])[1]
+        if "mirrorOf" in module:
+            return mirrorTransforms(self.getTransforms(module["mirrorOf"]))
+
+        with np.load(self.fileName) as archive:
+            return archive[module["array"]]
+
+    def toDict(self) -> dict:
+        """Return all the proxy data as a plain dict."""
+        return {name: self[name] for name in self}
+
+
+def validate(proxyData, expected: dict) -> dict:
+    """Compare proxy data against the modules and proxy keys of a rig, without reading any transforms.
+
+    Args:
+        proxyData (dict | ProxyStore): The proxy data.
+        expected (dict): Module name to the proxy keys of the module.
+
+    Returns:
+        dict: {"orphanedModules": [...], "missingModules": [...], "orphanedProxies": {moduleName: [...]},
+            "missingProxies": {moduleName: [...]}}. Orphaned entries are in the data but not in the rig, missing
+            entries are in the rig but not in the data.
+    """
+    report = {
+        "orphanedModules": [name for name in proxyData if name not in expected],
+        "missingModules": [name for name in expected if name not in proxyData],
+        "orphanedProxies": {},
+        "missingProxies": {},
+    }
+
+    for name, proxyKeys in expected.items():
+        if name not in proxyData:
+            continue
+
+        if isinstance(proxyData, ProxyStore):
+            keys = proxyData.getProxyKeys(name)
+        else:
+            keys = list(proxyData[name])
+        orphaned = [key for key in keys if key not in proxyKeys]
+        missing = [key for key in proxyKeys if key not in keys]
+        if orphaned:
+            report["orphanedProxies"][name] = orphaned
+        if missing:
+            report["missingProxies"][name] = missing
+
+    return report
+
+
+def formatReport(report: dict) -> str:
+    """Return a validation report as readable text, or an empty string if there is nothing to report."""
+    lines = [f"Module {name} is not in the rig" for name in report["orphanedModules"]]
+    lines.extend(f"Module {name} has no proxy data" for name in report["missingModules"])
+    lines.extend(f"Proxies {keys} of {name} are not in the rig" for name, keys in report["orphanedProxies"].items())
+    lines.extend(f"Proxies {keys} of {name} have no proxy data" for name, keys in report["missingProxies"].items())
+    return "\n".join(lines)
+
+
+def load(fileName: str) -> ProxyStore:
+    """Open a proxy file, see ProxyStore."""
+    if not os.path.exists(fileName):
+        raise FileNotFoundError(f"Proxy data file {fileName} does not exist.")
+    return ProxyStore(fileName)
+
+
+def convert(source: str, target: str, **kwargs) -> None:
+    """Convert a proxy file between the .json and .npz formats. kwargs are passed on to write."""
+    write(target, load(source).toDict(), **kwargs)
@@ -0,0 +1,165 @@
+"""Track proxy edits live, so saving only reads the proxies that changed.
+
+A ProxySession holds the proxy data of a rig in memory and registers a world matrix callback on every proxy joint in
+the scene. Moving a proxy (or one of its parents) marks it dirty; flush() reads only the dirty proxies back into the
+proxy data, through the API. With an autosave delay, the proxy data is also written to disk once the proxies have
+not been touched for that many seconds.
+
+Start a session after building the proxies, usually through Rig.startProxySession, and stop it before rebuilding.
+
+Example usage:
+
+character.build(buildProxiesOnly=True, usedSavedProxyData=True, proxyDataFile="path/to/proxies.npz")
+session = character.startProxySession("path/to/proxies.npz", autosaveDelay=2.0)
+# ... move proxies ...
+session.save()
+session.stop()
+"""
+
+import logging
+import math
+import threading
+import time
+
+import rigsys.lib.proxyFile as proxyFile
+
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
+import maya.utils
+
+logger = logging.getLogger(__name__)
+
+
+def getProxyTransform(sceneName: str) -> dict:
+    """Return the world space position and rotation of a proxy joint, as saved in proxy data.
+
+    The rotation is in the joint's rotate order, as xform returns it.
+    """
+    dagPath = om.MSelectionList().add(sceneName).getDagPath(0)
+    transformation = om.MTransformationMatrix(dagPath.inclusiveMatrix())
+    position = transformation.translation(om.MSpace.kWorld)
+    # MEulerRotation orders are numbered like the rotateOrder attribute
+    rotateOrder = om.MFnDependencyNode(dagPath.node()).findPlug("rotateOrder", False).asInt()
+    rotation = transformation.rotation().reorder(rotateOrder)
+    return {
+        "position": [position.x, position.y, position.z],
+        "rotation": [math.degrees(rotation.x), math.degrees(rotation.y), math.degrees(rotation.z)],
+    }
+
+
+class ProxySession:
+    """Live proxy edit tracking for a rig whose proxies are built."""
+
+    def __init__(self, rig, fileName: str = None, autosaveDelay: float = None) -> None:
+        """Initialize the session.
+
+        Args:
+            rig (Rig): The rig, with its proxies built.
+            fileName (str, optional): The proxy data file written by save and autosave. Defaults to None.
+            autosaveDelay (float, optional): Seconds without proxy edits after which the proxy data is saved to
+                fileName. Defaults to None, no autosave.
+        """
+        self._rig = rig
+        self.fileName = fileName
+        self.autosaveDelay = autosaveDelay
+
+        self.proxyData: dict = {}
+        self.dirty: set = set()
+
+        # Proxy scene name: (module full name, proxy key)
+        self._proxies = {}
+        self._callbacks = []
+        self._lastEdit = 0.0
+        self._timer = None
+        self._lock = threading.Lock()
+
+    @property
+    def isActive(self) -> bool:
+        """Return True while the callbacks are registered."""
+        return bool(self._callbacks)
+
+    def start(self) -> None:
+        """Read every proxy once and register a world matrix callback on each."""
+        if self.isActive:
+            return
+
+        for module in self._rig.motionModules.values():
+            moduleData = self.proxyData.setdefault(module.getFullName(), {})
+            for proxyKey, proxy in module.proxies.items():
+                sceneName = proxy.getSceneName()
+                if not cmds.objExists(sceneName):
+                    logger.warning(f"Proxy {sceneName} does not exist.")
+                    continue
+
+                self._proxies[sceneName] = (module.getFullName(), proxyKey)
+                moduleData[proxyKey] = getProxyTransform(sceneName)
+
+                dagPath = om.MSelectionList().add(sceneName).getDagPath(0)
+                self._callbacks.append(
+                    om.MDagMessage.addWorldMatrixModifiedCallback(dagPath, self._onMatrixModified, sceneName))
+
+        logger.info(f"Tracking {len(self._proxies)} proxies.")
+
+    def stop(self, save: bool = False) -> None:
+        """Remove the callbacks and cancel any pending autosave, optionally saving first."""
+        if save:
+            self.save()
+
+        if self._callbacks:
+            om.MMessage.removeCallbacks(self._callbacks)
+        self._callbacks = []
+
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = None
+
+    def flush(self) -> int:
+        """Read the dirty proxies back into the proxy data. Returns the number of proxies read."""
+        with self._lock:
+            dirty = self.dirty
+            self.dirty = set()
+
+        for sceneName in dirty:
+            if not cmds.objExists(sceneName):
+                continue
+            moduleName, proxyKey = self._proxies[sceneName]
+            self.proxyData[moduleName][proxyKey] = getProxyTransform(sceneName)
+
+        return len(dirty)
+
+    def save(self, fileName: str = None) -> None:
+        """Flush the dirty proxies and write the proxy data, to fileName or the session's file."""
+        fileName = fileName or self.fileName
+        if not fileName:
+            cmds.error("No proxy data file given to save to.")
+
+        self.flush()
+        proxyFile.write(fileName, self.proxyData)
+        logger.info(f"Saved proxy data to {fileName}")
+
+    def _onMatrixModified(self, node, modified, sceneName) -> None:
+        """Mark a proxy dirty, and schedule an autosave."""
+        with self._lock:
+            self.dirty.add(sceneName)
+            self._lastEdit = time.monotonic()
+            if self.autosaveDelay is None or not self.fileName or self._timer is not None:
+                return
+            self._timer = threading.Timer(self.autosaveDelay, maya.utils.executeDeferred, [self._onAutosave])
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _onAutosave(self) -> None:
+        """Save once the proxies have not been edited for autosaveDelay seconds, otherwise wait again."""
+        with self._lock:
+            self._timer = None
+            if not self.isActive:
+                return
+            remaining = self._lastEdit + self.autosaveDelay - time.monotonic()
+            if remaining > 0.0:
+                self._timer = threading.Timer(remaining, maya.utils.executeDeferred, [self._onAutosave])
+                self._timer.daemon = True
+                self._timer.start()
+                return
+
+        self.save()
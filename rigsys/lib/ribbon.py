@@ -0,0 +1,91 @@
+"""Functions for attaching transforms to ribbon surfaces."""
+
+import maya.cmds as cmds
+
+# uvPin and offsetParentMatrix were added in Maya 2020
+_UV_PIN_API_VERSION = 20200000
+
+
+def hasUvPin() -> bool:
+    """Return True if the running Maya version provides the uvPin node."""
+    return cmds.about(apiVersion=True) >= _UV_PIN_API_VERSION
+
+
+def ribbonParameters(count: int, v: float = 0.5) -> list:
+    """Return count evenly spaced (u, v) parameters along a ribbon, from u=0 to u=1."""
+    if count == 1:
+        return [(0.0, v)]
+
+    step = 1.0 / (count - 1)
+    return [(min(i * step, 1.0), v) for i in range(count)]
+
+
+def pinToSurface(surface: str, parameters: list, name: str, token: str = "", parent: str = None,
+                 useUvPin: bool = True) -> list:
+    """Create a transform pinned to the surface at each (u, v) parameter.
+
+    With useUvPin, all transforms are driven by a single uvPin node through their offsetParentMatrix. Otherwise, or on
+    Maya versions without uvPin, a follicle is created per transform.
+
+    Args:
+        surface (str): The nurbs surface transform.
+        parameters (list): Normalized (u, v) pairs, one per transform.
+        name (str): Name prefix; transforms are named "{name}_{index}{token}_pin" or "{name}_{index}{token}_fol".
+        token (str, optional): Extra name token after the index. Defaults to "".
+        parent (str, optional): Node to parent the transforms under. It should have an identity world matrix, as the
+            transforms are driven in world space. Defaults to None.
+        useUvPin (bool, optional): Use a uvPin node if available. Defaults to True.
+
+    Returns:
+        list: The pinned transforms, in the same order as parameters.
+    """
+    surfaceShape = cmds.listRelatives(surface, s=True, ni=True)[0]
+
+    if useUvPin and hasUvPin():
+        return _pinWithUvPin(surfaceShape, parameters, name, token, parent)
+
+    return _pinWithFollicles(surface, surfaceShape, parameters, name, token, parent)
+
+
+def _pinWithUvPin(surfaceShape, parameters, name, token, parent):
+    """Drive every transform from one uvPin node."""
+    pinNode = cmds.createNode("uvPin", n=f"{name}{token}_uvPin")
+    cmds.connectAttr(f"{surfaceShape}.worldSpace[0]", f"{pinNode}.deformedGeometry")
+    cmds.setAttr(f"{pinNode}.normalizedIsoParms", True)
+    # Match follicle orientation: X along U, Z along the surface normal
+    cmds.setAttr(f"{pinNode}.tangentAxis", 0)
+    cmds.setAttr(f"{pinNode}.normalAxis", 2)
+
+    pins = []
+    for index, (u, v) in enumerate(parameters):
+        if parent:
+            pin = cmds.createNode("transform", n=f"{name}_{index}{token}_pin", p=parent)
+        else:
+            pin = cmds.createNode("transform", n=f"{name}_{index}{token}_pin")
+        cmds.setAttr(f"{pinNode}.coordinate[{index}].coordinateU", u)
+        cmds.setAttr(f"{pinNode}.coordinate[{index}].coordinateV", v)
+        cmds.connectAttr(f"{pinNode}.outputMatrix[{index}]", f"{pin}.offsetParentMatrix")
+        pins.append(pin)
+
+    return pins
+
+
+def _pinWithFollicles(surface, surfaceShape, parameters, name, token, parent):
+    """Create one follicle per transform."""
+    follicles = []
+    for index, (u, v) in enumerate(parameters):
+        fol = cmds.createNode("transform", n=f"{name}_{index}{token}_fol")
+        folShape = cmds.createNode("follicle", n=f"{name}_{index}{token}_folShape", p=fol)
+
+        cmds.connectAttr(f"{surface}.worldMatrix[0]", f"{folShape}.inputWorldMatrix", f=True)
+        cmds.connectAttr(f"{surfaceShape}.local", f"{folShape}.inputSurface", f=True)
+        cmds.setAttr(f"{folShape}.parameterV", v)
+        cmds.setAttr(f"{folShape}.parameterU", u)
+        cmds.connectAttr(f"{folShape}.outRotate", f"{fol}.rotate", f=True)
+        cmds.connectAttr(f"{folShape}.outTranslate", f"{fol}.translate", f=True)
+
+        if parent:
+            cmds.parent(fol, parent)
+        follicles.append(fol)
+
+    return follicles
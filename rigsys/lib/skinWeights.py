@@ -0,0 +1,647 @@
+"""Read and write skinCluster weights through MFnSkinCluster.
+
+The full weight matrix of a skinCluster is read with one MFnSkinCluster.getWeights call and set with one setWeights
+call, instead of going through cmds.deformerWeights. Weights are saved with rigsys.lib.weightFile, which stores
+influences by name, so they are remapped to the current influence order on import.
+
+Files with a .json extension are passed through to cmds.deformerWeights, so existing weight files keep working.
+
+Saves can be incremental: exportWeights(delta=True) writes only the changed vertices to a patch file next to the
+baseline, and imports apply the patch chain.
+
+Every import stores two digests on the skinCluster: one of the weight file and import options, and one of the weights
+and influences it applied (weightFile.computeDigest). importWeights(skipUnchanged=True) skips files whose digest
+matches while the skinCluster's current weights still match the applied digest, so weights painted by hand after the
+import are re-imported. Any other change made through setWeightData clears the digests.
+
+.npz files also store the world space point positions, so importWeights(method="closestPoint") can transfer the
+weights onto changed topology with rigsys.lib.weightTransfer.
+
+exportWeightsBatch and importWeightsBatch handle many skinClusters at once. Maya is only touched from the calling
+thread; compressing, decompressing and file I/O of .npz files run in a thread pool, overlapping with the scene work.
+
+Example usage:
+
+import rigsys.lib.skinWeights as skinWeights
+
+skinWeights.exportWeights("body_scls", "path/to/weights/body_scls.npz")
+skinWeights.importWeights("body_scls", "path/to/weights/body_scls.npz")
+"""
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import rigsys.lib.weightFile as weightFile
+import rigsys.lib.weightOps as weightOps
+import rigsys.lib.weightTransfer as weightTransfer
+import rigsys.utils.componentCodec as componentCodec
+
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
+import maya.cmds as cmds
+
+logger = logging.getLogger(__name__)
+
+HEADER_ATTRIBUTES = ["maxInfluences", "maintainMaxInfluences", "normalizeWeights"]
+# Vertices per chunk for .wmap files; a chunk holds a dense (chunk, influences) matrix in memory
+DEFAULT_CHUNK_SIZE = 25000
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+IMPORT_METHODS = ("index", "closestPoint")
+# String attribute on the skinCluster holding the digests of the last import, "{importDigest}:{appliedDigest}"
+DIGEST_ATTR = "rigsysWeightDigest"
+
+
+def getSkinCluster(obj: str) -> str:
+    """Return the first skinCluster in the history of obj, or None."""
+    skinClusters = cmds.ls(cmds.listHistory(obj, pdo=True) or [], type="skinCluster")
+    return skinClusters[0] if skinClusters else None
+
+
+def getWeightFile(path: str, obj: str, suffix: str = "scls", extension: str = weightFile.EXTENSION) -> str:
+    """Return the weight file path for obj."""
+    return os.path.join(path, f"{obj}_{suffix}{extension}")
+
+
+def _getSkinClusterFn(skinCluster: str):
+    """Return the MFnSkinCluster for a skinCluster."""
+    return oma.MFnSkinCluster(om.MSelectionList().add(skinCluster).getDependNode(0))
+
+
+def _getGeometry(skinClusterFn, vertexIndices=None):
+    """Return the dag path of the deformed geometry and a component for its points.
+
+    The component covers all points, or only vertexIndices if given. Nurbs surface CVs are indexed u * numCVsInV + v,
+    matching the order of getWeights.
+    """
+    dagPath = skinClusterFn.getPathAtIndex(skinClusterFn.indexForOutputConnection(0))
+
+    if dagPath.hasFn(om.MFn.kNurbsSurface):
+        surfaceFn = om.MFnNurbsSurface(dagPath)
+        component = om.MFnDoubleIndexedComponent()
+        components = component.create(om.MFn.kSurfaceCVComponent)
+        if vertexIndices is None:
+            component.setCompleteData(surfaceFn.numCVsInU, surfaceFn.numCVsInV)
+        else:
+            uIndices, vIndices = np.divmod(np.asarray(vertexIndices), surfaceFn.numCVsInV)
+            component.addElements(list(zip(uIndices.tolist(), vIndices.tolist())))
+        return dagPath, components
+
+    if dagPath.hasFn(om.MFn.kMesh):
+        componentType = om.MFn.kMeshVertComponent
+        pointCount = om.MFnMesh(dagPath).numVertices
+    elif dagPath.hasFn(om.MFn.kNurbsCurve):
+        componentType = om.MFn.kCurveCVComponent
+        pointCount = om.MFnNurbsCurve(dagPath).numCVs
+    else:
+        raise ValueError(f"Unsupported geometry type for {dagPath.partialPathName()}")
+
+    component = om.MFnSingleIndexedComponent()
+    components = component.create(componentType)
+    if vertexIndices is None:
+        component.setCompleteData(pointCount)
+    else:
+        component.addElements(np.asarray(vertexIndices).tolist())
+    return dagPath, components
+
+
+def getTopologyHash(dagPath) -> str:
+    """Return a hash of the point count and connectivity of a mesh, nurbs curve or nurbs surface.
+
+    The hash ignores point positions, so it identifies weights that belong to the same topology.
+    """
+    digest = hashlib.sha1()
+    if dagPath.hasFn(om.MFn.kMesh):
+        counts, connects = om.MFnMesh(dagPath).getVertices()
+        digest.update(b"mesh")
+        digest.update(np.array(counts, dtype=np.int32).tobytes())
+        digest.update(np.array(connects, dtype=np.int32).tobytes())
+    elif dagPath.hasFn(om.MFn.kNurbsCurve):
+        curveFn = om.MFnNurbsCurve(dagPath)
+        digest.update(b"nurbsCurve")
+        digest.update(np.array([curveFn.numCVs, curveFn.degree, curveFn.form], dtype=np.int32).tobytes())
+    else:
+        surfaceFn = om.MFnNurbsSurface(dagPath)
+        digest.update(b"nurbsSurface")
+        digest.update(np.array([
+            surfaceFn.numCVsInU, surfaceFn.numCVsInV,
+            surfaceFn.degreeInU, surfaceFn.degreeInV,
+            surfaceFn.formInU, surfaceFn.formInV,
+        ], dtype=np.int32).tobytes())
+    return digest.hexdigest()
+
+
+def getPointPositions(dagPath):
+    """Return the world space positions of all points of the geometry, as a (pointCount, 3) array."""
+    points = om.MItGeometry(dagPath).allPositions(om.MSpace.kWorld)
+    return np.array([(point.x, point.y, point.z) for point in points], dtype=np.float64)
+
+
+def getInfluences(skinCluster: str) -> list:
+    """Return the influence names of a skinCluster, in physical index order."""
+    return [path.partialPathName() for path in _getSkinClusterFn(skinCluster).influenceObjects()]
+
+
+def _readWeights(skinClusterFn, vertexIndices=None):
+    """Return the dag path of the deformed geometry, the influence names and the weight matrix of a skinCluster."""
+    dagPath, components = _getGeometry(skinClusterFn, vertexIndices)
+    influences = [path.partialPathName() for path in skinClusterFn.influenceObjects()]
+
+    weights, influenceCount = skinClusterFn.getWeights(dagPath, components)
+    weights = np.fromiter(weights, dtype=np.float64, count=len(weights)).reshape(-1, influenceCount)
+    return dagPath, influences, weights
+
+
+def getWeightData(skinCluster: str, vertexIndices=None) -> weightFile.WeightData:
+    """Read the weight matrix of a skinCluster, for all points or only vertexIndices."""
+    dagPath, influences, weights = _readWeights(_getSkinClusterFn(skinCluster), vertexIndices)
+
+    header = {attr: cmds.getAttr(f"{skinCluster}.{attr}") for attr in HEADER_ATTRIBUTES}
+    header["skinCluster"] = skinCluster
+    header["geometry"] = dagPath.partialPathName()
+    if vertexIndices is None:
+        header["topologyHash"] = getTopologyHash(dagPath)
+        return weightFile.WeightData(weights, influences, header, getPointPositions(dagPath))
+    return weightFile.WeightData(weights, influences, header)
+
+
+def setWeightData(skinCluster: str, data: weightFile.WeightData, vertexIndices=None) -> None:
+    """Set the weight matrix of a skinCluster.
+
+    The data is remapped to the skinCluster's influence order by name. Every influence in the data must be on the
+    skinCluster. Without vertexIndices the data must cover every point; with them, row i of the data is applied to
+    point vertexIndices[i].
+    """
+    skinClusterFn = _getSkinClusterFn(skinCluster)
+    dagPath, components = _getGeometry(skinClusterFn, vertexIndices)
+    influences = [path.partialPathName() for path in skinClusterFn.influenceObjects()]
+
+    missing = [influence for influence in data.influences if influence not in influences]
+    if missing:
+        cmds.error(f"Missing the following influences {missing}; for {skinCluster}")
+
+    data = data.reorder(influences)
+    if vertexIndices is None:
+        pointCount = om.MItGeometry(dagPath).count()
+        if data.vertexCount != pointCount:
+            cmds.error(f"Weight data has {data.vertexCount} points, {dagPath.partialPathName()} has {pointCount}")
+        _checkTopology(skinCluster, dagPath, data.header)
+    elif data.vertexCount != len(vertexIndices):
+        cmds.error(f"Weight data has {data.vertexCount} points, but {len(vertexIndices)} vertex indices were given")
+
+    skinClusterFn.setWeights(
+        dagPath,
+        components,
+        om.MIntArray(range(len(influences))),
+        om.MDoubleArray(np.ascontiguousarray(data.weights, dtype=np.float64).ravel().tolist()),
+        False,
+    )
+
+    for attr in HEADER_ATTRIBUTES:
+        if attr in data.header:
+            cmds.setAttr(f"{skinCluster}.{attr}", data.header[attr])
+
+    setStoredDigest(skinCluster, "")
+
+
+def getImportDigest(fileName: str, hashContents: bool = True, **options) -> str:
+    """Return the digest of importing a weight file with the given importWeights options.
+
+    With hashContents False, files without a header digest are not hashed and None is returned for them.
+    """
+    fileDigest = weightFile.getFileDigest(fileName, hashContents)
+    if fileDigest is None:
+        return None
+    digest = hashlib.sha1(fileDigest.encode("utf-8"))
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def getAppliedDigest(skinCluster: str) -> str:
+    """Return the digest of the weights and influences a skinCluster currently holds, see weightFile.computeDigest."""
+    _, influences, weights = _readWeights(_getSkinClusterFn(skinCluster))
+    return weightFile.computeDigest(weightFile.WeightData(weights, influences, {}))
+
+
+def getStoredDigest(skinCluster: str) -> tuple:
+    """Return the (import, applied) digests stored on a skinCluster by the last import, or (None, None)."""
+    if not cmds.attributeQuery(DIGEST_ATTR, node=skinCluster, exists=True):
+        return None, None
+    importDigest, _, appliedDigest = (cmds.getAttr(f"{skinCluster}.{DIGEST_ATTR}") or "").partition(":")
+    return importDigest or None, appliedDigest or None
+
+
+def setStoredDigest(skinCluster: str, importDigest: str) -> None:
+    """Store an import digest on a skinCluster, with the digest of the weights it now holds.
+
+    An empty importDigest clears the stored digests.
+    """
+    if not cmds.attributeQuery(DIGEST_ATTR, node=skinCluster, exists=True):
+        if not importDigest:
+            return
+        cmds.addAttr(skinCluster, ln=DIGEST_ATTR, dt="string")
+    value = f"{importDigest}:{getAppliedDigest(skinCluster)}" if importDigest else ""
+    cmds.setAttr(f"{skinCluster}.{DIGEST_ATTR}", value, type="string")
+
+
+def isUnchanged(skinCluster: str, importDigest: str, storedDigest: tuple = None) -> bool:
+    """Return True if the skinCluster holds the weights of the import with importDigest.
+
+    The stored import digest must match, and the skinCluster's current weights must still match the applied digest.
+
+    Args:
+        skinCluster (str): The skinCluster.
+        importDigest (str): The digest of the import, see getImportDigest.
+        storedDigest (tuple, optional): The result of getStoredDigest, if already read. Defaults to None.
+    """
+    storedImport, storedApplied = storedDigest or getStoredDigest(skinCluster)
+    if importDigest is None or storedImport != importDigest:
+        return False
+    return storedApplied == getAppliedDigest(skinCluster)
+
+
+def transferWeightData(skinCluster: str, data: weightFile.WeightData, k: int = 4) -> None:
+    """Set the weights of a skinCluster from weight data saved on different topology.
+
+    Each point gets the inverse distance blend of the weights of its k closest saved points, applied with a single
+    setWeights call. The data must have positions.
+    """
+    if data.positions is None:
+        cmds.error(f"Weight data for {skinCluster} has no point positions to transfer from")
+
+    dagPath, _ = _getGeometry(_getSkinClusterFn(skinCluster))
+    weights = weightTransfer.transferWeights(data.positions, data.weights, getPointPositions(dagPath), k)
+
+    header = dict(data.header)
+    header.pop("topologyHash", None)
+    setWeightData(skinCluster, weightFile.WeightData(weights, data.influences, header))
+
+
+def getLockedInfluences(skinCluster: str) -> list:
+    """Return the influences of a skinCluster whose weights are locked (lockInfluenceWeights)."""
+    return [influence for influence in getInfluences(skinCluster)
+            if cmds.attributeQuery("liw", node=influence, exists=True) and cmds.getAttr(f"{influence}.liw")]
+
+
+def getInfluenceComponents(skinCluster: str, influence: str, threshold: float = 0.0) -> list:
+    """Return compact range names of the points weighted to an influence above threshold.
+
+    For example ["bodyShape.vtx[0:812]", "bodyShape.vtx[900:1020]"], ready to pass to cmds.select or cmds.skinPercent.
+    """
+    data = getWeightData(skinCluster)
+    if influence not in data.influences:
+        cmds.error(f"{influence} is not an influence of {skinCluster}")
+
+    geometry = data.header["geometry"]
+    points = np.flatnonzero(data.weights[:, data.influences.index(influence)] > threshold)
+
+    dagPath = om.MSelectionList().add(geometry).getDagPath(0)
+    if dagPath.hasFn(om.MFn.kNurbsSurface):
+        # Points are indexed u * numCVsInV + v, as in _getGeometry
+        cvCountV = om.MFnNurbsSurface(dagPath).numCVsInV
+        return componentCodec.encodeGrid(geometry, "cv", np.stack(np.divmod(points, cvCountV), axis=-1))
+    component = "vtx" if cmds.objectType(geometry) == "mesh" else "cv"
+    return componentCodec.encode(geometry, component, points)
+
+
+def cleanSkinWeights(skinCluster: str, threshold: float = None, maxInfluences: int = None,
+                     normalizeWeights: bool = True, locked: list = None) -> None:
+    """Prune, cap and normalize the weights of a skinCluster with one getWeights and one setWeights call.
+
+    See weightOps.cleanWeights for the arguments. locked defaults to the influences locked in the scene.
+    """
+    if locked is None:
+        locked = getLockedInfluences(skinCluster)
+
+    data = weightOps.cleanWeights(getWeightData(skinCluster), threshold, maxInfluences, normalizeWeights, locked)
+    setWeightData(skinCluster, data)
+
+
+def _checkTopology(skinCluster, dagPath, header):
+    """Warn if the weight data was saved on a different topology."""
+    if header.get("topologyHash") not in (None, getTopologyHash(dagPath)):
+        logger.warning(f"Weight data for {skinCluster} was saved on a different topology; applying by point index.")
+
+
+def exportMappedWeights(skinCluster: str, fileName: str, slots: int = None,
+                        chunkSize: int = DEFAULT_CHUNK_SIZE) -> None:
+    """Write the weights of a skinCluster to a .wmap file, chunkSize vertices at a time.
+
+    Args:
+        skinCluster (str): The skinCluster.
+        fileName (str): The .wmap file to write.
+        slots (int, optional): Influences stored per vertex. Defaults to the skinCluster's maxInfluences.
+        chunkSize (int, optional): Vertices read per getWeights call. Defaults to DEFAULT_CHUNK_SIZE.
+    """
+    skinClusterFn = _getSkinClusterFn(skinCluster)
+    dagPath, _ = _getGeometry(skinClusterFn)
+    pointCount = om.MItGeometry(dagPath).count()
+    influences = [path.partialPathName() for path in skinClusterFn.influenceObjects()]
+
+    header = {attr: cmds.getAttr(f"{skinCluster}.{attr}") for attr in HEADER_ATTRIBUTES}
+    header["skinCluster"] = skinCluster
+    header["geometry"] = dagPath.partialPathName()
+    header["topologyHash"] = getTopologyHash(dagPath)
+    if slots is None:
+        slots = header["maxInfluences"]
+
+    indices, values = weightFile.createMapped(fileName, influences, pointCount, slots, header)
+    for start in range(0, pointCount, chunkSize):
+        stop = min(start + chunkSize, pointCount)
+        chunk = getWeightData(skinCluster, np.arange(start, stop))
+        indices[start:stop], values[start:stop] = weightFile.toSlots(chunk.weights, slots)
+    indices.flush()
+    values.flush()
+    del indices, values
+
+
+def importMappedWeights(skinCluster: str, fileName: str, chunkSize: int = DEFAULT_CHUNK_SIZE,
+                        vertexRange: tuple = None, remap=None, cleanup: dict = None) -> None:
+    """Apply the weights of a .wmap file to a skinCluster, chunkSize vertices at a time.
+
+    Args:
+        skinCluster (str): The skinCluster.
+        fileName (str): The .wmap file to read.
+        chunkSize (int, optional): Vertices read and set per chunk. Defaults to DEFAULT_CHUNK_SIZE.
+        vertexRange (tuple, optional): (start, stop) to load only those vertices. Defaults to None, all vertices.
+        remap (dict | str, optional): Influence remap table, applied to every chunk. Defaults to None.
+        cleanup (dict, optional): Keyword arguments for weightOps.cleanWeights, applied to every chunk. Defaults to
+            None.
+    """
+    remap = weightOps.loadRemapTable(remap)
+    header = weightFile.readHeader(fileName)
+    start, stop = vertexRange or (0, header["vertexCount"])
+
+    dagPath, _ = _getGeometry(_getSkinClusterFn(skinCluster))
+    pointCount = om.MItGeometry(dagPath).count()
+    if vertexRange is None and header["vertexCount"] != pointCount:
+        cmds.error(f"Weight data has {header['vertexCount']} points, {dagPath.partialPathName()} has {pointCount}")
+    if stop > pointCount:
+        cmds.error(f"Vertex range {start}:{stop} is out of range for {dagPath.partialPathName()}")
+    _checkTopology(skinCluster, dagPath, header)
+
+    for chunk in weightFile.iterMappedChunks(fileName, chunkSize, start, stop):
+        chunkStart = chunk.header["vertexStart"]
+        chunk = weightOps.remapInfluences(chunk, remap)
+        if cleanup:
+            chunk = weightOps.cleanWeights(chunk, **cleanup)
+        setWeightData(skinCluster, chunk, np.arange(chunkStart, chunkStart + chunk.vertexCount))
+
+
+def saveWeightData(fileName: str, data: weightFile.WeightData, delta: bool = False, tolerance: float = 1e-5,
+                   **kwargs) -> None:
+    """Save weight data to a .npz file, as a new baseline or as a patch.
+
+    Does not touch Maya, so it can run on a worker thread.
+
+    Args:
+        fileName (str): The baseline .npz file.
+        data (WeightData): The weights.
+        delta (bool, optional): If the baseline exists, write only the vertices that changed since the baseline and
+            its patches to the next patch file. Defaults to False, which writes a new baseline and deletes the patches.
+        tolerance (float, optional): Delta only, smallest weight change that marks a vertex as changed. Defaults to
+            1e-5.
+        **kwargs: Passed to weightFile.write for new baselines (sparse, maxInfluences, quantizeType).
+    """
+    if delta and os.path.exists(fileName):
+        base = weightFile.readChain(fileName)
+        if base.vertexCount == data.vertexCount:
+            rowCount = weightFile.writePatch(weightFile.getNextPatchFile(fileName), base, data, tolerance)
+            logger.info(f"Wrote {rowCount} changed vertices of {data.vertexCount} to a patch of {fileName}")
+            return
+        logger.warning(f"Point count changed since {fileName} was saved; writing a new baseline.")
+
+    weightFile.write(fileName, data, **kwargs)
+    weightFile.removePatches(fileName)
+
+
+def squashWeights(fileName: str, **kwargs) -> None:
+    """Fold the patches of a .npz weight file into its baseline. Keyword arguments are passed to weightFile.write."""
+    weightFile.squash(fileName, **kwargs)
+
+
+def exportWeights(skinCluster: str, fileName: str, **kwargs) -> None:
+    """Write the weights of a skinCluster to a file.
+
+    .json files are written with cmds.deformerWeights, .wmap files with exportMappedWeights (slots, chunkSize) and
+    anything else with saveWeightData (delta, tolerance, sparse, maxInfluences, quantizeType). Extra keyword arguments
+    are passed on.
+    """
+    if fileName.endswith(".json"):
+        _deformerWeights(skinCluster, fileName, ex=True)
+        return
+    if fileName.endswith(weightFile.MAPPED_EXTENSION):
+        exportMappedWeights(skinCluster, fileName, **kwargs)
+        return
+
+    saveWeightData(fileName, getWeightData(skinCluster), **kwargs)
+
+
+def readWeightData(fileName: str, remap=None, cleanup: dict = None) -> weightFile.WeightData:
+    """Read a .npz weight file with its patches, and apply an influence remap table and cleanup (see weightOps).
+
+    Does not touch Maya, so it can run on a worker thread.
+    """
+    data = weightOps.remapInfluences(weightFile.readChain(fileName), remap)
+    if cleanup:
+        data = weightOps.cleanWeights(data, **cleanup)
+    return data
+
+
+def importWeights(skinCluster: str, fileName: str, method: str = "index", k: int = 4, remap=None,
+                  cleanup: dict = None, skipUnchanged: bool = False, **kwargs) -> bool:
+    """Read the weights of a skinCluster from a file written by exportWeights, or by cmds.deformerWeights.
+
+    Args:
+        skinCluster (str): The skinCluster.
+        fileName (str): The weight file.
+        method (str, optional): "index" applies the weights by point index. "closestPoint" transfers them by position,
+            for geometry whose topology changed; .json files use deformerWeights' "nearest" method. Defaults to
+            "index".
+        k (int, optional): closestPoint only, number of saved points blended per point. Defaults to 4.
+        remap (dict | str, optional): Influence remap table, or a JSON file holding it, see weightOps. Defaults to
+            None.
+        cleanup (dict, optional): Keyword arguments for weightOps.cleanWeights (threshold, maxInfluences,
+            normalizeWeights, locked), applied before the weights are set. Defaults to None.
+        skipUnchanged (bool, optional): Skip the import if the skinCluster's stored digest matches the file and
+            options, and its weights have not changed since, see isUnchanged. Defaults to False.
+        **kwargs: Passed on to importMappedWeights for .wmap files (chunkSize, vertexRange).
+
+    Returns:
+        bool: False if the import was skipped, True otherwise.
+    """
+    if method not in IMPORT_METHODS:
+        cmds.error(f"Unknown import method {method}, expected one of {IMPORT_METHODS}")
+    if not os.path.exists(fileName):
+        cmds.error(f"Weight file does not exist {fileName}")
+
+    # Only hash whole files when the digest is compared, see getImportDigest
+    digest = getImportDigest(fileName, hashContents=skipUnchanged, method=method, k=k,
+                             remap=weightOps.loadRemapTable(remap), cleanup=cleanup, **kwargs)
+    if skipUnchanged and isUnchanged(skinCluster, digest):
+        logger.info(f"{skinCluster} already holds the weights of {fileName}, skipping import")
+        return False
+
+    _importWeights(skinCluster, fileName, method, k, remap, cleanup, **kwargs)
+    setStoredDigest(skinCluster, digest)
+    return True
+
+
+def _importWeights(skinCluster, fileName, method, k, remap, cleanup, **kwargs):
+    """Import a weight file, see importWeights."""
+    if fileName.endswith(".json"):
+        if remap:
+            cmds.error(f"Influence remapping is not supported for deformerWeights file {fileName}")
+        _deformerWeights(skinCluster, fileName, im=True, m="index" if method == "index" else "nearest")
+        if cleanup:
+            cleanSkinWeights(skinCluster, **cleanup)
+        return
+    if fileName.endswith(weightFile.MAPPED_EXTENSION):
+        if method != "index":
+            cmds.error(f"{fileName} has no point positions; .wmap files only support the index method")
+        importMappedWeights(skinCluster, fileName, remap=remap, cleanup=cleanup, **kwargs)
+        return
+
+    if method == "closestPoint":
+        transferWeightData(skinCluster, readWeightData(fileName, remap), k)
+        if cleanup:
+            cleanSkinWeights(skinCluster, **cleanup)
+    else:
+        setWeightData(skinCluster, readWeightData(fileName, remap, cleanup))
+
+
+def _isPooled(fileName):
+    """Return True if the file can be read or written off the main thread."""
+    return not fileName.endswith((".json", weightFile.MAPPED_EXTENSION))
+
+
+def exportWeightsBatch(jobs: list, maxWorkers: int = DEFAULT_WORKERS, **kwargs) -> None:
+    """Export the weights of many skinClusters.
+
+    The weights are read from Maya on the calling thread, while a thread pool compresses and writes the previous ones.
+    At most 2 * maxWorkers weight matrices are held in memory at once. .json and .wmap files are exported on the
+    calling thread.
+
+    Args:
+        jobs (list): (skinCluster, fileName) pairs.
+        maxWorkers (int, optional): Thread pool size. Defaults to DEFAULT_WORKERS.
+        **kwargs: Passed to saveWeightData for .npz files (delta, tolerance, sparse, maxInfluences, quantizeType), and
+            to exportWeights for the others.
+    """
+    with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+        pending = []
+        for skinCluster, fileName in jobs:
+            if not _isPooled(fileName):
+                exportWeights(skinCluster, fileName, **kwargs)
+                continue
+
+            if len(pending) >= 2 * maxWorkers:
+                pending.pop(0).result()
+            pending.append(executor.submit(saveWeightData, fileName, getWeightData(skinCluster), **kwargs))
+
+        for future in pending:
+            future.result()
+
+
+def importWeightsBatch(jobs: list, maxWorkers: int = DEFAULT_WORKERS, prefetch: int = None, remap=None,
+                       skipUnchanged: bool = False) -> None:
+    """Import the weights of many skinClusters.
+
+    A thread pool reads and decompresses the next files while the current one is applied on the calling thread, and
+    computes their import digests. .json and .wmap files are imported on the calling thread, see importWeights.
+    Without skipUnchanged, .npz files without a header digest are not hashed and store no digest.
+
+    Args:
+        jobs (list): (skinCluster, fileName) pairs.
+        maxWorkers (int, optional): Thread pool size. Defaults to DEFAULT_WORKERS.
+        prefetch (int, optional): Files read ahead of the one being applied. Defaults to maxWorkers.
+        remap (dict | str, optional): Influence remap table applied to every file, see weightOps. Defaults to None.
+        skipUnchanged (bool, optional): Skip files whose digest matches the one stored on their skinCluster, while
+            the skinCluster's weights have not changed since, see isUnchanged. Defaults to False.
+    """
+    remap = weightOps.loadRemapTable(remap)
+    missing = [fileName for _, fileName in jobs if not os.path.exists(fileName)]
+    if missing:
+        cmds.error(f"Weight files do not exist {missing}")
+
+    # Read on the calling thread, as the pool must not touch Maya
+    storedDigests = [getStoredDigest(skinCluster) if skipUnchanged else (None, None) for skinCluster, _ in jobs]
+
+    prefetch = prefetch or maxWorkers
+    skipped = 0
+    with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+        futures = {}
+
+        def submit(index):
+            fileName = jobs[index][1]
+            if _isPooled(fileName):
+                futures[index] = executor.submit(_readPooled, fileName, remap, storedDigests[index][0], skipUnchanged)
+
+        for index in range(min(prefetch, len(jobs))):
+            submit(index)
+
+        for index, (skinCluster, fileName) in enumerate(jobs):
+            if index + prefetch < len(jobs):
+                submit(index + prefetch)
+
+            if index not in futures:
+                skipped += not importWeights(skinCluster, fileName, remap=remap, skipUnchanged=skipUnchanged)
+                continue
+
+            digest, data = futures.pop(index).result()
+            if data is None:
+                if isUnchanged(skinCluster, digest, storedDigests[index]):
+                    skipped += 1
+                    continue
+                # Edited since the last import
+                data = readWeightData(fileName, remap)
+            setWeightData(skinCluster, data)
+            setStoredDigest(skinCluster, digest)
+
+    if skipped:
+        logger.info(f"Skipped {skipped} skinClusters that already hold their weights")
+
+
+def _readPooled(fileName, remap, storedDigest, skipUnchanged):
+    """Return the import digest and weight data of a file, or no data if the digest matches the stored import digest.
+
+    Runs on the thread pool of importWeightsBatch. Files are only hashed byte for byte when skipUnchanged needs it.
+    """
+    # Same options as importWeights' defaults, so single and batch imports share digests
+    digest = getImportDigest(fileName, hashContents=skipUnchanged, method="index", k=4, remap=remap, cleanup=None)
+    if skipUnchanged and digest == storedDigest:
+        return digest, None
+    return digest, readWeightData(fileName, remap)
+
+
+def findWeightFile(path: str, obj: str, suffix: str = "scls", extension: str = None) -> str:
+    """Return the weight file for obj, preferring .npz, then .wmap, then JSON. Returns None if none exist.
+
+    If extension is given, that file is returned when it exists, before the others are tried.
+    """
+    extensions = [weightFile.EXTENSION, weightFile.MAPPED_EXTENSION, ".json"]
+    if extension is not None:
+        extensions = [extension] + [other for other in extensions if other != extension]
+    for candidate in extensions:
+        fileName = getWeightFile(path, obj, suffix, candidate)
+        if os.path.exists(fileName):
+            return fileName
+    return None
+
+
+def _deformerWeights(skinCluster, fileName, m="index", **kwargs):
+    """Import or export a JSON weight file with cmds.deformerWeights."""
+    cmds.deformerWeights(
+        os.path.basename(fileName),
+        p=os.path.dirname(fileName),
+        deformer=skinCluster,
+        m=m,
+        at=["maintainMaxInfluences", "maxInfluences"],
+        format="JSON",
+        dv=1.0,
+        **kwargs
+    )
@@ -34,46 +34,56 @@ import maya.cmds as cmds
 import maya.mel as mel
 
 import rigsys.lib.nurbs as nurbs
+import rigsys.lib.skinWeights as skinWeights
 
 logger = logging.getLogger(__name__)
 
-def writeSCLS(objects:list=[], path:str = "", suffix:str = "scls"):
+def writeSCLS(objects:list=[], path:str = "", suffix:str = "scls", fileFormat: str = "npz", sparse: bool = True,
+              maxInfluences: int = None, quantizeType: str = None, maxWorkers: int = skinWeights.DEFAULT_WORKERS,
+              delta: bool = False):
+    """Write the skinCluster weights of each object to "{obj}_{suffix}.{fileFormat}" in path.
+
+    fileFormat "npz" reads the weights through MFnSkinCluster (see rigsys.lib.skinWeights) and compresses and writes
+    them on maxWorkers background threads; "json" uses cmds.deformerWeights. sparse, maxInfluences and quantizeType
+    select the .npz layout, see weightFile.write. delta writes only the changed vertices to a patch file, see
+    skinWeights.saveWeightData.
+    """
     if len(objects) == 0:
         objects = cmds.ls(sl=1)
         if len(objects) == 0:
             cmds.error("No Objects provided or selected.")
     if path == "":
         cmds.error("Path is empty")
-    
-    for obj in objects:
-        cmds.deformerWeights(f"{obj}_{suffix}.json", 
-                             ex=True,
-                             p=path,
-                             deformer=f"{obj}_{suffix}",
-                             at=["maintainMaxInfluences", "maxInfluences"],
-                             method="index",
-                             format="JSON",
-                             dv=1.0
-                             )
-
-def readSCLS(objects:list=[], path:str = "", suffix:str = "scls"):
+
+    jobs = [(f"{obj}_{suffix}", skinWeights.getWeightFile(path, obj, suffix, f".{fileFormat}")) for obj in objects]
+    if fileFormat == "npz":
+        skinWeights.exportWeightsBatch(jobs, maxWorkers, delta=delta, sparse=sparse, maxInfluences=maxInfluences,
+                                       quantizeType=quantizeType)
+    else:
+        skinWeights.exportWeightsBatch(jobs, maxWorkers)
+
+def readSCLS(objects:list=[], path:str = "", suffix:str = "scls", maxWorkers: int = skinWeights.DEFAULT_WORKERS,
+             remap=None):
+    """Read the skinCluster weights of each object from path.
+
+    "{obj}_{suffix}.npz" is used if it exists, otherwise "{obj}_{suffix}.wmap" or the deformerWeights file
+    "{obj}_{suffix}.json". .npz files are read ahead on maxWorkers background threads. remap is an influence remap
+    table, or a JSON file holding it (see rigsys.lib.weightOps).
+    """
     if len(objects) == 0:
         objects = cmds.ls(sl=1)
         if len(objects) == 0:
             cmds.error("No Objects provided or selected.")
     if path == "":
         cmds.error("Path is empty")
-    
+
+    jobs = []
     for obj in objects:
-        cmds.deformerWeights(f"{obj}_{suffix}.json", 
-                             im=True,
-                             p=path,
-                             deformer=f"{obj}_{suffix}",
-                             at=["maintainMaxInfluences", "maxInfluences"],
-                             method="index",
-                             format="JSON",
-                             dv=1.0
-                             )
+        fileName = skinWeights.findWeightFile(path, obj, suffix)
+        if fileName is None:
+            cmds.error(f"No weight file found for {obj}_{suffix} in {path}")
+        jobs.append((f"{obj}_{suffix}", fileName))
+    skinWeights.importWeightsBatch(jobs, maxWorkers, remap=remap)
 
 def createSCLS(object:str = "", joints:list = [], suffix:str = "scls", maxInfluences=4):
     if object == "":
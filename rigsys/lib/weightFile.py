@@ -0,0 +1,510 @@
+"""Skin weight data and file formats.
+
+This module does not need Maya. It holds weights as a dense NumPy matrix with one row per vertex and one column per
+influence, and reads and writes them as compressed .npz files. Influences are always stored by name, so weights can be
+loaded onto a skinCluster whose influences are in a different order.
+
+Two payload layouts are supported in .npz files:
+    - dense: The full weight matrix.
+    - sparse: The non-zero weights in CSR layout (indptr, indices, values), optionally limited to the top
+      maxInfluences weights per vertex and quantized to float16 or uint16. Sparse weights are renormalized on load
+      unless the header's normalizeWeights is 0.
+
+Incremental saves write patch files next to a baseline .npz file: "body_scls.npz" is followed by
+"body_scls.patch001.npz", "body_scls.patch002.npz" and so on. A patch ("patch" format) holds only the vertex rows that
+changed since the baseline and the previous patches. readChain() applies the chain on load, squash() folds it back
+into the baseline.
+
+For very large meshes, .wmap files use a third, uncompressed layout ("mapped") that can be opened with numpy.memmap:
+a magic string, the header length as a little-endian uint64 and the JSON header, followed by two (vertexCount, slots)
+arrays holding the influence indices and weights of the largest `slots` weights of every vertex. Every vertex takes
+the same number of bytes, so any vertex range can be read or written without touching the rest of the file.
+
+Every file carries a JSON header with at least:
+    - version: The file format version.
+    - format: The payload layout ("dense" or "sparse").
+    - influences: The influence names, in column order.
+    - vertexCount: The number of vertices (rows).
+    - digest: A hash of the influences and weights (.npz and patch files only, see computeDigest).
+.npz files may also hold the world space point positions the weights were saved on, for weightTransfer.
+rigsys.lib.skinWeights adds the skinCluster's maxInfluences, maintainMaxInfluences and normalizeWeights, and a
+topologyHash of the deformed geometry.
+
+The Maya side lives in rigsys.lib.skinWeights.
+
+Example usage:
+
+import rigsys.lib.weightFile as weightFile
+
+data = weightFile.WeightData(weights, ["L_Arm_Shoulder", "L_Arm_Elbow"], {"maxInfluences": 4})
+weightFile.write("path/to/weights/body_scls.npz", data)
+data = weightFile.read("path/to/weights/body_scls.npz")
+"""
+
+import glob
+import hashlib
+import json
+import os
+
+import numpy as np
+
+FORMAT_VERSION = 1
+EXTENSION = ".npz"
+MAPPED_EXTENSION = ".wmap"
+
+DENSE = "dense"
+SPARSE = "sparse"
+MAPPED = "mapped"
+PATCH = "patch"
+_MAPPED_MAGIC = b"RSWMAP01"
+_MAPPED_ALIGNMENT = 64
+QUANTIZE_TYPES = (None, "float16", "uint16")
+_UINT16_SCALE = np.iinfo(np.uint16).max
+
+
+class WeightData:
+    """Dense skin weights, stored by influence name."""
+
+    def __init__(self, weights, influences: list, header: dict = None, positions=None) -> None:
+        """Initialize the weight data.
+
+        Args:
+            weights (numpy.ndarray): Weight matrix of shape (vertexCount, len(influences)).
+            influences (list): Influence names, one per column.
+            header (dict, optional): Extra header values, such as maxInfluences or normalizeWeights. Defaults to None.
+            positions (numpy.ndarray, optional): World space point positions of shape (vertexCount, 3), used to
+                transfer the weights to other topology. Defaults to None.
+        """
+        weights = np.asarray(weights)
+        if weights.ndim != 2 or weights.shape[1] != len(influences):
+            raise ValueError(f"Weights of shape {weights.shape} do not match {len(influences)} influences.")
+        if positions is not None and np.shape(positions) != (weights.shape[0], 3):
+            raise ValueError(f"Positions of shape {np.shape(positions)} do not match {weights.shape[0]} points.")
+
+        self.weights = weights
+        self.influences = list(influences)
+        self.header = dict(header or {})
+        self.positions = positions
+
+    @property
+    def vertexCount(self) -> int:
+        """Return the number of vertices."""
+        return self.weights.shape[0]
+
+    @property
+    def influenceCount(self) -> int:
+        """Return the number of influences."""
+        return self.weights.shape[1]
+
+    def reorder(self, influences: list, allowMissing: bool = False):
+        """Return a copy of the weight data with its columns in the given influence order.
+
+        Influences in the given list but not in the data get zero weights. Influences in the data but not in the given
+        list are an error unless allowMissing is True, in which case their weights are dropped.
+        """
+        missing = [influence for influence in self.influences if influence not in influences]
+        if missing and not allowMissing:
+            raise ValueError(f"Influences missing from the target order: {missing}")
+
+        columns = {influence: index for index, influence in enumerate(self.influences)}
+        weights = np.zeros((self.vertexCount, len(influences)), dtype=self.weights.dtype)
+        for index, influence in enumerate(influences):
+            if influence in columns:
+                weights[:, index] = self.weights[:, columns[influence]]
+
+        return WeightData(weights, influences, self.header, self.positions)
+
+
+def buildHeader(data: WeightData, fileFormat: str) -> dict:
+    """Return the header stored alongside the payload of a weight file."""
+    header = dict(data.header)
+    header.update({
+        "version": FORMAT_VERSION,
+        "format": fileFormat,
+        "influences": data.influences,
+        "vertexCount": data.vertexCount,
+    })
+    return header
+
+
+def computeDigest(data: WeightData) -> str:
+    """Return a hash of the influence names and the float32 weights of the weight data."""
+    digest = hashlib.sha1()
+    digest.update(json.dumps(data.influences).encode("utf-8"))
+    digest.update(np.ascontiguousarray(data.weights, dtype=np.float32).tobytes())
+    return digest.hexdigest()
+
+
+def getFileDigest(fileName: str, hashContents: bool = True) -> str:
+    """Return the digest of the weights a file holds.
+
+    For .npz files this is the header digest of the last patch, or of the baseline if it has no patches. Other files,
+    and files written before digests were added, are hashed byte for byte, unless hashContents is False, in which case
+    None is returned for them.
+    """
+    files = [fileName]
+    if fileName.endswith(EXTENSION):
+        files += getPatchFiles(fileName)
+        digest = readHeader(files[-1]).get("digest")
+        if digest:
+            return digest
+
+    if not hashContents:
+        return None
+
+    digest = hashlib.sha1()
+    for name in files:
+        with open(name, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def toSparse(weights, maxInfluences: int = None, threshold: float = 0.0) -> tuple:
+    """Convert a dense weight matrix to CSR arrays.
+
+    Args:
+        weights (numpy.ndarray): Weight matrix of shape (vertexCount, influenceCount).
+        maxInfluences (int, optional): Keep only the largest maxInfluences weights per vertex. Defaults to None.
+        threshold (float, optional): Drop weights at or below this value. Defaults to 0.0.
+
+    Returns:
+        tuple: (indptr, indices, values)
+    """
+    weights = np.asarray(weights)
+    if maxInfluences is not None and 0 < maxInfluences < weights.shape[1]:
+        weights = weights.copy()
+        smallest = np.argpartition(-weights, maxInfluences - 1, axis=1)[:, maxInfluences:]
+        np.put_along_axis(weights, smallest, 0.0, axis=1)
+
+    mask = weights > threshold
+    indptr = np.zeros(weights.shape[0] + 1, dtype=np.int64)
+    np.cumsum(mask.sum(axis=1), out=indptr[1:])
+    rows, indices = np.nonzero(mask)
+    indexType = np.uint16 if weights.shape[1] <= _UINT16_SCALE else np.uint32
+    return indptr, indices.astype(indexType), weights[rows, indices]
+
+
+def fromSparse(indptr, indices, values, shape: tuple):
+    """Convert CSR arrays back to a dense weight matrix."""
+    weights = np.zeros(shape, dtype=np.float64)
+    rows = np.repeat(np.arange(shape[0]), np.diff(indptr))
+    weights[rows, indices] = values
+    return weights
+
+
+def quantize(values, quantizeType: str = None):
+    """Quantize weight values to float16 or uint16. None stores them as float32."""
+    if quantizeType not in QUANTIZE_TYPES:
+        raise ValueError(f"Unknown quantize type {quantizeType}, expected one of {QUANTIZE_TYPES}")
+
+    if quantizeType == "uint16":
+        return np.round(np.clip(values, 0.0, 1.0) * _UINT16_SCALE).astype(np.uint16)
+    if quantizeType == "float16":
+        return values.astype(np.float16)
+    return values.astype(np.float32)
+
+
+def dequantize(values, quantizeType: str = None):
+    """Reverse quantize()."""
+    if quantizeType == "uint16":
+        return values.astype(np.float64) / _UINT16_SCALE
+    return values.astype(np.float64)
+
+
+def normalize(weights):
+    """Scale every row with a non-zero sum so it sums to 1, in place. Returns the weights."""
+    sums = weights.sum(axis=1, keepdims=True)
+    np.divide(weights, sums, out=weights, where=sums > 0.0)
+    return weights
+
+
+def write(fileName: str, data: WeightData, sparse: bool = True, maxInfluences: int = None,
+          quantizeType: str = None) -> None:
+    """Write weight data to a compressed .npz file.
+
+    Args:
+        fileName (str): The file to write.
+        data (WeightData): The weights.
+        sparse (bool, optional): Write the sparse layout. Defaults to True.
+        maxInfluences (int, optional): Sparse only, keep the largest maxInfluences weights per vertex. Defaults to
+            None, which keeps every non-zero weight.
+        quantizeType (str, optional): Sparse only, "float16" or "uint16". Defaults to None, which writes float32.
+    """
+    arrays = {}
+    if data.positions is not None:
+        arrays["positions"] = np.asarray(data.positions, dtype=np.float32)
+
+    if not sparse:
+        header = buildHeader(data, DENSE)
+        header["digest"] = computeDigest(data)
+        np.savez_compressed(
+            fileName,
+            header=np.array(json.dumps(header)),
+            weights=data.weights.astype(np.float32),
+            **arrays
+        )
+        return
+
+    indptr, indices, values = toSparse(data.weights, maxInfluences)
+    header = buildHeader(data, SPARSE)
+    header["quantize"] = quantizeType
+    header["sparseMaxInfluences"] = maxInfluences
+    header["digest"] = computeDigest(data)
+    np.savez_compressed(
+        fileName,
+        header=np.array(json.dumps(header)),
+        indptr=indptr,
+        indices=indices,
+        values=quantize(values, quantizeType),
+        **arrays
+    )
+
+
+def readHeader(fileName: str) -> dict:
+    """Read only the header of a weight file."""
+    if fileName.endswith(MAPPED_EXTENSION):
+        return _readMappedHeader(fileName)[0]
+
+    with np.load(fileName, allow_pickle=False) as payload:
+        return json.loads(str(payload["header"]))
+
+
+def read(fileName: str) -> WeightData:
+    """Read a weight file written by write()."""
+    with np.load(fileName, allow_pickle=False) as payload:
+        header = json.loads(str(payload["header"]))
+        influences = header.pop("influences")
+
+        if header["format"] == SPARSE:
+            weights = fromSparse(
+                payload["indptr"],
+                payload["indices"],
+                dequantize(payload["values"], header.get("quantize")),
+                (header["vertexCount"], len(influences)),
+            )
+            if header.get("normalizeWeights", 1):
+                normalize(weights)
+        else:
+            weights = payload["weights"].astype(np.float64)
+
+        positions = payload["positions"].astype(np.float64) if "positions" in payload.files else None
+
+    return WeightData(weights, influences, header, positions)
+
+
+def getPatchFiles(fileName: str) -> list:
+    """Return the patch files of a baseline weight file, in the order they apply."""
+    root, extension = os.path.splitext(fileName)
+    return sorted(glob.glob(f"{glob.escape(root)}.patch[0-9][0-9][0-9]{extension}"))
+
+
+def getNextPatchFile(fileName: str) -> str:
+    """Return the file name of the next patch of a baseline weight file."""
+    root, extension = os.path.splitext(fileName)
+    return f"{root}.patch{len(getPatchFiles(fileName)) + 1:03d}{extension}"
+
+
+def removePatches(fileName: str) -> None:
+    """Delete the patch files of a baseline weight file."""
+    for patchFile in getPatchFiles(fileName):
+        os.remove(patchFile)
+
+
+def asStored(weights, header: dict):
+    """Return weights as read() returns them from a file written with the layout of header.
+
+    Applies the same influence cap, quantization and renormalization as the file, so weights that have not changed
+    since the file was written match its rows exactly.
+    """
+    if header.get("format") != SPARSE:
+        return weights.astype(np.float32).astype(np.float64)
+
+    quantizeType = header.get("quantize")
+    indptr, indices, values = toSparse(weights, header.get("sparseMaxInfluences"))
+    stored = fromSparse(indptr, indices, dequantize(quantize(values, quantizeType), quantizeType), weights.shape)
+    if header.get("normalizeWeights", 1):
+        normalize(stored)
+    return stored
+
+
+def diff(base: WeightData, current: WeightData, tolerance: float = 1e-5):
+    """Return the indices of the rows of current that differ from base by more than tolerance.
+
+    Both are compared in the union of their influences, so adding or removing an influence only marks the rows whose
+    weights on it are non-zero. A row only differs if it also differs once stored in the layout of base (see
+    asStored), so the loss of a quantized or influence capped baseline does not mark unchanged rows.
+    """
+    if base.vertexCount != current.vertexCount:
+        raise ValueError(f"Cannot diff {current.vertexCount} points against {base.vertexCount}.")
+
+    influences = current.influences + [influence for influence in base.influences if influence not in current.influences]
+    baseWeights = base.reorder(influences, allowMissing=True).weights
+    currentWeights = current.reorder(influences, allowMissing=True).weights
+    storedWeights = WeightData(asStored(current.weights, base.header), current.influences).reorder(
+        influences, allowMissing=True).weights
+
+    changed = np.any(np.abs(baseWeights - currentWeights) > tolerance, axis=1)
+    changed &= np.any(np.abs(baseWeights - storedWeights) > tolerance, axis=1)
+    return np.flatnonzero(changed)
+
+
+def writePatch(fileName: str, base: WeightData, current: WeightData, tolerance: float = 1e-5) -> int:
+    """Write the rows of current that differ from base to a patch file. Returns the number of rows written."""
+    rows = diff(base, current, tolerance)
+    header = buildHeader(current, PATCH)
+    header["rowCount"] = len(rows)
+    header["digest"] = computeDigest(current)
+    np.savez_compressed(
+        fileName,
+        header=np.array(json.dumps(header)),
+        rows=rows,
+        weights=current.weights[rows].astype(np.float32),
+    )
+    return len(rows)
+
+
+def applyPatch(base: WeightData, fileName: str) -> WeightData:
+    """Return base with the rows of a patch file applied.
+
+    The result uses the patch's influences, followed by any base influences the patch does not have.
+    """
+    with np.load(fileName, allow_pickle=False) as payload:
+        header = json.loads(str(payload["header"]))
+        rows = payload["rows"]
+        weights = payload["weights"].astype(np.float64)
+
+    patchInfluences = header.pop("influences")
+    influences = patchInfluences + [influence for influence in base.influences if influence not in patchInfluences]
+    result = base.reorder(influences)
+    result.weights[rows] = 0.0
+    result.weights[rows, :len(patchInfluences)] = weights
+
+    header.pop("rowCount")
+    result.header = dict(base.header)
+    result.header.update(header)
+    result.header["format"] = base.header["format"]
+    return result
+
+
+def readChain(fileName: str) -> WeightData:
+    """Read a baseline weight file and apply its patches."""
+    data = read(fileName)
+    for patchFile in getPatchFiles(fileName):
+        data = applyPatch(data, patchFile)
+    return data
+
+
+def squash(fileName: str, **kwargs) -> None:
+    """Fold the patches of a baseline weight file into a new baseline and delete them.
+
+    Keyword arguments are passed to write().
+    """
+    patchFiles = getPatchFiles(fileName)
+    if not patchFiles:
+        return
+
+    write(fileName, readChain(fileName), **kwargs)
+    for patchFile in patchFiles:
+        os.remove(patchFile)
+
+
+def toSlots(weights, slots: int) -> tuple:
+    """Return the influence indices and weights of the largest `slots` weights of every row.
+
+    Rows with fewer non-zero weights are padded with index 0 and weight 0.
+    """
+    weights = np.asarray(weights)
+    if slots >= weights.shape[1]:
+        indices = np.broadcast_to(np.arange(weights.shape[1]), weights.shape)
+        padding = slots - weights.shape[1]
+        indices = np.pad(indices, ((0, 0), (0, padding)))
+        values = np.pad(weights, ((0, 0), (0, padding)))
+        return indices, values
+
+    indices = np.argpartition(-weights, slots - 1, axis=1)[:, :slots]
+    return indices, np.take_along_axis(weights, indices, axis=1)
+
+
+def fromSlots(indices, values, influenceCount: int):
+    """Convert slot arrays back to a dense weight matrix."""
+    weights = np.zeros((indices.shape[0], influenceCount), dtype=np.float64)
+    rows = np.repeat(np.arange(indices.shape[0]), indices.shape[1])
+    # Padding slots all point at index 0 with weight 0, so accumulate instead of assigning
+    np.add.at(weights, (rows, indices.ravel()), values.ravel())
+    return weights
+
+
+def createMapped(fileName: str, influences: list, vertexCount: int, slots: int, header: dict = None) -> tuple:
+    """Create a .wmap file and return its (indices, values) arrays as writable memory maps.
+
+    Fill the arrays in vertex chunks, for example with toSlots(), then flush() and delete them to close the file.
+    """
+    header = buildHeader(WeightData(np.empty((0, len(influences))), influences, header), MAPPED)
+    header.pop("digest", None)
+    header["vertexCount"] = vertexCount
+    header["slots"] = slots
+    header["indexType"] = "uint16" if len(influences) <= _UINT16_SCALE else "uint32"
+    header["valueType"] = "float32"
+
+    headerBytes = json.dumps(header).encode("utf-8")
+    headerSize = len(_MAPPED_MAGIC) + 8 + len(headerBytes)
+    headerBytes += b" " * (-headerSize % _MAPPED_ALIGNMENT)
+    with open(fileName, "wb") as file:
+        file.write(_MAPPED_MAGIC)
+        file.write(np.uint64(len(headerBytes)).tobytes())
+        file.write(headerBytes)
+
+    return _mapArrays(fileName, header, len(_MAPPED_MAGIC) + 8 + len(headerBytes), "r+")
+
+
+def openMapped(fileName: str) -> tuple:
+    """Open a .wmap file read-only. Returns (header, indices, values), with the arrays memory mapped."""
+    header, dataOffset = _readMappedHeader(fileName)
+    indices, values = _mapArrays(fileName, header, dataOffset, "r")
+    return header, indices, values
+
+
+def readMappedRange(fileName: str, start: int = 0, stop: int = None) -> WeightData:
+    """Read the weights of vertices start to stop (exclusive) from a .wmap file.
+
+    Only the requested rows are read from disk. The header's vertexStart records the first vertex of the range.
+    """
+    header, indices, values = openMapped(fileName)
+    influences = header.pop("influences")
+    stop = header["vertexCount"] if stop is None else min(stop, header["vertexCount"])
+
+    weights = fromSlots(np.asarray(indices[start:stop]), np.asarray(values[start:stop]), len(influences))
+    if header.get("normalizeWeights", 1):
+        normalize(weights)
+
+    header["vertexStart"] = start
+    return WeightData(weights, influences, header)
+
+
+def iterMappedChunks(fileName: str, chunkSize: int, start: int = 0, stop: int = None):
+    """Yield WeightData for consecutive vertex chunks of a .wmap file, so at most chunkSize vertices are in memory."""
+    header = readHeader(fileName)
+    stop = header["vertexCount"] if stop is None else min(stop, header["vertexCount"])
+    for chunkStart in range(start, stop, chunkSize):
+        yield readMappedRange(fileName, chunkStart, min(chunkStart + chunkSize, stop))
+
+
+def _readMappedHeader(fileName):
+    """Return the header of a .wmap file and the byte offset of its arrays."""
+    with open(fileName, "rb") as file:
+        if file.read(len(_MAPPED_MAGIC)) != _MAPPED_MAGIC:
+            raise ValueError(f"{fileName} is not a mapped weight file.")
+        headerLength = int(np.frombuffer(file.read(8), dtype=np.uint64)[0])
+        header = json.loads(file.read(headerLength).decode("utf-8"))
+    return header, len(_MAPPED_MAGIC) + 8 + headerLength
+
+
+def _mapArrays(fileName, header, dataOffset, mode):
+    """Memory map the index and value arrays of a .wmap file."""
+    shape = (header["vertexCount"], header["slots"])
+    indexType = np.dtype(header["indexType"])
+    indices = np.memmap(fileName, dtype=indexType, mode=mode, offset=dataOffset, shape=shape)
+    values = np.memmap(fileName, dtype=np.dtype(header["valueType"]), mode=mode,
+                       offset=dataOffset + indexType.itemsize * shape[0] * shape[1], shape=shape)
+    return indices, values
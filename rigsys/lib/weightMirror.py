@@ -0,0 +1,147 @@
+"""Mirror skin weights across a symmetry plane.
+
+A symmetry map gives, for every point, the index of the point on the other side of the mirror plane. It is computed
+once per topology and cached on disk, keyed by the topology hash from skinWeights.getTopologyHash, the axis and the
+matching tolerance. Mirroring is then a row permutation of the weight matrix by the symmetry map, plus a column
+permutation that swaps each L_ influence with its R_ counterpart (see stringUtils.mirrorString).
+
+Example usage:
+
+import rigsys.lib.weightMirror as weightMirror
+
+# Copy the weights of the +X side onto the -X side
+weightMirror.mirrorSkinWeights("body_scls", axis="x", direction="+")
+"""
+
+import logging
+import os
+
+import numpy as np
+
+import rigsys.lib.skinWeights as skinWeights
+import rigsys.lib.weightFile as weightFile
+import rigsys.lib.weightTransfer as weightTransfer
+import rigsys.utils.stringUtils as stringUtils
+
+import maya.cmds as cmds
+
+logger = logging.getLogger(__name__)
+
+AXES = {"x": 0, "y": 1, "z": 2}
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".rigsys", "symmetry")
+
+# (topologyHash, axis, tolerance): symmetry map, for maps already loaded this session
+_symmetryMaps = {}
+
+
+def computeSymmetryMap(positions, axis: str = "x", tolerance: float = 1e-3):
+    """Return the index of the mirrored point of every point.
+
+    Points without a mirrored point within tolerance map to themselves.
+
+    Args:
+        positions (numpy.ndarray): Point positions, shape (pointCount, 3).
+        axis (str, optional): The axis normal to the mirror plane. Defaults to "x".
+        tolerance (float, optional): Maximum distance between a mirrored point and its match. Defaults to 1e-3.
+
+    Returns:
+        numpy.ndarray: Integer array of shape (pointCount,).
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    reflected = positions.copy()
+    reflected[:, AXES[axis]] *= -1.0
+
+    distances, indices = weightTransfer.PointGrid(positions).query(reflected, 1)
+    symmetryMap = indices[:, 0]
+
+    unmatched = distances[:, 0] > tolerance
+    if unmatched.any():
+        logger.warning(f"{int(unmatched.sum())} points have no mirrored point within {tolerance}; they are not mirrored.")
+        symmetryMap[unmatched] = np.flatnonzero(unmatched)
+
+    return symmetryMap
+
+
+def getSymmetryMap(skinCluster: str, axis: str = "x", tolerance: float = 1e-3, cacheDir: str = CACHE_DIR,
+                   data: weightFile.WeightData = None):
+    """Return the symmetry map of the geometry deformed by a skinCluster, from the cache if possible.
+
+    Args:
+        skinCluster (str): The skinCluster.
+        axis (str, optional): The axis normal to the mirror plane. Defaults to "x".
+        tolerance (float, optional): Maximum distance between a mirrored point and its match. Defaults to 1e-3.
+        cacheDir (str, optional): Directory of cached maps, or None to only cache in memory. Defaults to CACHE_DIR.
+        data (WeightData, optional): The skinCluster's weight data, if already read. Defaults to None.
+    """
+    if data is None:
+        data = skinWeights.getWeightData(skinCluster)
+
+    key = (data.header["topologyHash"], axis, float(tolerance))
+    if key in _symmetryMaps:
+        return _symmetryMaps[key]
+
+    fileName = os.path.join(cacheDir, f"{key[0]}_{axis}_{key[2]!r}.npy") if cacheDir else None
+    if fileName and os.path.exists(fileName):
+        symmetryMap = np.load(fileName)
+    else:
+        symmetryMap = computeSymmetryMap(data.positions, axis, tolerance)
+        if fileName:
+            os.makedirs(cacheDir, exist_ok=True)
+            np.save(fileName, symmetryMap)
+
+    _symmetryMaps[key] = symmetryMap
+    return symmetryMap
+
+
+def getMirroredColumns(influences: list) -> np.ndarray:
+    """Return, for every influence, the column of its mirrored influence.
+
+    Influences without an L_/R_ prefix, or whose mirrored influence is not in the list, map to themselves.
+    """
+    columns = {influence: index for index, influence in enumerate(influences)}
+    mirrored = []
+    for index, influence in enumerate(influences):
+        mirrorName = stringUtils.mirrorString(influence)
+        if mirrorName != influence and mirrorName not in columns:
+            logger.warning(f"Mirrored influence {mirrorName} of {influence} is not in the skinCluster.")
+        mirrored.append(columns.get(mirrorName, index))
+    return np.array(mirrored, dtype=np.int64)
+
+
+def mirrorWeightData(data: weightFile.WeightData, symmetryMap, axis: str = "x", direction: str = "+",
+                     tolerance: float = 1e-3) -> weightFile.WeightData:
+    """Return a copy of the weight data with one side mirrored onto the other.
+
+    Args:
+        data (WeightData): The weight data, with positions.
+        symmetryMap (numpy.ndarray): As returned by computeSymmetryMap.
+        axis (str, optional): The axis normal to the mirror plane. Defaults to "x".
+        direction (str, optional): "+" copies the positive side onto the negative side, "-" the other way around.
+            Defaults to "+".
+        tolerance (float, optional): Points this close to the mirror plane get the average of both sides. Defaults
+            to 1e-3.
+    """
+    mirrored = data.weights[symmetryMap][:, getMirroredColumns(data.influences)]
+
+    side = data.positions[:, AXES[axis]] * (1.0 if direction == "+" else -1.0)
+    target = side < -tolerance
+    center = np.abs(side) <= tolerance
+
+    weights = data.weights.copy()
+    weights[target] = mirrored[target]
+    weights[center] = 0.5 * (data.weights[center] + mirrored[center])
+    return weightFile.WeightData(weights, data.influences, data.header, data.positions)
+
+
+def mirrorSkinWeights(skinCluster: str, axis: str = "x", direction: str = "+", tolerance: float = 1e-3,
+                      cacheDir: str = CACHE_DIR) -> None:
+    """Mirror the weights of a skinCluster from one side of the mirror plane to the other.
+
+    See mirrorWeightData and getSymmetryMap for the arguments.
+    """
+    if axis not in AXES or direction not in ("+", "-"):
+        cmds.error(f"Invalid mirror axis {axis} or direction {direction}")
+
+    data = skinWeights.getWeightData(skinCluster)
+    symmetryMap = getSymmetryMap(skinCluster, axis, tolerance, cacheDir, data)
+    skinWeights.setWeightData(skinCluster, mirrorWeightData(data, symmetryMap, axis, direction, tolerance))
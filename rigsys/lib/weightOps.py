@@ -0,0 +1,176 @@
+"""Operations on in-memory skin weights.
+
+These work on rigsys.lib.weightFile.WeightData and do not need Maya. Each one runs over the whole weight matrix at
+once and returns a new WeightData.
+
+Cleanup operations (prune, capInfluences, normalize, or all three with cleanWeights) take an optional list of locked
+influences, whose weights are never changed; only the unlocked influences are pruned, capped and rescaled.
+
+An influence remap table maps old influence names to new ones, for weights saved on an older version of a rig:
+    - {"L_Arm_Upper": "L_Arm_Shoulder"} renames an influence.
+    - {"L_Arm_Twist1": "L_Arm_Elbow"}, where L_Arm_Elbow is also an influence, merges the two by summing their weights.
+    - {"L_Arm_Helper": None} drops an influence; its weight is redistributed over the vertex's other influences in
+      proportion to their weights.
+Tables can also be stored as JSON files with the same layout.
+
+Example usage:
+
+import rigsys.lib.weightOps as weightOps
+
+data = weightOps.remapInfluences(data, {"L_Arm_Upper": "L_Arm_Shoulder", "L_Arm_Helper": None})
+data = weightOps.cleanWeights(data, threshold=0.001, maxInfluences=4, locked=["M_Root"])
+"""
+
+import json
+import logging
+
+import numpy as np
+
+import rigsys.lib.weightFile as weightFile
+
+logger = logging.getLogger(__name__)
+
+
+def loadRemapTable(remap) -> dict:
+    """Return a remap table, loading it from a JSON file if remap is a file name."""
+    if isinstance(remap, str):
+        with open(remap, "r") as file:
+            return json.load(file)
+    return dict(remap or {})
+
+
+def remapNames(influences: list, remap) -> list:
+    """Return the influence names after remapping, in order, without duplicates or dropped influences."""
+    remap = loadRemapTable(remap)
+    names = []
+    for influence in influences:
+        name = remap.get(influence, influence)
+        if name is not None and name not in names:
+            names.append(name)
+    return names
+
+
+def getRemapMatrix(influences: list, remap) -> tuple:
+    """Return the matrix that maps weight columns through a remap table.
+
+    Returns:
+        tuple: (matrix, newInfluences), where matrix has shape (len(influences), len(newInfluences)) and is 1 where an
+            old influence maps to a new one.
+    """
+    remap = loadRemapTable(remap)
+    newInfluences = remapNames(influences, remap)
+    columns = {influence: index for index, influence in enumerate(newInfluences)}
+
+    matrix = np.zeros((len(influences), len(newInfluences)), dtype=np.float64)
+    for row, influence in enumerate(influences):
+        name = remap.get(influence, influence)
+        if name is not None:
+            matrix[row, columns[name]] = 1.0
+    return matrix, newInfluences
+
+
+def remapInfluences(data: weightFile.WeightData, remap) -> weightFile.WeightData:
+    """Return a copy of the weight data with its influences renamed, merged and dropped by a remap table.
+
+    The whole table is applied as a single matrix product over the weight matrix. Rows that lost weight to dropped
+    influences are renormalized.
+
+    Args:
+        data (WeightData): The weight data.
+        remap (dict | str): The remap table, or a JSON file holding it.
+    """
+    remap = loadRemapTable(remap)
+    if not remap:
+        return data
+
+    matrix, influences = getRemapMatrix(data.influences, remap)
+    weights = data.weights @ matrix
+
+    dropped = [index for index, influence in enumerate(data.influences) if remap.get(influence, influence) is None]
+    if dropped:
+        lost = data.weights[:, dropped].sum(axis=1) > 0.0
+        remaining = weights[lost]
+        sums = remaining.sum(axis=1, keepdims=True)
+        totals = data.weights[lost].sum(axis=1, keepdims=True)
+        orphaned = int((sums <= 0.0).sum())
+        if orphaned:
+            logger.warning(f"{orphaned} points only had weights on dropped influences; they are left unweighted.")
+        weights[lost] = np.divide(remaining * totals, sums, out=np.zeros_like(remaining), where=sums > 0.0)
+
+    return weightFile.WeightData(weights, influences, data.header, data.positions)
+
+
+def _getLockedMask(data: weightFile.WeightData, locked) -> np.ndarray:
+    """Return a boolean mask of the locked columns."""
+    locked = set(locked or [])
+    return np.array([influence in locked for influence in data.influences], dtype=bool)
+
+
+def _copy(data: weightFile.WeightData, weights) -> weightFile.WeightData:
+    """Return weight data with new weights and the same influences, header and positions."""
+    return weightFile.WeightData(weights, data.influences, data.header, data.positions)
+
+
+def prune(data: weightFile.WeightData, threshold: float = 0.001, locked: list = None) -> weightFile.WeightData:
+    """Zero every unlocked weight below threshold. Does not renormalize."""
+    weights = data.weights.copy()
+    unlocked = ~_getLockedMask(data, locked)
+    block = weights[:, unlocked]
+    block[block < threshold] = 0.0
+    weights[:, unlocked] = block
+    return _copy(data, weights)
+
+
+def capInfluences(data: weightFile.WeightData, maxInfluences: int = 4, locked: list = None) -> weightFile.WeightData:
+    """Keep only the largest maxInfluences weights of every point. Does not renormalize.
+
+    Locked weights are always kept and count towards maxInfluences.
+    """
+    if maxInfluences >= data.influenceCount:
+        return data
+
+    lockedMask = _getLockedMask(data, locked)
+    # Rank locked weights above every unlocked one, so they are never dropped
+    ranking = np.where(lockedMask, data.weights + 2.0, data.weights)
+    dropped = np.argpartition(-ranking, maxInfluences - 1, axis=1)[:, maxInfluences:]
+
+    weights = data.weights.copy()
+    keep = np.take_along_axis(np.broadcast_to(lockedMask, weights.shape), dropped, axis=1)
+    np.put_along_axis(weights, dropped, np.where(keep, np.take_along_axis(weights, dropped, axis=1), 0.0), axis=1)
+    return _copy(data, weights)
+
+
+def normalize(data: weightFile.WeightData, locked: list = None) -> weightFile.WeightData:
+    """Scale the unlocked weights of every point so all its weights sum to 1.
+
+    Points whose locked weights already sum to 1 or more, or that have no unlocked weights, are left unchanged.
+    """
+    lockedMask = _getLockedMask(data, locked)
+    weights = data.weights.copy()
+
+    lockedSums = weights[:, lockedMask].sum(axis=1, keepdims=True)
+    unlockedSums = weights[:, ~lockedMask].sum(axis=1, keepdims=True)
+    scale = np.divide(1.0 - lockedSums, unlockedSums, out=np.ones_like(unlockedSums),
+                      where=(unlockedSums > 0.0) & (lockedSums < 1.0))
+    weights[:, ~lockedMask] *= scale
+    return _copy(data, weights)
+
+
+def cleanWeights(data: weightFile.WeightData, threshold: float = None, maxInfluences: int = None,
+                 normalizeWeights: bool = True, locked: list = None) -> weightFile.WeightData:
+    """Prune, cap and normalize weight data in one go.
+
+    Args:
+        data (WeightData): The weight data.
+        threshold (float, optional): Prune unlocked weights below this value. Defaults to None, no pruning.
+        maxInfluences (int, optional): Keep only this many influences per point. Defaults to None, no cap.
+        normalizeWeights (bool, optional): Normalize afterwards. Defaults to True.
+        locked (list, optional): Influences whose weights are never changed. Defaults to None.
+    """
+    if threshold is not None:
+        data = prune(data, threshold, locked)
+    if maxInfluences is not None:
+        data = capInfluences(data, maxInfluences, locked)
+    if normalizeWeights:
+        data = normalize(data, locked)
+    return data
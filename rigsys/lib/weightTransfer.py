@@ -0,0 +1,187 @@
+"""Topology independent skin weight transfer.
+
+Weights are transferred by position: every target point blends the weights of its k nearest source points, weighted by
+inverse distance. Target points that coincide with a source point copy its weights exactly. The nearest points are
+found with a uniform grid, so the transfer runs vectorized in NumPy and does not need Maya or SciPy.
+
+Example usage:
+
+import rigsys.lib.weightTransfer as weightTransfer
+
+weights = weightTransfer.transferWeights(sourcePositions, sourceWeights, targetPositions, k=4)
+"""
+
+import numpy as np
+
+# Average number of source points per grid cell
+_POINTS_PER_CELL = 4.0
+# Target points processed at once, to bound the size of the candidate and blend arrays
+_CHUNK_SIZE = 4096
+# Upper bound on (target, candidate) entries in one padded candidate matrix of the grid search
+_CANDIDATE_BUDGET = 2 ** 21
+# Upper bound on (target, source) distance pairs computed at once by the brute force fallback
+_BRUTE_FORCE_PAIRS = 2 ** 22
+
+
+class PointGrid:
+    """Uniform grid over a point cloud, for k-nearest queries."""
+
+    def __init__(self, points) -> None:
+        """Bucket the points into grid cells."""
+        self.points = np.asarray(points, dtype=np.float64)
+        self.origin = self.points.min(axis=0)
+        extent = np.maximum(self.points.max(axis=0) - self.origin, 1e-9)
+
+        volume = float(np.prod(extent))
+        self.cellSize = max((volume * _POINTS_PER_CELL / len(self.points)) ** (1.0 / 3.0), float(extent.max()) / 1024)
+        self.resolution = np.floor(extent / self.cellSize).astype(np.int64) + 1
+
+        cellIds = self._cellIds(self._cells(self.points))
+        self.order = np.argsort(cellIds, kind="stable")
+        self.sortedCellIds = cellIds[self.order]
+
+    def _cells(self, points):
+        """Return the integer cell coordinates of points, clamped to the grid."""
+        cells = np.floor((points - self.origin) / self.cellSize).astype(np.int64)
+        return np.clip(cells, 0, self.resolution - 1)
+
+    def _cellIds(self, cells):
+        """Return flat cell ids for integer cell coordinates."""
+        return (cells[:, 0] * self.resolution[1] + cells[:, 1]) * self.resolution[2] + cells[:, 2]
+
+    def query(self, points, k: int = 4) -> tuple:
+        """Return the distances and indices of the k nearest grid points to each point.
+
+        The 27 cells around each point are searched first. Points whose k-th neighbor is not guaranteed to be within
+        those cells fall back to a brute force search.
+
+        Returns:
+            tuple: (distances, indices), both of shape (len(points), k), sorted by distance.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        k = min(k, len(self.points))
+
+        distances = np.empty((len(points), k))
+        indices = np.empty((len(points), k), dtype=np.int64)
+        for start in range(0, len(points), _CHUNK_SIZE):
+            stop = start + _CHUNK_SIZE
+            distances[start:stop], indices[start:stop] = self._queryCells(points[start:stop], k)
+
+        # Points beyond one cell size may be closer than the k-th neighbor found in the surrounding cells
+        uncertain = np.flatnonzero(distances[:, -1] > self.cellSize)
+        bruteChunkSize = max(1, _BRUTE_FORCE_PAIRS // len(self.points))
+        for start in range(0, len(uncertain), bruteChunkSize):
+            chunk = uncertain[start:start + bruteChunkSize]
+            bruteDistances = np.linalg.norm(points[chunk, None, :] - self.points[None, :, :], axis=2)
+            nearest = np.argpartition(bruteDistances, k - 1, axis=1)[:, :k]
+            nearestDistances = np.take_along_axis(bruteDistances, nearest, axis=1)
+            byDistance = np.argsort(nearestDistances, axis=1)
+            indices[chunk] = np.take_along_axis(nearest, byDistance, axis=1)
+            distances[chunk] = np.take_along_axis(nearestDistances, byDistance, axis=1)
+
+        return distances, indices
+
+    def _queryCells(self, points, k):
+        """Return the k nearest grid points found in the 27 cells around each point.
+
+        Points are grouped by their candidate count, and each group's candidate matrix is only as wide as its own
+        largest neighbourhood, with at most _CANDIDATE_BUDGET entries, so a dense cluster does not pad every point.
+        """
+        cells = self._cells(points)
+
+        starts = np.empty((len(points), 27), dtype=np.int64)
+        counts = np.empty((len(points), 27), dtype=np.int64)
+        offsets = np.stack(np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1], indexing="ij"), -1).reshape(-1, 3)
+        for cell, offset in enumerate(offsets):
+            neighbor = cells + offset
+            valid = np.all((neighbor >= 0) & (neighbor < self.resolution), axis=1)
+            cellIds = self._cellIds(np.clip(neighbor, 0, self.resolution - 1))
+            starts[:, cell] = np.searchsorted(self.sortedCellIds, cellIds, side="left")
+            stops = np.searchsorted(self.sortedCellIds, cellIds, side="right")
+            counts[:, cell] = np.where(valid, stops - starts[:, cell], 0)
+
+        totals = counts.sum(axis=1)
+        byTotal = np.argsort(totals, kind="stable")
+
+        distances = np.empty((len(points), k))
+        indices = np.empty((len(points), k), dtype=np.int64)
+        first = 0
+        while first < len(points):
+            last = self._groupEnd(totals[byTotal], first, k)
+            group = byTotal[first:last]
+            distances[group], indices[group] = self._queryGroup(points[group], starts[group], counts[group], k)
+            first = last
+
+        return distances, indices
+
+    @staticmethod
+    def _groupEnd(sortedTotals, first: int, k: int) -> int:
+        """Return the end of the group starting at first whose padded candidate matrix fits _CANDIDATE_BUDGET."""
+        last = len(sortedTotals)
+        while True:
+            width = max(int(sortedTotals[last - 1]), k)
+            rows = max(1, _CANDIDATE_BUDGET // width)
+            if last - first <= rows:
+                return last
+            last = first + rows
+
+    def _queryGroup(self, points, starts, counts, k):
+        """Return the k nearest grid points among each point's candidates, packed without per-cell padding."""
+        rowTotals = counts.sum(axis=1)
+        width = max(int(rowTotals.max()), k)
+
+        # One entry per (point, candidate), in row order
+        flatCounts = counts.ravel()
+        total = int(flatCounts.sum())
+        segmentStarts = np.repeat(np.cumsum(flatCounts) - flatCounts, flatCounts)
+        sortedIndex = np.repeat(starts.ravel(), flatCounts) + np.arange(total) - segmentStarts
+        rows = np.repeat(np.arange(len(points)), rowTotals)
+        columns = np.arange(total) - np.repeat(np.cumsum(rowTotals) - rowTotals, rowTotals)
+
+        flat = rows * width + columns
+        candidates = self.order[sortedIndex]
+        offsets = self.points[candidates] - points[rows]
+
+        slots = np.full((len(points), width), -1, dtype=np.int64)
+        slots.reshape(-1)[flat] = candidates
+        distances = np.full(slots.shape, np.inf)
+        distances.reshape(-1)[flat] = np.sqrt(np.einsum("ij,ij->i", offsets, offsets))
+
+        if width > k:
+            nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+            distances = np.take_along_axis(distances, nearest, axis=1)
+            slots = np.take_along_axis(slots, nearest, axis=1)
+        nearest = np.argsort(distances, axis=1)
+        return np.take_along_axis(distances, nearest, axis=1), np.take_along_axis(slots, nearest, axis=1)
+
+
+def transferWeights(sourcePositions, sourceWeights, targetPositions, k: int = 4, epsilon: float = 1e-6):
+    """Blend source weights onto target points by position.
+
+    Args:
+        sourcePositions (numpy.ndarray): Source points, shape (sourceCount, 3).
+        sourceWeights (numpy.ndarray): Source weights, shape (sourceCount, influenceCount).
+        targetPositions (numpy.ndarray): Target points, shape (targetCount, 3).
+        k (int, optional): Number of nearest source points blended per target point. Defaults to 4.
+        epsilon (float, optional): Distance under which a source point is copied exactly. Defaults to 1e-6.
+
+    Returns:
+        numpy.ndarray: Normalized target weights, shape (targetCount, influenceCount).
+    """
+    sourceWeights = np.asarray(sourceWeights, dtype=np.float64)
+    distances, indices = PointGrid(sourcePositions).query(targetPositions, k)
+
+    blend = 1.0 / np.maximum(distances, epsilon)
+    exact = distances[:, 0] < epsilon
+    blend[exact] = 0.0
+    blend[exact, 0] = 1.0
+    blend /= blend.sum(axis=1, keepdims=True)
+
+    weights = np.empty((len(indices), sourceWeights.shape[1]), dtype=np.float64)
+    for start in range(0, len(indices), _CHUNK_SIZE):
+        stop = start + _CHUNK_SIZE
+        weights[start:stop] = np.einsum("tk,tki->ti", blend[start:stop], sourceWeights[indices[start:stop]])
+
+    sums = weights.sum(axis=1, keepdims=True)
+    np.divide(weights, sums, out=weights, where=sums > 0.0)
+    return weights
@@ -7,6 +7,10 @@ import rigsys.modules.moduleBase as moduleBase
 class DeformerModuleBase(moduleBase.ModuleBase):
     """Base class for deformer modules."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ()
+    sharedFields = ()
+
     def __init__(self, rig, side: str = "", label: str = "", buildOrder: int = 2000,
                  isMuted: bool = False, mirror: bool = False, bypassProxiesOnly: bool = False) -> None:
         """Initialize the module."""
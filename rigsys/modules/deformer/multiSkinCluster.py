@@ -0,0 +1,131 @@
+"""Skin cluster module for many meshes at once."""
+
+import logging
+
+import rigsys.lib.skinWeights as skinWeights
+import rigsys.lib.weightFile as weightFile
+import rigsys.lib.weightOps as weightOps
+import rigsys.modules.deformer.deformerBase as deformerBase
+
+import maya.cmds as cmds
+
+logger = logging.getLogger(__name__)
+
+
+class MultiSkinCluster(deformerBase.DeformerModuleBase):
+    """Create skinClusters and import or export their weights for many meshes at once.
+
+    Every mesh, joint and weight file is validated up front, then the skinClusters are created in one pass and the
+    weights are loaded with skinWeights.importWeightsBatch.
+    """
+
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ("meshes",)
+    sharedFields = ("influenceRemap",)
+
+    def __init__(self, rig, side: str = "", label: str = "", buildOrder: int = 4000, isMuted: bool = False,
+                 mirror: bool = False, meshes=None, path: str = "", createSCLS: bool = True,
+                 importSCLS: bool = False, exportSCLS: bool = False, maxInfluences: int = 4, weightFormat: str = "npz",
+                 influenceRemap=None, maxWorkers: int = skinWeights.DEFAULT_WORKERS,
+                 skipUnchangedWeights: bool = False) -> None:
+        """Initialize the module.
+
+        Args:
+            meshes (dict | list): Mesh name to its list of influences. A list of meshes, or a mesh mapped to None,
+                reads the influences from the header of the mesh's weight file in path.
+            path (str): Directory of the "{mesh}_scls" weight files.
+            createSCLS (bool): Create a skinCluster named "{mesh}_scls" on every mesh.
+            importSCLS (bool): Import the weights of every mesh.
+            exportSCLS (bool): Export the weights of every mesh, as "npz", "wmap" or "json" files (weightFormat).
+            influenceRemap (dict | str): Influence remap table applied to influence names and imported weights, see
+                rigsys.lib.weightOps.
+            maxWorkers (int): Thread pool size for weight file I/O.
+            skipUnchangedWeights (bool): Skip importing weights the skinClusters already hold, see
+                skinWeights.importWeights.
+        """
+        super().__init__(rig, side, label, buildOrder, isMuted, mirror)
+
+        if meshes is None:
+            meshes = {}
+        if isinstance(meshes, (list, tuple)):
+            meshes = {mesh: None for mesh in meshes}
+
+        self.meshes = meshes
+        self.path = path
+        self.createSCLS = createSCLS
+        self.importSCLS = importSCLS
+        self.exportSCLS = exportSCLS
+        self.maxInfluences = maxInfluences
+        self.weightFormat = weightFormat
+        self.influenceRemap = influenceRemap
+        self.maxWorkers = maxWorkers
+        self.skipUnchangedWeights = skipUnchangedWeights
+
+    def run(self) -> None:
+        """Run the module."""
+        if self.path is None or self.path == "":
+            cmds.error(f"Path is incorrect {self.path}")
+
+        influenceMap = self.getInfluenceMap()
+        self.validate(influenceMap)
+
+        if self.createSCLS:
+            self.createSkinClusters(influenceMap)
+        if self.importSCLS:
+            self.readWeights()
+        if self.exportSCLS:
+            self.writeWeights()
+
+    def getInfluenceMap(self) -> dict:
+        """Return mesh name to influence names, reading missing influence lists from the weight file headers."""
+        influenceMap = {}
+        for mesh, influences in self.meshes.items():
+            if influences is None:
+                fileName = skinWeights.findWeightFile(self.path, mesh)
+                if fileName is None or fileName.endswith(".json"):
+                    cmds.error(f"No influences given for {mesh}, and no .npz or .wmap weight file in {self.path}")
+                influences = weightFile.readHeader(fileName)["influences"]
+
+            if self.influenceRemap:
+                influences = weightOps.remapNames(influences, self.influenceRemap)
+            influenceMap[mesh] = list(influences)
+
+        return influenceMap
+
+    def validate(self, influenceMap: dict) -> None:
+        """Check that every mesh and influence exists, with a single query for all of them."""
+        required = set(influenceMap)
+        for influences in influenceMap.values():
+            required.update(influences)
+
+        missing = sorted(required.difference(cmds.ls(sorted(required))))
+        if missing:
+            cmds.error(f"Missing the following meshes or joints {missing}; for {self.getFullName()}")
+
+        if self.importSCLS:
+            noFiles = [mesh for mesh in influenceMap if skinWeights.findWeightFile(self.path, mesh) is None]
+            if noFiles:
+                cmds.error(f"No weight files found in {self.path} for {noFiles}")
+
+    def createSkinClusters(self, influenceMap: dict) -> None:
+        """Create a skinCluster on every mesh."""
+        for mesh, influences in influenceMap.items():
+            if cmds.objExists(f"{mesh}_scls"):
+                logger.warning(f"{mesh}_scls already exists, skipping its creation")
+                continue
+
+            cmds.skinCluster(influences, mesh, n=f"{mesh}_scls", tsb=True, mi=self.maxInfluences)
+
+    def writeWeights(self) -> None:
+        """Export the weights of every mesh."""
+        logger.info(f"Exporting {len(self.meshes)} skinClusters. . .")
+        jobs = [(f"{mesh}_scls", skinWeights.getWeightFile(self.path, mesh, extension=f".{self.weightFormat}"))
+                for mesh in self.meshes]
+        skinWeights.exportWeightsBatch(jobs, self.maxWorkers)
+
+    def readWeights(self) -> None:
+        """Import the weights of every mesh."""
+        logger.info(f"Importing {len(self.meshes)} skinClusters. . .")
+        jobs = [(f"{mesh}_scls", skinWeights.findWeightFile(self.path, mesh)) for mesh in self.meshes]
+        skinWeights.importWeightsBatch(jobs, self.maxWorkers, remap=self.influenceRemap,
+                                       skipUnchanged=self.skipUnchangedWeights)
@@ -1,6 +1,8 @@
 """Build bind joints utility module."""
 
 import logging
+import rigsys.lib.skinWeights as skinWeights
+import rigsys.lib.weightOps as weightOps
 import rigsys.modules.deformer.deformerBase as deformerBase
 import maya.cmds as cmds
 
@@ -9,9 +11,17 @@ logger = logging.getLogger(__name__)
 class skinClusterImportExport(deformerBase.DeformerModuleBase):
     """Build bind joints utility module."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ("object", "joints")
+    sharedFields = ("influenceRemap",)
+
     def __init__(self, rig, side: str = "", label: str = "", buildOrder: int = 4000, isMuted: bool = False,
                  mirror: bool = False, importSCLS: bool = False, exportSCLS: bool = False, createSCLS: bool = True,
-                 joints: list = [], object: str = "", path: str = "", maxInfluences: int = 4) -> None:
+                 joints: list = [], object: str = "", path: str = "", maxInfluences: int = 4,
+                 weightFormat: str = "npz", quantizeType: str = None, chunkSize: int = 25000,
+                 vertexRange: list = None, importMethod: str = "index", deltaExport: bool = False,
+                 influenceRemap=None, pruneThreshold: float = None, capInfluences: bool = False,
+                 skipUnchangedWeights: bool = False) -> None:
         """Initialize the module."""
         super().__init__(rig, side, label, buildOrder, isMuted, mirror)
 
@@ -22,15 +32,28 @@ class skinClusterImportExport(deformerBase.DeformerModuleBase):
         self.createSCLS = createSCLS
         self.path = path
         self.maxInfluences = maxInfluences
+        self.weightFormat = weightFormat
+        self.quantizeType = quantizeType
+        self.chunkSize = chunkSize
+        self.vertexRange = vertexRange
+        self.importMethod = importMethod
+        self.deltaExport = deltaExport
+        self.influenceRemap = influenceRemap
+        self.pruneThreshold = pruneThreshold
+        self.capInfluences = capInfluences
+        self.skipUnchangedWeights = skipUnchangedWeights
 
     def run(self) -> None:
         """Run the module."""
         if self.obj is not None or self.obj != "":
             if not cmds.objExists(self.obj):
                 cmds.error(f"Object does not exist {self.obj}")
-        if len(self.joints) != 0:
+        joints = self.joints
+        if self.influenceRemap:
+            joints = weightOps.remapNames(joints, self.influenceRemap)
+        if len(joints) != 0:
             gatherMissing = []
-            for i in self.joints:
+            for i in joints:
                 if not cmds.objExists(i):
                     gatherMissing.append(i)
             if len(gatherMissing) > 0:
@@ -39,14 +62,14 @@ class skinClusterImportExport(deformerBase.DeformerModuleBase):
             cmds.error(f"Path is incorrect {self.path}")
         
         if self.createSCLS:
-            self.createSkinCluster()
+            self.createSkinCluster(joints)
         if self.importSCLS:
             self.readWeights()
         if self.exportSCLS:
             self.writeWeights()
 
-    def createSkinCluster(self):
-        cmds.skinCluster(self.joints, 
+    def createSkinCluster(self, joints: list):
+        cmds.skinCluster(joints, 
                          self.obj, 
                          n=f"{self.obj}_scls",
                          tsb=True,
@@ -54,23 +77,33 @@ class skinClusterImportExport(deformerBase.DeformerModuleBase):
 
     def writeWeights(self):
         print(f"Exporting {self.obj}_scls. . .")
-        cmds.deformerWeights(f"{self.obj}_scls.json", 
-                             ex=True,
-                             p=self.path,
-                             deformer=f"{self.obj}_scls",
-                             m="index",
-                             at=["maintainMaxInfluences", "maxInfluences"],
-                             format="JSON",
-                             dv=1.0                             
-                             )
+        fileName = skinWeights.getWeightFile(self.path, self.obj, extension=f".{self.weightFormat}")
+        if self.weightFormat == "json":
+            skinWeights.exportWeights(f"{self.obj}_scls", fileName)
+        elif self.weightFormat == "wmap":
+            skinWeights.exportWeights(f"{self.obj}_scls", fileName, chunkSize=self.chunkSize)
+        else:
+            skinWeights.exportWeights(f"{self.obj}_scls", fileName, quantizeType=self.quantizeType,
+                                      delta=self.deltaExport)
+
     def readWeights(self):
         print(f"Importing {self.obj}_scls. . .")
-        cmds.deformerWeights(f"{self.obj}_scls.json", 
-                             im=True,
-                             p=self.path,
-                             deformer=f"{self.obj}_scls",
-                             m="index",
-                             at=["maintainMaxInfluences", "maxInfluences"],
-                             format="JSON",
-                             dv=1.0
-                             )
\ No newline at end of file
+        fileName = skinWeights.findWeightFile(self.path, self.obj, extension=f".{self.weightFormat}")
+        if fileName is None:
+            cmds.error(f"No weight file found for {self.obj}_scls in {self.path}")
+        cleanup = None
+        if self.pruneThreshold is not None or self.capInfluences:
+            cleanup = {
+                "threshold": self.pruneThreshold,
+                "maxInfluences": self.maxInfluences if self.capInfluences else None,
+                "locked": skinWeights.getLockedInfluences(f"{self.obj}_scls"),
+            }
+
+        if fileName.endswith(".wmap"):
+            skinWeights.importWeights(f"{self.obj}_scls", fileName, chunkSize=self.chunkSize,
+                                      vertexRange=self.vertexRange, remap=self.influenceRemap, cleanup=cleanup,
+                                      skipUnchanged=self.skipUnchangedWeights)
+        else:
+            skinWeights.importWeights(f"{self.obj}_scls", fileName, method=self.importMethod,
+                                      remap=self.influenceRemap, cleanup=cleanup,
+                                      skipUnchanged=self.skipUnchangedWeights)
@@ -8,6 +8,10 @@ import rigsys.modules.moduleBase as moduleBase
 class ExportModuleBase(moduleBase.ModuleBase):
     """Base class for export modules."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ()
+    sharedFields = ()
+
     def __init__(self, rig, exportPath: str, label: str = "", buildOrder: int = 5000,
                  isMuted: bool = False, mirror: bool = False) -> None:
         """Initialize the module."""
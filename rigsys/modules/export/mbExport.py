@@ -10,6 +10,10 @@ import rigsys.modules.export.exportBase as exportBase
 class MBExport(exportBase.ExportModuleBase):
     """MB Export Module."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ()
+    sharedFields = ("nodesToExport",)
+
     def __init__(self, rig, exportPath: str, label: str = "", buildOrder: int = 5000,
                  isMuted: bool = False, exportAll: bool = False, exportSelected: bool = False,
                  nodesToExport: list = None, mirror: bool = False) -> None:
@@ -1,6 +1,7 @@
 """Base class for all modules."""
 
 import copy
+import inspect
 import logging
 
 import rigsys.utils.stringUtils as stringUtils
@@ -11,9 +12,40 @@ import maya.cmds as cmds
 logger = logging.getLogger(__name__)
 
 
+def _mirrorStrings(value):
+    """Return the value with its strings mirrored, including strings inside lists, tuples and dict keys and values."""
+    if isinstance(value, str):
+        return stringUtils.mirrorString(value)
+    if isinstance(value, (list, tuple)):
+        return type(value)(_mirrorStrings(item) for item in value)
+    if isinstance(value, dict):
+        return {_mirrorStrings(key): _mirrorStrings(item) for key, item in value.items()}
+    return value
+
+
+def _isImmutable(value) -> bool:
+    """Return True if the value can be shared between modules."""
+    if isinstance(value, (tuple, frozenset)):
+        return all(_isImmutable(item) for item in value)
+    return value is None or isinstance(value, (str, bytes, int, float, complex))
+
+
 class ModuleBase:
     """Base class for all modules."""
 
+    # Mirroring spec, see doMirror. Subclasses declare their own
+    mirrorFields: tuple = None
+    flipAxisFields: tuple = ("aimAxis", "upAxis")
+    sharedFields: tuple = ()
+
+    def __new__(cls, *args, **kwargs):
+        """Create the module, recording its constructor arguments for doMirror."""
+        module = super().__new__(cls)
+        arguments = inspect.signature(cls.__init__).bind_partial(module, *args, **kwargs)
+        arguments.apply_defaults()
+        module._initArguments = {name: value for name, value in arguments.arguments.items() if name != "self"}
+        return module
+
     def __init__(self, rig, side: str = "", label: str = "", buildOrder: int = 0,
                  isMuted: bool = False, mirror: bool = False, mirrored: bool = False,
                  bypassProxiesOnly: bool = False) -> None:
@@ -41,87 +73,86 @@ class ModuleBase:
         pass
 
     def doMirror(self):
-        """Mirror the module."""
+        """Mirror the module.
+
+        The mirrored module is constructed from this module's constructor arguments, following the class's mirroring
+        spec:
+            - mirrorFields: Arguments whose strings (also inside lists, tuples and dicts) are mirrored with
+              stringUtils.mirrorString. None mirrors every argument.
+            - flipAxisFields: Axis arguments flipped with jointTools.axisFlip.
+            - sharedFields: Arguments passed to both modules as the same object.
+        Any other argument is shared if it is immutable, and copied otherwise. Every module class declares its own
+        spec; ModuleBase's mirrorFields of None is only the fallback for classes that do not.
+
+        The arguments are the ones the module was constructed with, not the module's current attribute values, so
+        state changed while building is not fed back into the mirrored module.
+        """
         if self.side == "M":
             logger.warning(f"Cannot mirror middle module {self.getFullName()}")
             return None
 
-        # Don't want to copy the rig object each time
-        tempRigObject = self._rig
-        self._rig = None
-
-        newModule = copy.deepcopy(self)
-
-        self._rig = tempRigObject
-        newModule._rig = tempRigObject
-
-        # Individual variables
-        for var, value in vars(self).items():
-            if var in ["_rig", "dependencies", "ctrls"]:
-                continue
-
-            # Skip variables that start with an underscore
-            if var.startswith("_"):
-                continue
-
-            if isinstance(value, str):
-                newValue = stringUtils.mirrorString(value)
-                setattr(newModule, var, newValue)
-
-            if isinstance(value, list) or isinstance(value, tuple):
-                newValue = []
-                for item in value:
-                    newValue.append(stringUtils.mirrorString(item))
-                setattr(newModule, var, newValue)
-
-            if isinstance(value, dict):
-                newValue = {}
-                for key, item in value.items():
-                    newValue[stringUtils.mirrorString(key)] = stringUtils.mirrorString(item)
-                setattr(newModule, var, newValue)
+        newSide = {"L": "R", "R": "L"}.get(self.side, self.side)
+        arguments = self._getMirrorArguments(newSide)
 
-            else:
-                setattr(newModule, var, value)
+        newModule = type(self)(**arguments)
 
         # IMPORTANT: Anything that needs to be manually set needs to come after this point
 
-        # So we don't get stuck in an infinite loop
+        # The constructor may not take the side
+        newModule.side = newSide
         newModule.mirror = False
+        newModule.mirrored = True
         self._mirrorObject = newModule
         newModule._mirrorObject = self
 
-        if self.side == "L":
-            newModule.side = "R"
-        elif self.side == "R":
-            newModule.side = "L"
-        if hasattr(newModule, "aimAxis"):
-            # print("######")
-            # print(newModule.label)
-            # print(f"{newModule.aimAxis} converted to {jointTools.axisFlip(newModule.aimAxis)}")
-            # cmds.error("@@")
-            newModule.aimAxis = jointTools.axisFlip(newModule.aimAxis)
-        if hasattr(newModule, "upAxis"):
-            # print("######")
-            # print(newModule.label)
-            # print(f"{newModule.aimAxis} converted to {jointTools.axisFlip(newModule.aimAxis)}")
-            # cmds.error("@@")
-            newModule.upAxis = jointTools.axisFlip(newModule.upAxis)
-        # Parents
-        if newModule.parent.startswith("L_"):
-            split = newModule.parent.split("_")
-            split[0] = "R"
-            newModule.parent = "_".join(split)
+        # Attributes set after construction, that the new module does not have yet
+        for var, value in vars(self).items():
+            if var.startswith("_") or hasattr(newModule, var):
+                continue
+            setattr(newModule, var, self._mirrorValue(var, value))
 
         # Proxies
-        for key, proxy in self.proxies.items():
+        for key, proxy in getattr(self, "proxies", {}).items():
             # Don't mirror middle proxies
             if proxy.side == "M":
+                newModule.proxies[key] = copy.deepcopy(proxy)
                 continue
 
             newModule.proxies[key] = proxy.doMirror()
 
         return newModule
 
+    def _getMirrorArguments(self, newSide: str) -> dict:
+        """Return the constructor arguments of the mirrored module."""
+        arguments = {}
+        for name, parameter in inspect.signature(type(self).__init__).parameters.items():
+            if name == "self" or parameter.kind == parameter.VAR_POSITIONAL:
+                continue
+
+            if parameter.kind == parameter.VAR_KEYWORD:
+                arguments.update({key: self._mirrorValue(key, value)
+                                  for key, value in self._initArguments.get(name, {}).items()})
+            elif name == "rig":
+                arguments[name] = self._rig
+            elif name == "side":
+                arguments[name] = newSide
+            elif name == "mirror":
+                arguments[name] = False
+            elif name in self._initArguments:
+                arguments[name] = self._mirrorValue(name, self._initArguments[name])
+
+        return arguments
+
+    def _mirrorValue(self, name: str, value):
+        """Return the mirrored value of a constructor argument or attribute, following the mirroring spec."""
+        if name in self.sharedFields:
+            return value
+        if name in self.flipAxisFields and isinstance(value, str):
+            return jointTools.axisFlip(value)
+        if self.mirrorFields is None or name in self.mirrorFields:
+            value = _mirrorStrings(value)
+        return value if _isImmutable(value) else copy.deepcopy(value)
+
     def getFullName(self):
         """Return the full name of the module."""
         return f"{self.side}_{self.label}"
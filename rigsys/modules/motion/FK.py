@@ -4,6 +4,7 @@ import rigsys.modules.motion.motionBase as motionBase
 import rigsys.lib.ctrl as ctrlCrv
 import rigsys.lib.proxy as proxy
 import rigsys.lib.joint as jointTools
+import rigsys.lib.matrixConstraint as matrixConstraint
 
 import maya.cmds as cmds
 
@@ -11,6 +12,10 @@ import maya.cmds as cmds
 class FK(motionBase.MotionModuleBase):
     """FK Motion Module."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ("parent", "selectedPlug", "selectedSocket")
+    sharedFields = ("ctrlShapes", "ctrlScale")
+
     def __init__(self, rig, side="", label="", ctrlShapes="circle", ctrlScale=None, addOffsets=True, segments=5,
                  buildOrder: int = 2000, isMuted: bool = False, parent: str = None,
                  mirror: bool = False, bypassProxiesOnly: bool = True, selectedPlug: str = "", selectedSocket: str = "",
@@ -182,13 +187,11 @@ class FK(motionBase.MotionModuleBase):
 
                 cmds.parent(oGrp, ctrl)
 
-                ptc = cmds.parentConstraint(ctrl, fJnt, n=f"{fJnt}_ptc", mo=0)[0]
-                cmds.setAttr(f"{ptc}.interpType", 2)
-                sc = cmds.scaleConstraint(ctrl, fJnt, n=f"{fJnt}_sc", mo=0)
+                ptc = matrixConstraint.parentConstraint(ctrl, fJnt, n=f"{fJnt}_ptc", mo=0, interpType=2)[0]
+                sc = matrixConstraint.scaleConstraint(ctrl, fJnt, n=f"{fJnt}_sc", mo=0)
             else:
-                ptc = cmds.parentConstraint(ctrl, fJnt, n=f"{fJnt}_ptc", mo=0)[0]
-                cmds.setAttr(f"{ptc}.interpType", 2)
-                sc = cmds.scaleConstraint(ctrl, fJnt, n=f"{fJnt}_sc", mo=0)
+                ptc = matrixConstraint.parentConstraint(ctrl, fJnt, n=f"{fJnt}_ptc", mo=0, interpType=2)[0]
+                sc = matrixConstraint.scaleConstraint(ctrl, fJnt, n=f"{fJnt}_sc", mo=0)
         if self.addOffsets:
             for og in oGrps:
                         cmds.parent(og, FKCtrls[index])
@@ -11,6 +11,10 @@ import maya.cmds as cmds
 class Root(motionBase.MotionModuleBase):
     """Root Motion Module."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ("parent", "selectedPlug", "selectedSocket")
+    sharedFields = ("ctrlShapes", "ctrlScale")
+
     def __init__(self, rig, side="", label="", ctrlShapes="circle", ctrlScale=None, addOffset=True,
                  buildOrder: int = 2000, isMuted: bool = False, parent: str = None, mirror: bool = False,
                  bypassProxiesOnly: bool = True, selectedPlug: str = "", selectedSocket: str = "",
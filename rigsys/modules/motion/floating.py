@@ -7,6 +7,10 @@ import rigsys.modules.motion.motionBase as motionBase
 class Floating(motionBase.MotionModuleBase):
     """Floating Motion Module."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ("parent",)
+    sharedFields = ()
+
     def __init__(self, rig, side: str = "", label: str = "", buildOrder: int = 2000,
                  isMuted: bool = False, parent: str = None, mirror: bool = False) -> None:
         """Initialize the module."""
@@ -11,6 +11,10 @@ import maya.cmds as cmds
 class Hand(motionBase.MotionModuleBase):
     """FK Motion Module."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ("parent", "selectedPlug", "selectedSocket")
+    sharedFields = ("ctrlShapes", "ctrlScale")
+
     def __init__(self, rig, side="", label="", ctrlShapes="circle", ctrlScale=None, addOffset=True, meta: bool = True,
                  thumb: bool = True, numberOfFingers: int = 4, numberOfFingerJoints: int = 4, numberOfThumbJoints: int = 3,
                  buildOrder: int = 2000, isMuted: bool = False, parent: str = None,
@@ -4,6 +4,7 @@ import rigsys.modules.motion.motionBase as motionBase
 import rigsys.lib.ctrl as ctrlCrv
 import rigsys.lib.proxy as proxy
 import rigsys.lib.joint as jointTools
+import rigsys.lib.ribbon as ribbonTools
 
 import maya.cmds as cmds
 
@@ -11,12 +12,17 @@ import maya.cmds as cmds
 class Limb(motionBase.MotionModuleBase):
     """Limb Motion Module."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ("parent", "selectedPlug", "selectedSocket")
+    sharedFields = ("ctrlShapes", "ctrlScale", "nameSet")
+
     def __init__(self, rig, side="", label="", 
                  buildOrder: int = 2000, isMuted: bool = False, parent: str = None,
                  mirror: bool = False, bypassProxiesOnly: bool = True, selectedPlug: str = "", selectedSocket: str = "",
                  aimAxis: str = "+x", upAxis: str = "-z", ctrlShapes="circle", ctrlScale=None, addOffset=True, 
                  clavicle=True, pvMultiplier: float = 1.0, numberOfJoints: int = 11, 
-                 nameSet: dict = {"Root": "Root", "Start": "Start", "Mid": "Mid", "End": "End"}) -> None:
+                 nameSet: dict = {"Root": "Root", "Start": "Start", "Mid": "Mid", "End": "End"},
+                 useUvPin: bool = True) -> None:
         """Initialize the module."""
         super().__init__(rig, side, label, buildOrder, isMuted,
                          parent, mirror, bypassProxiesOnly, selectedPlug, 
@@ -33,6 +39,7 @@ class Limb(motionBase.MotionModuleBase):
         self.pvMultiplier = pvMultiplier
         self.numberOfJoints = numberOfJoints
         self.nameSet = nameSet
+        self.useUvPin = useUvPin
 
         self.proxies = {
             self.nameSet["Root"]: proxy.Proxy(
@@ -540,33 +547,11 @@ class Limb(motionBase.MotionModuleBase):
             su=6, du=3, sv=1, dv=1, tol=0.01, fr=0, dir=2, ch=False
         )
         cmds.delete([tempCurve, tempCurve2])
-        param = 0
-        paramInfl = 1 / (self.numberOfJoints - 1)
-        for i in range(self.numberOfJoints):
-
-            # Build Follicles
-            fol = cmds.createNode(
-                "transform", n=f"{self.side}_{self.label}_{i}_fol")
-            folShape = cmds.createNode(
-                "follicle", n=f"{self.side}_{self.label}_{i}_folShape", p=fol)
-
-            cmds.connectAttr(
-                f"{ribbon}.worldMatrix[0]", f"{folShape}.inputWorldMatrix", f=True)
-            cmds.connectAttr(f"{ribbon}.local",
-                             f"{folShape}.inputSurface", f=True)
-            cmds.setAttr(f"{folShape}.parameterV", 0.5)
-            cmds.setAttr(f"{folShape}.parameterU", param)
-            cmds.connectAttr(f"{folShape}.outRotate", f"{fol}.rotate", f=True)
-            cmds.connectAttr(f"{folShape}.outTranslate",
-                             f"{fol}.translate", f=True)
-
-            cmds.parent(fol, folGrp)
-
-            if param > 1:
-                param = 1
-            param += paramInfl
-
-            follicles.append([fol, folShape])
+        pins = ribbonTools.pinToSurface(
+            ribbon, ribbonTools.ribbonParameters(self.numberOfJoints),
+            name=f"{self.side}_{self.label}", parent=folGrp, useUvPin=self.useUvPin)
+        for i, fol in enumerate(pins):
+            follicles.append(fol)
 
             # Build Joints
             jnt = cmds.createNode("joint", n=f"{self.side}_{self.label}_{i}")
@@ -2,6 +2,9 @@
 
 import logging
 
+import rigsys.lib.mirrorNetwork as mirrorNetwork
+import rigsys.lib.nodeBudget as nodeBudget
+import rigsys.lib.proxy as proxyTools
 import rigsys.modules.moduleBase as moduleBase
 
 import maya.cmds as cmds
@@ -12,6 +15,10 @@ logger = logging.getLogger(__name__)
 class MotionModuleBase(moduleBase.ModuleBase):
     """Base class for motion modules."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ("parent", "selectedPlug", "selectedSocket")
+    sharedFields = ("ctrlShapes", "ctrlScale")
+
     def __init__(self, rig, side: str = "", label: str = "", buildOrder: int = 2000,
                  isMuted: bool = False, parent: str = None, mirror: bool = False,
                  bypassProxiesOnly: bool = True, selectedPlug: str = "", selectedSocket: str = "",
@@ -43,18 +50,25 @@ class MotionModuleBase(moduleBase.ModuleBase):
         self.aimAxis = aimAxis
         self.upAxis = upAxis
 
-    def run(self, buildProxiesOnly: bool = False, usedSavedProxyData: bool = True, proxyData: dict = {}) -> None:
-        """Run the module."""
-        if usedSavedProxyData:
-            try:
-                moduleProxyData = proxyData[self.getFullName()]
+        # Records the nodes built by buildModule, for the mirrored module to duplicate, see run
+        self._nodeTracker = None
+
+    def run(self, buildProxiesOnly: bool = False, usedSavedProxyData: bool = True, proxyData: dict = {},
+            duplicateMirror: bool = False) -> None:
+        """Run the module.
 
-                for proxyKey, proxyTransformationData in moduleProxyData.items():
-                    self.proxies[proxyKey].position = proxyTransformationData["position"]
-                    self.proxies[proxyKey].rotation = proxyTransformationData["rotation"]
+        With duplicateMirror, a module that mirrors into another records the nodes it builds, and the mirrored module
+        duplicates them instead of running buildModule again, see duplicateFromMirror.
+        """
+        if usedSavedProxyData:
+            # Missing and orphaned entries are reported once for the whole file by Rig.loadProxyData
+            moduleProxyData = (proxyData or {}).get(self.getFullName(), {})
 
-            except KeyError:
-                logger.error(f"Proxy data for module {self.getFullName()} not found.")
+            for proxyKey, proxyTransformationData in moduleProxyData.items():
+                if proxyKey not in self.proxies:
+                    continue
+                self.proxies[proxyKey].position = proxyTransformationData["position"]
+                self.proxies[proxyKey].rotation = proxyTransformationData["rotation"]
 
         # Build proxy step
         self.buildProxies()
@@ -63,17 +77,53 @@ class MotionModuleBase(moduleBase.ModuleBase):
             return
 
         # Build module step
-        self.buildModule()
+        if duplicateMirror and self.mirrored and self.canDuplicateFromMirror():
+            self.duplicateFromMirror()
+        elif duplicateMirror and self.mirror:
+            with nodeBudget.NodeTracker() as self._nodeTracker:
+                self.buildModule()
+        else:
+            self.buildModule()
 
     def buildProxies(self):
-        """Build the proxies for the module."""
-        for proxy in self.proxies.values():
-            proxy.build()
+        """Build the proxies for the module, all at once."""
+        proxyTools.buildProxies(list(self.proxies.values()))
 
     def buildModule(self):
         """Build the rest of the module."""
         pass
 
+    def canDuplicateFromMirror(self) -> bool:
+        """Return True if the module can be duplicated from the module it was mirrored from.
+
+        The source module must have recorded its nodes, and the proxies of both modules must be symmetric.
+        """
+        source = getattr(self, "_mirrorObject", None)
+        if source is None or source._nodeTracker is None:
+            return False
+
+        if not mirrorNetwork.isSymmetric(source.proxies, self.proxies):
+            logger.info(f"{self.getFullName()} proxies are not symmetric to {source.getFullName()}, building it.")
+            return False
+
+        return mirrorNetwork.canDuplicate(source._nodeTracker.nodes())
+
+    def duplicateFromMirror(self) -> None:
+        """Build the module by duplicating the nodes of the module it was mirrored from, see rigsys.lib.mirrorNetwork.
+
+        Every public attribute of the source module that holds names of its nodes (plugs, sockets, bindJoints,
+        moduleNode and so on) is set on this module with the names of the duplicates.
+        """
+        source = self._mirrorObject
+        nameMap = mirrorNetwork.duplicateNetwork(source._nodeTracker.nodes())
+
+        for name, value in vars(source).items():
+            if name.startswith("_"):
+                continue
+            mirroredValue = mirrorNetwork.mirrorValue(value, nameMap)
+            if mirroredValue != value:
+                setattr(self, name, mirroredValue)
+
     def doMirror(self):
         """Mirror the module."""
         # TODO: Implement mirror
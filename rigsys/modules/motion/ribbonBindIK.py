@@ -2,6 +2,7 @@ import rigsys.modules.motion.motionBase as motionBase
 import rigsys.lib.ctrl as ctrlCrv
 import rigsys.lib.proxy as proxy
 import rigsys.lib.joint as jointTools
+import rigsys.lib.ribbon as ribbonTools
 
 import maya.cmds as cmds
 
@@ -9,10 +10,15 @@ import maya.cmds as cmds
 class RibbonBindIK(motionBase.MotionModuleBase):
     """Root Motion Module."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ("parent", "selectedPlug", "selectedSocket")
+    sharedFields = ("ctrlShapes", "ctrlScale")
+
     def __init__(self, rig, side="", label="", ctrlShapes="sphere", ctrlScale=None, addOffset=True, spans=5,
                  reverse=True, meta=True, numberOfJoints=10, localAxisTranslate = "X", buildOrder: int = 2000, 
                  isMuted: bool = False, parent: str = None, mirror: bool = False, bypassProxiesOnly: bool = True, 
-                 selectedPlug: str = "", selectedSocket: str = "", aimAxis: str = "+x", upAxis: str = "-z") -> None:
+                 selectedPlug: str = "", selectedSocket: str = "", aimAxis: str = "+x", upAxis: str = "-z",
+                 useUvPin: bool = True) -> None:
         """Initialize the module."""
         super().__init__(rig, side, label, buildOrder, isMuted, 
                          parent, mirror, bypassProxiesOnly, selectedPlug, 
@@ -28,6 +34,7 @@ class RibbonBindIK(motionBase.MotionModuleBase):
         self.reverse = reverse
         self.meta = meta
         self.numberOfJoints = numberOfJoints
+        self.useUvPin = useUvPin
         self.upVector = None
 
         self.proxies = {
@@ -178,33 +185,11 @@ class RibbonBindIK(motionBase.MotionModuleBase):
         rFolCtrls = []
 
         # Create Meta follicles
-        param = 0
-        paramInfl = 1 / (self.spans - 1)
-        for i in range(self.spans):
-
-            # Build Follicles
-            fol = cmds.createNode(
-                "transform", n=f"{self.side}_{self.label}_{i}_fol")
-            folShape = cmds.createNode(
-                "follicle", n=f"{self.side}_{self.label}_{i}_folShape", p=fol)
-
-            cmds.connectAttr(
-                f"{metaRibbon}.worldMatrix[0]", f"{folShape}.inputWorldMatrix", f=True)
-            cmds.connectAttr(f"{metaRibbon}.local",
-                             f"{folShape}.inputSurface", f=True)
-            cmds.setAttr(f"{folShape}.parameterV", 0.5)
-            cmds.setAttr(f"{folShape}.parameterU", param)
-            cmds.connectAttr(f"{folShape}.outRotate", f"{fol}.rotate", f=True)
-            cmds.connectAttr(f"{folShape}.outTranslate",
-                             f"{fol}.translate", f=True)
-
-            cmds.parent(fol, metaFollicles)
-
-            if param > 1:
-                param = 1
-            param += paramInfl
-
-            mFollicles.append([fol, folShape])  
+        metaPins = ribbonTools.pinToSurface(
+            metaRibbon, ribbonTools.ribbonParameters(self.spans),
+            name=f"{self.side}_{self.label}", parent=metaFollicles, useUvPin=self.useUvPin)
+        for i, fol in enumerate(metaPins):
+            mFollicles.append(fol)
 
             # Build Joints and controls
             
@@ -244,33 +229,11 @@ class RibbonBindIK(motionBase.MotionModuleBase):
         jointTools.aimSequence(mFolCtrlGrps, upObj=self.upVector)
         mScls = cmds.skinCluster(mFolJoints, ribbon, n=f"{ribbon}_scls",
                                  sm=0, omi=True, mi=4, tsb=True)
-        param = 0
-        paramInfl = 1 / (self.numberOfJoints - 1)
-        for i in range(self.numberOfJoints):
-
-            # Build Follicles
-            fol = cmds.createNode(
-                "transform", n=f"{self.side}_{self.label}_{i}_Meta_fol")
-            folShape = cmds.createNode(
-                "follicle", n=f"{self.side}_{self.label}_{i}_Meta_folShape", p=fol)
-
-            cmds.connectAttr(
-                f"{ribbon}.worldMatrix[0]", f"{folShape}.inputWorldMatrix", f=True)
-            cmds.connectAttr(f"{ribbon}.local",
-                             f"{folShape}.inputSurface", f=True)
-            cmds.setAttr(f"{folShape}.parameterV", 0.5)
-            cmds.setAttr(f"{folShape}.parameterU", param)
-            cmds.connectAttr(f"{folShape}.outRotate", f"{fol}.rotate", f=True)
-            cmds.connectAttr(f"{folShape}.outTranslate",
-                             f"{fol}.translate", f=True)
-
-            cmds.parent(fol, regionFollicles)
-
-            if param > 1:
-                param = 1
-            param += paramInfl
-
-            rFollicles.append([fol, folShape])  
+        regionPins = ribbonTools.pinToSurface(
+            ribbon, ribbonTools.ribbonParameters(self.numberOfJoints),
+            name=f"{self.side}_{self.label}", token="_Meta", parent=regionFollicles, useUvPin=self.useUvPin)
+        for i, fol in enumerate(regionPins):
+            rFollicles.append(fol)
 
             # Joints and controls
             # grp = cmds.createNode("transform", n=f"{self.side}_{self.label}_{i}_Region_grp")
@@ -10,6 +10,10 @@ import maya.cmds as cmds
 class TestMotionModule(motionBase.MotionModuleBase):
     """Test motion module."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ("parent", "selectedPlug", "selectedSocket")
+    sharedFields = ()
+
     def __init__(self, rig, side: str = "", label: str = "", buildOrder: int = 2000,
                  isMuted: bool = False, parent: str = None, mirror: bool = False,
                  selectedPlug: str = "", selectedSocket: str = "") -> None:
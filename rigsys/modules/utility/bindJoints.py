@@ -9,6 +9,10 @@ logger = logging.getLogger(__name__)
 class BindJoints(utilityBase.UtilityModuleBase):
     """Build bind joints utility module."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ("underGroup",)
+    sharedFields = ()
+
     def __init__(self, rig, side: str = "", label: str = "", buildOrder: int = 3000, isMuted: bool = False,
                  mirror: bool = False, bypassProxiesOnly: bool = False, underGroup: str = "") -> None:
         """Initialize the module."""
@@ -14,6 +14,10 @@ logger = logging.getLogger(__name__)
 class ImportModel(utilityBase.UtilityModuleBase):
     """Import model utility module."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ()
+    sharedFields = ()
+
     def __init__(self, rig, side: str = "", label: str = "", buildOrder: int = 3000, isMuted: bool = False,
                  mirror: bool = False, bypassProxiesOnly: bool = True, 
                  filePath: str = "", underGroup: str = None) -> None:
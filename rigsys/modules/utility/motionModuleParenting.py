@@ -13,6 +13,10 @@ logger = logging.getLogger(__name__)
 class MotionModuleParenting(UtilityModuleBase):
     """Motion module parenting utility module."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ()
+    sharedFields = ()
+
     def __init__(self, rig, side: str = "", label: str = "", buildOrder: int = 3000, isMuted: bool = False,
                  mirror: bool = False, bypassProxiesOnly: bool = False) -> None:
         """Initialize the module."""
@@ -14,6 +14,10 @@ class PythonCode(UtilityModuleBase):
 
     Takes in a path to a python file and executes it."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ()
+    sharedFields = ()
+
     def __init__(self, rig, pythonFile: str, label: str = "", buildOrder: int = 3000, isMuted: bool = False) -> None:
         side = "M"
         mirror = False
@@ -7,6 +7,10 @@ import rigsys.modules.moduleBase as moduleBase
 class UtilityModuleBase(moduleBase.ModuleBase):
     """Base class for utility modules."""
 
+    # Mirroring spec, see ModuleBase.doMirror
+    mirrorFields = ()
+    sharedFields = ()
+
     def __init__(self, rig, side: str = "", label: str = "", buildOrder: int = 3000,
                  isMuted: bool = False, mirror: bool = False, bypassProxiesOnly: bool = False) -> None:
         """Initialize the module."""
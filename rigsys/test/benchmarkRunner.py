@@ -0,0 +1,245 @@
+"""Measure how fast a built rig evaluates during playback.
+
+The benchmark builds a character, keys random animation on every control and times playback over a fixed frame range
+under each evaluation mode. The results are written to a JSON report that can be compared between rigsys versions.
+
+Example usage (within Maya):
+
+import rigsys.test.benchmarkRunner as benchmarkRunner
+from exampleCharacter import ExampleCharacter
+
+report = benchmarkRunner.runBenchmark(ExampleCharacter(), reportFile="C:/path/to/benchmark.json")
+
+# Later, with another version of rigsys
+benchmarkRunner.compareReports("C:/path/to/old.json", "C:/path/to/new.json")
+"""
+
+import json
+import logging
+import random
+import time
+
+import maya.cmds as cmds
+
+logger = logging.getLogger(__name__)
+
+EVALUATION_MODES = ["dg", "serial", "parallel", "cached"]
+
+
+def runBenchmark(rig, reportFile: str = "", startFrame: int = 1, endFrame: int = 120, modes: list = None,
+                 iterations: int = 3, seed: int = 0, build: bool = True, buildKwargs: dict = None) -> dict:
+    """Build a rig, animate its controls and measure playback speed for each evaluation mode.
+
+    Args:
+        rig (Rig): The rig to benchmark.
+        reportFile (str, optional): If given, the JSON report is written to this file. Defaults to "".
+        startFrame (int, optional): First frame of the measured range. Defaults to 1.
+        endFrame (int, optional): Last frame of the measured range. Defaults to 120.
+        modes (list, optional): Evaluation modes to measure, any of EVALUATION_MODES. Defaults to all of them.
+        iterations (int, optional): Number of timed passes per mode; the fastest is reported. Defaults to 3.
+        seed (int, optional): Random seed for the animation, so runs are repeatable. Defaults to 0.
+        build (bool, optional): If False, the rig is assumed to be built already. Defaults to True.
+        buildKwargs (dict, optional): Keyword arguments passed to rig.build(). Defaults to None.
+
+    Returns:
+        dict: The benchmark report.
+    """
+    if modes is None:
+        modes = EVALUATION_MODES
+    for mode in modes:
+        if mode not in EVALUATION_MODES:
+            raise ValueError(f"Unknown evaluation mode: {mode}")
+    if buildKwargs is None:
+        buildKwargs = {}
+
+    buildSeconds = None
+    if build:
+        start = time.perf_counter()
+        rig.build(**buildKwargs)
+        buildSeconds = time.perf_counter() - start
+
+    ctrls = getControls()
+    keyRandomAnimation(ctrls, startFrame, endFrame, seed=seed)
+
+    sessionState = getSessionState()
+    report = {
+        "rig": rig.name,
+        "rigsysVersion": getRigsysVersion(),
+        "mayaVersion": cmds.about(version=True),
+        "frameRange": [startFrame, endFrame],
+        "iterations": iterations,
+        "seed": seed,
+        "buildSeconds": buildSeconds,
+        "controlCount": len(ctrls),
+        "nodeCount": len(cmds.ls()),
+        "modes": {},
+    }
+
+    try:
+        for mode in modes:
+            logger.info(f"Measuring {mode} evaluation...")
+            report["modes"][mode] = measureMode(mode, startFrame, endFrame, iterations)
+    finally:
+        restoreSessionState(sessionState)
+
+    if reportFile:
+        with open(reportFile, "w") as file:
+            json.dump(report, file, indent=4)
+
+    return report
+
+
+def getControls() -> list:
+    """Return all control transforms in the scene."""
+    return cmds.ls("*_CTRL", type="transform") or []
+
+
+def keyRandomAnimation(ctrls: list, startFrame: int, endFrame: int, seed: int = 0, keyInterval: int = 10,
+                       translateRange: float = 1.0, rotateRange: float = 30.0) -> None:
+    """Key random values on the unlocked translate and rotate channels of the given controls."""
+    rng = random.Random(seed)
+    channels = [f"{attr}{axis}" for attr in ["translate", "rotate"] for axis in ["X", "Y", "Z"]]
+
+    for ctrl in ctrls:
+        for channel in channels:
+            plug = f"{ctrl}.{channel}"
+            if cmds.getAttr(plug, lock=True) or not cmds.getAttr(plug, keyable=True):
+                continue
+            if cmds.listConnections(plug, s=True, d=False):
+                continue
+
+            valueRange = translateRange if channel.startswith("translate") else rotateRange
+            restValue = cmds.getAttr(plug)
+            for frame in range(startFrame, endFrame + 1, keyInterval):
+                value = restValue + rng.uniform(-valueRange, valueRange)
+                cmds.setKeyframe(ctrl, at=channel, t=frame, v=value)
+
+
+def getSessionState() -> dict:
+    """Return the evaluation and playback settings the benchmark changes, see restoreSessionState."""
+    state = {
+        "evaluationMode": cmds.evaluationManager(q=True, mode=True)[0],
+        "cacheEnabled": None,
+        "currentTime": cmds.currentTime(q=True),
+        "playbackOptions": {option: cmds.playbackOptions(q=True, **{option: True})
+                            for option in ["min", "max", "playbackSpeed", "maxPlaybackSpeed", "loop"]},
+    }
+    try:
+        enabled = cmds.evaluator(name="cache", q=True, enable=True)
+        state["cacheEnabled"] = bool(enabled[0] if isinstance(enabled, list) else enabled)
+    except RuntimeError:
+        # Cached playback only exists in Maya 2019 and later
+        pass
+    return state
+
+
+def restoreSessionState(state: dict) -> None:
+    """Restore the settings returned by getSessionState."""
+    cmds.evaluationManager(mode=state["evaluationMode"])
+    if state["cacheEnabled"] is not None:
+        cmds.evaluator(name="cache", enable=state["cacheEnabled"])
+    cmds.playbackOptions(**state["playbackOptions"])
+    cmds.currentTime(state["currentTime"])
+
+
+def setEvaluationMode(mode: str) -> None:
+    """Switch Maya to the given evaluation mode."""
+    cached = mode == "cached"
+    if cached:
+        mode = "parallel"
+    elif mode == "dg":
+        mode = "off"
+
+    cmds.evaluationManager(mode=mode)
+    try:
+        cmds.evaluator(name="cache", enable=cached)
+    except RuntimeError:
+        # Cached playback only exists in Maya 2019 and later
+        if cached:
+            raise
+        return
+    if cached:
+        cmds.cacheEvaluator(resetCache=True)
+
+
+def measureMode(mode: str, startFrame: int, endFrame: int, iterations: int) -> dict:
+    """Time playback of the frame range in the given evaluation mode."""
+    setEvaluationMode(mode)
+    frameCount = endFrame - startFrame + 1
+
+    # One untimed pass to build the evaluation graph (and fill the cache in cached mode)
+    playRange(startFrame, endFrame)
+    if mode == "cached" and not cmds.about(batch=True):
+        cmds.cacheEvaluator(waitForCache=10)
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        playRange(startFrame, endFrame)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    return {
+        "fps": frameCount / best if best > 0 else 0.0,
+        "seconds": timings,
+        "frames": frameCount,
+    }
+
+
+def playRange(startFrame: int, endFrame: int) -> None:
+    """Evaluate every frame of the range as fast as possible."""
+    if cmds.about(batch=True):
+        # No playback in batch mode: step time and pull on the rig so every frame is evaluated
+        for frame in range(startFrame, endFrame + 1):
+            cmds.currentTime(frame, update=True)
+        return
+
+    cmds.playbackOptions(min=startFrame, max=endFrame, playbackSpeed=0, maxPlaybackSpeed=0, loop="once")
+    cmds.currentTime(startFrame)
+    cmds.play(wait=True)
+
+
+def getRigsysVersion() -> str:
+    """Return the installed rigsys version, if known."""
+    try:
+        from importlib.metadata import version
+        return version("rigsys")
+    except Exception:
+        return "unknown"
+
+
+def compareReports(baselineFile: str, currentFile: str) -> dict:
+    """Compare two benchmark reports.
+
+    Returns:
+        dict: For each mode present in both reports, the baseline and current fps and their ratio (current / baseline).
+    """
+    with open(baselineFile, "r") as file:
+        baseline = json.load(file)
+    with open(currentFile, "r") as file:
+        current = json.load(file)
+
+    comparison = {}
+    for mode, result in current["modes"].items():
+        if mode not in baseline["modes"]:
+            continue
+        baselineFps = baseline["modes"][mode]["fps"]
+        comparison[mode] = {
+            "baseline": baselineFps,
+            "current": result["fps"],
+            "ratio": result["fps"] / baselineFps if baselineFps else None,
+        }
+        logger.info(f"{mode}: {baselineFps:.1f} -> {result['fps']:.1f} fps")
+
+    return comparison
+
+
+if __name__ == "__main__":
+    import rigsys.api.api_rig as api_rig
+    import rigsys.modules.motion as motion
+
+    testRig = api_rig.Rig()
+    testRig.motionModules = {
+        "M_Root": motion.Root(testRig, side="M", label="Root"),
+    }
+    print(json.dumps(runBenchmark(testRig), indent=4))
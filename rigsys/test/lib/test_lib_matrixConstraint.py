@@ -0,0 +1,60 @@
+"""Unit tests for the matrixConstraint library."""
+
+
+import unittest
+
+import maya.cmds as cmds
+
+import rigsys.lib.matrixConstraint as matrixConstraint
+
+
+class TestMatrixConstraint(unittest.TestCase):
+    """Test the matrixConstraint library."""
+
+    def setUp(self) -> None:
+        cmds.file(new=True, force=True)
+
+        self.target = cmds.createNode("transform", n="target")
+        self.driven = cmds.createNode("joint", n="driven")
+        cmds.xform(self.target, ws=True, t=[1, 2, 3], ro=[0, 45, 0])
+
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        matrixConstraint.setEnabled(False)
+
+        return super().tearDown()
+
+    def test_disabled(self):
+        """When disabled, regular constraints are created."""
+        matrixConstraint.setEnabled(False)
+
+        ptc = matrixConstraint.parentConstraint(self.target, self.driven, n="driven_ptc", mo=0, interpType=2)[0]
+
+        self.assertEqual(cmds.nodeType(ptc), "parentConstraint")
+        self.assertEqual(cmds.getAttr(f"{ptc}.interpType"), 2)
+
+    def test_parentConstraint(self):
+        """When enabled, a matrix network drives the node instead of a constraint."""
+        matrixConstraint.setEnabled(True)
+
+        node = matrixConstraint.parentConstraint(self.target, self.driven, n="driven_ptc", mo=0, interpType=2)[0]
+
+        self.assertEqual(cmds.nodeType(node), "multMatrix")
+        self.assertFalse(cmds.ls(type="constraint"))
+
+        translation = cmds.xform(self.driven, q=True, ws=True, t=True)
+        for value, expected in zip(translation, [1, 2, 3]):
+            self.assertAlmostEqual(value, expected, places=4)
+
+    def test_maintainOffset(self):
+        """Maintain offset keeps the driven node in place."""
+        matrixConstraint.setEnabled(True)
+        cmds.xform(self.driven, ws=True, t=[5, 0, 0])
+
+        matrixConstraint.parentConstraint(self.target, self.driven, mo=True)
+        matrixConstraint.scaleConstraint(self.target, self.driven, mo=True)
+
+        translation = cmds.xform(self.driven, q=True, ws=True, t=True)
+        for value, expected in zip(translation, [5, 0, 0]):
+            self.assertAlmostEqual(value, expected, places=4)
@@ -0,0 +1,54 @@
+"""Unit tests for the nurbs library."""
+
+
+import unittest
+
+import maya.cmds as cmds
+
+import rigsys.lib.nurbs as nurbs
+import rigsys.utils.componentCodec as componentCodec
+
+
+class TestNurbs(unittest.TestCase):
+    """Test the nurbs library."""
+
+    def setUp(self) -> None:
+        cmds.file(new=True, force=True)
+
+        self.surface = cmds.nurbsPlane(n="surface", u=4, v=1, ch=False)[0]
+        self.surfaceShape = cmds.listRelatives(self.surface, s=True)[0]
+
+        return super().setUp()
+
+    def test_componentIndices(self):
+        """Counts and index grids match what cmds reports, without changing the selection."""
+        cmds.select(clear=True)
+        cvs = cmds.ls(f"{self.surfaceShape}.cv[*][*]", flatten=True)
+
+        counts = nurbs.getComponentCounts(self.surfaceShape)
+        grid = nurbs.getComponentIndices(self.surfaceShape)
+
+        self.assertEqual(counts[0] * counts[1], len(cvs))
+        self.assertEqual(grid.shape, (counts[0], counts[1], 2))
+        self.assertEqual(cmds.ls(sl=True), [])
+        self.assertEqual(len(cmds.ls(nurbs.getComponentNames(self.surfaceShape), flatten=True)), len(cvs))
+
+    def test_returnNurbsCVs(self):
+        """The per-component names are unchanged."""
+        cvs = nurbs.returnNurbsCVs(self.surface)
+        rows = nurbs.returnNurbsCVs(self.surface, orderRows=True, direction="v")
+
+        self.assertEqual(cvs[1], f"{self.surfaceShape}.cv[0][1]")
+        self.assertEqual(rows[0][1], f"{self.surface}.cv[1][0]")
+
+    def test_compact(self):
+        """Compact range names cover the same components as the per-component names."""
+        cvs = nurbs.returnNurbsCVs(self.surface)
+        compact = nurbs.returnNurbsCVs(self.surface, compact=True)
+        rows = nurbs.returnNurbsCVs(self.surface, orderRows=True, direction="v", compact=True)
+
+        self.assertEqual(len(compact), 1)
+        self.assertEqual(cmds.ls(compact, flatten=True), cmds.ls(cvs, flatten=True))
+        grid = nurbs.getComponentIndices(self.surfaceShape).reshape(-1, 2)
+        self.assertEqual(componentCodec.decode(compact)[2].tolist(), grid.tolist())
+        self.assertEqual(len(rows), nurbs.getComponentCounts(self.surfaceShape)[1])
@@ -0,0 +1,41 @@
+"""Unit tests for the proxy library."""
+
+
+import unittest
+
+import maya.cmds as cmds
+
+import rigsys.lib.proxy as proxy
+
+
+class TestProxy(unittest.TestCase):
+    """Test the proxy library."""
+
+    def setUp(self) -> None:
+        cmds.file(new=True, force=True)
+        cmds.createNode("transform", n="proxies")
+
+        # Children listed before their parents
+        self.proxies = [
+            proxy.Proxy(side="L", label="Hand", name="Finger0_1", parent="Finger0_0", position=[3, 1, 0],
+                        rotation=[0, 0, 20]),
+            proxy.Proxy(side="L", label="Hand", name="Finger0_0", parent="Root", position=[2, 1, 0],
+                        rotation=[0, 45, 0]),
+            proxy.Proxy(side="L", label="Hand", name="Root", position=[1, 1, 0], rotation=[10, 20, 30]),
+        ]
+
+        return super().setUp()
+
+    def test_buildProxies(self):
+        """Batched proxies match their world transforms and hierarchy."""
+        names = proxy.buildProxies(self.proxies)
+
+        self.assertEqual(names, ["L_Hand_Root_proxy", "L_Hand_Finger0_0_proxy", "L_Hand_Finger0_1_proxy"])
+        self.assertEqual(cmds.listRelatives("L_Hand_Root_proxy", parent=True), ["L_Hand_proxyMODULE"])
+        self.assertEqual(cmds.listRelatives("L_Hand_Finger0_1_proxy", parent=True), ["L_Hand_Finger0_0_proxy"])
+
+        for prx in self.proxies:
+            position = cmds.xform(prx.getSceneName(), q=True, ws=True, t=True)
+            rotation = cmds.xform(prx.getSceneName(), q=True, ws=True, ro=True)
+            for value, expected in zip(position + rotation, prx.position + prx.rotation):
+                self.assertAlmostEqual(value, expected, places=4)
@@ -0,0 +1,54 @@
+"""Unit tests for the proxyData library."""
+
+
+import copy
+import unittest
+
+import rigsys.lib.proxyData as proxyData
+
+
+def _proxy(x, rotation=0.0):
+    return {"position": [x, 0.0, 0.0], "rotation": [rotation, 0.0, 0.0]}
+
+
+class TestProxyData(unittest.TestCase):
+    """Test the proxyData library."""
+
+    def setUp(self) -> None:
+        self.base = {
+            "M_Root": {"Root": _proxy(0.0)},
+            "L_Arm": {"Shoulder": _proxy(1.0), "Elbow": _proxy(2.0), "Wrist": _proxy(3.0)},
+        }
+        self.ours = copy.deepcopy(self.base)
+        self.theirs = copy.deepcopy(self.base)
+
+        return super().setUp()
+
+    def test_diff(self):
+        """Moved, added and removed proxies are reported; changes within tolerance are not."""
+        self.ours["L_Arm"]["Shoulder"] = _proxy(1.5)
+        self.ours["L_Arm"]["Hand"] = _proxy(4.0)
+        self.ours["M_Root"]["Root"] = _proxy(0.00001)
+        del self.ours["L_Arm"]["Wrist"]
+
+        changes = proxyData.diff(self.base, self.ours)
+
+        self.assertEqual(list(changes["modules"]), ["L_Arm"])
+        self.assertEqual(changes["modules"]["L_Arm"]["added"], ["Hand"])
+        self.assertEqual(changes["modules"]["L_Arm"]["removed"], ["Wrist"])
+        self.assertAlmostEqual(changes["modules"]["L_Arm"]["changed"]["Shoulder"]["position"], 0.5)
+        self.assertTrue(proxyData.isEmpty(proxyData.diff(self.base, copy.deepcopy(self.base))))
+
+    def test_merge(self):
+        """Changes from both sides are combined, and proxies changed differently on both sides are conflicts."""
+        self.ours["L_Arm"]["Shoulder"] = _proxy(1.5)
+        self.theirs["L_Arm"]["Elbow"] = _proxy(2.5, 10.0)
+        self.ours["L_Arm"]["Wrist"] = _proxy(3.1)
+        self.theirs["L_Arm"]["Wrist"] = _proxy(3.2)
+
+        merged, conflicts = proxyData.merge(self.base, self.ours, self.theirs)
+
+        self.assertEqual(merged["L_Arm"]["Shoulder"], _proxy(1.5))
+        self.assertEqual(merged["L_Arm"]["Elbow"], _proxy(2.5, 10.0))
+        self.assertEqual(merged["L_Arm"]["Wrist"], _proxy(3.1))
+        self.assertEqual(conflicts, [("L_Arm", "Wrist")])
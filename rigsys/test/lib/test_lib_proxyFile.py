@@ -0,0 +1,69 @@
+"""Unit tests for the proxyFile library."""
+
+
+import os
+import tempfile
+import unittest
+
+import rigsys.lib.proxyFile as proxyFile
+
+
+class TestProxyFile(unittest.TestCase):
+    """Test the proxyFile library."""
+
+    def setUp(self) -> None:
+        self.proxyData = {
+            "M_Root": {"Root": {"position": [0.0, 1.0, 0.0], "rotation": [0.0, 0.0, 0.0]}},
+            "L_Arm": {
+                "Shoulder": {"position": [2.0, 10.0, 0.5], "rotation": [10.0, 20.0, 30.0]},
+                "Elbow": {"position": [5.0, 10.0, 0.0], "rotation": [0.0, -15.0, 0.0]},
+            },
+            "R_Arm": {
+                "Shoulder": {"position": [-2.0, 10.0, 0.5], "rotation": [-10.0, -20.0, -30.0]},
+                "Elbow": {"position": [-5.0, 10.0, 0.0], "rotation": [0.0, 15.0, 0.0]},
+            },
+        }
+        self.tempDir = tempfile.mkdtemp()
+
+        return super().setUp()
+
+    def test_roundTrip(self):
+        """Both formats read back the same proxy data, and mirrored modules are stored once."""
+        npzFile = os.path.join(self.tempDir, "proxyData.npz")
+        jsonFile = os.path.join(self.tempDir, "proxyData.json")
+        proxyFile.write(npzFile, self.proxyData)
+        proxyFile.convert(npzFile, jsonFile)
+
+        self.assertEqual(proxyFile.readHeader(npzFile)["modules"]["R_Arm"]["mirrorOf"], "L_Arm")
+        self.assertEqual(proxyFile.load(npzFile).toDict(), self.proxyData)
+        self.assertEqual(proxyFile.load(jsonFile).toDict(), self.proxyData)
+
+    def test_lazyLoad(self):
+        """Modules are only read when accessed, and unknown modules raise a KeyError."""
+        fileName = os.path.join(self.tempDir, "proxyData.npz")
+        proxyFile.write(fileName, self.proxyData)
+
+        store = proxyFile.load(fileName)
+        self.assertEqual(store.getProxyKeys("L_Arm"), ["Shoulder", "Elbow"])
+        self.assertEqual(store["R_Arm"]["Elbow"]["rotation"], [0.0, 15.0, 0.0])
+        self.assertEqual(list(store._cache), ["R_Arm"])
+        with self.assertRaises(KeyError):
+            store["L_Leg"]
+
+    def test_validate(self):
+        """Orphaned and missing entries are reported, and restricted stores only expose the given modules."""
+        fileName = os.path.join(self.tempDir, "proxyData.npz")
+        proxyFile.write(fileName, self.proxyData)
+        store = proxyFile.load(fileName)
+
+        report = proxyFile.validate(store, {"L_Arm": ["Shoulder", "Wrist"], "R_Arm": ["Shoulder", "Elbow"],
+                                            "L_Leg": ["Hip"]})
+        self.assertEqual(report["orphanedModules"], ["M_Root"])
+        self.assertEqual(report["missingModules"], ["L_Leg"])
+        self.assertEqual(report["orphanedProxies"], {"L_Arm": ["Elbow"]})
+        self.assertEqual(report["missingProxies"], {"L_Arm": ["Wrist"]})
+
+        restricted = store.restrict(["R_Arm", "L_Leg"])
+        self.assertEqual(list(restricted), ["R_Arm"])
+        self.assertEqual(restricted["R_Arm"], self.proxyData["R_Arm"])
+        self.assertNotIn("L_Arm", restricted)
@@ -0,0 +1,111 @@
+"""Unit tests for the proxySession library."""
+
+
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import maya.cmds as cmds
+
+import rigsys.api.api_rig as api_rig
+import rigsys.lib.proxySession as proxySession
+import rigsys.modules.motion as motion
+
+
+class TestProxySession(unittest.TestCase):
+    """Test the proxySession library."""
+
+    def setUp(self) -> None:
+        cmds.file(new=True, force=True)
+        cmds.createNode("transform", n="proxies")
+
+        self.rig = api_rig.Rig()
+        self.rig.motionModules = {
+            "L_Arm": motion.Limb(self.rig, side="L", label="Arm"),
+            "M_Other": motion.TestMotionModule(self.rig, side="M", label="Other"),
+        }
+        for module in self.rig.motionModules.values():
+            module.buildProxies()
+
+        self.fileName = os.path.join(tempfile.mkdtemp(), "proxies.npz")
+        self.session = proxySession.ProxySession(self.rig, self.fileName)
+        self.session.start()
+        self.session.dirty.clear()
+
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.session.stop()
+        return super().tearDown()
+
+    def move(self, sceneName: str, x: float) -> None:
+        """Move a proxy and evaluate the world matrices below it."""
+        cmds.setAttr(f"{sceneName}.translateX", x)
+        cmds.getAttr("L_Arm_End_proxy.worldMatrix[0]")
+
+    def test_dirty(self):
+        """Moving a proxy marks only it and its descendants dirty."""
+        self.move("L_Arm_Mid_proxy", 4.0)
+
+        self.assertEqual(self.session.dirty, {"L_Arm_Mid_proxy", "L_Arm_End_proxy"})
+
+    def test_flush(self):
+        """flush reads the dirty proxies only."""
+        untouched = {"position": [9.0, 9.0, 9.0], "rotation": [0.0, 0.0, 0.0]}
+        self.session.proxyData["L_Arm"]["Root"] = untouched
+        self.move("L_Arm_End_proxy", 4.0)
+
+        self.assertEqual(self.session.flush(), 1)
+        self.assertEqual(self.session.dirty, set())
+        self.assertIs(self.session.proxyData["L_Arm"]["Root"], untouched)
+        position = cmds.xform("L_Arm_End_proxy", query=True, worldSpace=True, translation=True)
+        for value, expected in zip(self.session.proxyData["L_Arm"]["End"]["position"], position):
+            self.assertAlmostEqual(value, expected, places=4)
+
+    def test_stop(self):
+        """stop removes the callbacks and cancels a pending autosave."""
+        self.session.autosaveDelay = 60.0
+        self.move("L_Arm_Mid_proxy", 4.0)
+        timer = self.session._timer
+        self.assertIsNotNone(timer)
+
+        self.session.stop()
+        self.session.dirty.clear()
+        self.move("L_Arm_Mid_proxy", 5.0)
+
+        self.assertFalse(self.session.isActive)
+        self.assertIsNone(self.session._timer)
+        self.assertTrue(timer.finished.is_set())
+        self.assertEqual(self.session.dirty, set())
+
+    def test_autosave(self):
+        """The autosave waits again while edits continue, and saves once they stop."""
+        self.session.autosaveDelay = 60.0
+
+        with mock.patch.object(self.session, "save") as save:
+            self.session._lastEdit = time.monotonic()
+            self.session._onAutosave()
+            self.assertIsNotNone(self.session._timer)
+            save.assert_not_called()
+
+            self.session._timer.cancel()
+            self.session._lastEdit = time.monotonic() - 120.0
+            self.session._onAutosave()
+            self.assertIsNone(self.session._timer)
+            save.assert_called_once()
+
+    def test_rotateOrder(self):
+        """Rotations are read in the proxy's rotate order, as xform returns them."""
+        cmds.setAttr("L_Arm_Root_proxy.rotateOrder", 2)
+        cmds.setAttr("L_Arm_Root_proxy.rotate", 10.0, 20.0, 30.0)
+
+        transform = proxySession.getProxyTransform("L_Arm_Root_proxy")
+        rotation = cmds.xform("L_Arm_Root_proxy", query=True, worldSpace=True, rotation=True)
+        for value, expected in zip(transform["rotation"], rotation):
+            self.assertAlmostEqual(value, expected, places=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Unit tests for the ribbon library."""
+
+
+import unittest
+from unittest import mock
+
+import rigsys.lib.ribbon as ribbon
+
+
+class TestRibbon(unittest.TestCase):
+    """Test the ribbon library, with maya.cmds mocked."""
+
+    def setUp(self) -> None:
+        patcher = mock.patch.object(ribbon, "cmds")
+        self.cmds = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.cmds.about.return_value = ribbon._UV_PIN_API_VERSION
+        self.cmds.listRelatives.return_value = ["ribbonShape"]
+        self.cmds.createNode.side_effect = lambda nodeType, n, **kwargs: n
+
+        return super().setUp()
+
+    def test_ribbonParameters(self):
+        """Parameters are spaced evenly from u=0 to u=1, and a single one sits at u=0."""
+        self.assertEqual(ribbon.ribbonParameters(3, v=0.25), [(0.0, 0.25), (0.5, 0.25), (1.0, 0.25)])
+        self.assertEqual(ribbon.ribbonParameters(1), [(0.0, 0.5)])
+
+    def test_hasUvPin(self):
+        """uvPin is only reported on Maya 2020 and later."""
+        self.assertTrue(ribbon.hasUvPin())
+        self.cmds.about.return_value = ribbon._UV_PIN_API_VERSION - 1
+        self.assertFalse(ribbon.hasUvPin())
+
+    def test_pinSelection(self):
+        """uvPin is used when requested and available, and follicles otherwise."""
+        cases = [
+            (True, ribbon._UV_PIN_API_VERSION, "_pinWithUvPin"),
+            (False, ribbon._UV_PIN_API_VERSION, "_pinWithFollicles"),
+            (True, ribbon._UV_PIN_API_VERSION - 1, "_pinWithFollicles"),
+        ]
+        for useUvPin, apiVersion, expected in cases:
+            self.cmds.about.return_value = apiVersion
+            with mock.patch.object(ribbon, "_pinWithUvPin") as uvPin, \
+                    mock.patch.object(ribbon, "_pinWithFollicles") as follicles:
+                ribbon.pinToSurface("ribbon", [(0.0, 0.5)], "L_Arm", useUvPin=useUvPin)
+
+            used = {"_pinWithUvPin": uvPin, "_pinWithFollicles": follicles}
+            for name, pin in used.items():
+                self.assertEqual(pin.called, name == expected, f"useUvPin={useUvPin}, apiVersion={apiVersion}")
+
+    def test_uvPinAxes(self):
+        """The uvPin matches follicle orientation, and drives each pin at its parameters."""
+        pins = ribbon.pinToSurface("ribbon", [(0.0, 0.5), (1.0, 0.5)], "L_Arm", token="_upper", parent="L_Arm_grp")
+
+        self.assertEqual(pins, ["L_Arm_0_upper_pin", "L_Arm_1_upper_pin"])
+        self.cmds.setAttr.assert_any_call("L_Arm_upper_uvPin.tangentAxis", 0)
+        self.cmds.setAttr.assert_any_call("L_Arm_upper_uvPin.normalAxis", 2)
+        self.cmds.setAttr.assert_any_call("L_Arm_upper_uvPin.coordinate[1].coordinateU", 1.0)
+        self.cmds.connectAttr.assert_any_call("ribbonShape.worldSpace[0]", "L_Arm_upper_uvPin.deformedGeometry")
+        self.cmds.connectAttr.assert_any_call("L_Arm_upper_uvPin.outputMatrix[1]",
+                                              "L_Arm_1_upper_pin.offsetParentMatrix")
+        self.cmds.createNode.assert_any_call("transform", n="L_Arm_0_upper_pin", p="L_Arm_grp")
+
+    def test_follicleFallback(self):
+        """Follicles are driven by the surface and parented afterwards."""
+        self.cmds.about.return_value = ribbon._UV_PIN_API_VERSION - 1
+        pins = ribbon.pinToSurface("ribbon", [(0.25, 0.5)], "L_Arm", parent="L_Arm_grp")
+
+        self.assertEqual(pins, ["L_Arm_0_fol"])
+        self.cmds.connectAttr.assert_any_call("ribbonShape.local", "L_Arm_0_folShape.inputSurface", f=True)
+        self.cmds.connectAttr.assert_any_call("L_Arm_0_folShape.outTranslate", "L_Arm_0_fol.translate", f=True)
+        self.cmds.setAttr.assert_any_call("L_Arm_0_folShape.parameterU", 0.25)
+        self.cmds.parent.assert_called_once_with("L_Arm_0_fol", "L_Arm_grp")
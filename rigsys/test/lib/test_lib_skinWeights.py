@@ -0,0 +1,176 @@
+"""Unit tests for the skinWeights library."""
+
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import maya.cmds as cmds
+
+import rigsys.lib.skinWeights as skinWeights
+
+
+class TestSkinWeights(unittest.TestCase):
+    """Test the skinWeights library."""
+
+    def setUp(self) -> None:
+        cmds.file(new=True, force=True)
+
+        self.mesh = cmds.polyCylinder(n="body", sy=4)[0]
+        cmds.select(clear=True)
+        self.joints = [cmds.joint(n="jointA", p=[0, -1, 0]), cmds.joint(n="jointB", p=[0, 1, 0])]
+        self.skinCluster = cmds.skinCluster(self.joints, self.mesh, n="body_scls", tsb=True)[0]
+
+        self.tempDir = tempfile.mkdtemp()
+
+        return super().setUp()
+
+    def test_roundTrip(self):
+        """Exported weights are restored on import."""
+        data = skinWeights.getWeightData(self.skinCluster)
+        fileName = skinWeights.getWeightFile(self.tempDir, self.mesh)
+        skinWeights.exportWeights(self.skinCluster, fileName)
+
+        cmds.skinPercent(self.skinCluster, f"{self.mesh}.vtx[*]", tv=[("jointA", 1.0)])
+        skinWeights.importWeights(self.skinCluster, fileName)
+
+        restored = skinWeights.getWeightData(self.skinCluster)
+        self.assertEqual(restored.influences, data.influences)
+        self.assertTrue(abs(restored.weights - data.weights).max() < 1e-6)
+
+    def test_quantized(self):
+        """Quantized sparse files restore normalized weights within the quantization error."""
+        data = skinWeights.getWeightData(self.skinCluster)
+        fileName = skinWeights.getWeightFile(self.tempDir, self.mesh)
+        skinWeights.exportWeights(self.skinCluster, fileName, quantizeType="uint16")
+        skinWeights.importWeights(self.skinCluster, fileName)
+
+        restored = skinWeights.getWeightData(self.skinCluster)
+        self.assertTrue(abs(restored.weights - data.weights).max() < 1e-4)
+        self.assertTrue(abs(restored.weights.sum(axis=1) - 1.0).max() < 1e-6)
+
+    def test_mappedChunks(self):
+        """.wmap files round trip in chunks, and partial loads only touch the requested vertex range."""
+        data = skinWeights.getWeightData(self.skinCluster)
+        fileName = skinWeights.getWeightFile(self.tempDir, self.mesh, extension=".wmap")
+        skinWeights.exportWeights(self.skinCluster, fileName, chunkSize=7)
+
+        cmds.skinPercent(self.skinCluster, f"{self.mesh}.vtx[*]", tv=[("jointA", 1.0)])
+        skinWeights.importWeights(self.skinCluster, fileName, chunkSize=7, vertexRange=(0, 10))
+
+        restored = skinWeights.getWeightData(self.skinCluster)
+        self.assertTrue(abs(restored.weights[:10] - data.weights[:10]).max() < 1e-6)
+        self.assertTrue((restored.weights[10:, 0] == 1.0).all())
+
+        skinWeights.importWeights(self.skinCluster, fileName, chunkSize=7)
+        restored = skinWeights.getWeightData(self.skinCluster)
+        self.assertTrue(abs(restored.weights - data.weights).max() < 1e-6)
+
+    def test_closestPoint(self):
+        """Weights transfer by position onto a mesh with different topology."""
+        fileName = skinWeights.getWeightFile(self.tempDir, self.mesh)
+        skinWeights.exportWeights(self.skinCluster, fileName)
+
+        target = cmds.polyCylinder(n="bodyDense", sy=9)[0]
+        skinCluster = cmds.skinCluster(self.joints, target, n="bodyDense_scls", tsb=True)[0]
+        cmds.skinPercent(skinCluster, f"{target}.vtx[*]", tv=[("jointA", 1.0)])
+        skinWeights.importWeights(skinCluster, fileName, method="closestPoint")
+
+        weights = skinWeights.getWeightData(skinCluster).reorder(["jointA", "jointB"]).weights
+        self.assertTrue(abs(weights.sum(axis=1) - 1.0).max() < 1e-6)
+        # The top cap follows jointB, which it did not before the transfer
+        self.assertTrue(weights[:, 1].max() > 0.5)
+
+    def test_delta(self):
+        """Delta saves write only changed vertices, and imports apply the patch chain."""
+        fileName = skinWeights.getWeightFile(self.tempDir, self.mesh)
+        skinWeights.exportWeights(self.skinCluster, fileName)
+
+        cmds.skinPercent(self.skinCluster, f"{self.mesh}.vtx[3]", tv=[("jointB", 1.0)])
+        data = skinWeights.getWeightData(self.skinCluster)
+        skinWeights.exportWeights(self.skinCluster, fileName, delta=True)
+        self.assertTrue(os.path.exists(fileName.replace(".npz", ".patch001.npz")))
+
+        cmds.skinPercent(self.skinCluster, f"{self.mesh}.vtx[*]", tv=[("jointA", 1.0)])
+        skinWeights.importWeights(self.skinCluster, fileName)
+        restored = skinWeights.getWeightData(self.skinCluster)
+        self.assertTrue(abs(restored.weights - data.weights).max() < 1e-6)
+
+        skinWeights.squashWeights(fileName)
+        self.assertFalse(os.path.exists(fileName.replace(".npz", ".patch001.npz")))
+
+    def test_skipUnchanged(self):
+        """Imports are skipped while the skinCluster holds the weights of the file, and repeated after edits."""
+        fileName = skinWeights.getWeightFile(self.tempDir, self.mesh)
+        skinWeights.exportWeights(self.skinCluster, fileName)
+
+        self.assertTrue(skinWeights.importWeights(self.skinCluster, fileName, skipUnchanged=True))
+        self.assertFalse(skinWeights.importWeights(self.skinCluster, fileName, skipUnchanged=True))
+
+        skinWeights.cleanSkinWeights(self.skinCluster, maxInfluences=1)
+        self.assertTrue(skinWeights.importWeights(self.skinCluster, fileName, skipUnchanged=True))
+
+    def test_skipUnchangedRepaint(self):
+        """Weights painted by hand after an import are detected, and the import is repeated."""
+        data = skinWeights.getWeightData(self.skinCluster)
+        fileName = skinWeights.getWeightFile(self.tempDir, self.mesh)
+        skinWeights.exportWeights(self.skinCluster, fileName)
+        self.assertTrue(skinWeights.importWeights(self.skinCluster, fileName, skipUnchanged=True))
+
+        cmds.skinPercent(self.skinCluster, f"{self.mesh}.vtx[0]", tv=[("jointA", 1.0)])
+        self.assertTrue(skinWeights.importWeights(self.skinCluster, fileName, skipUnchanged=True))
+
+        restored = skinWeights.getWeightData(self.skinCluster)
+        self.assertTrue(abs(restored.weights - data.weights).max() < 1e-6)
+
+    def test_skipUnchangedBatch(self):
+        """Batch imports share digests with single imports and skip the skinClusters that hold their weights."""
+        fileName = skinWeights.getWeightFile(self.tempDir, self.mesh)
+        skinWeights.exportWeights(self.skinCluster, fileName)
+        self.assertTrue(skinWeights.importWeights(self.skinCluster, fileName, skipUnchanged=True))
+
+        with mock.patch.object(skinWeights, "setWeightData") as setWeightData:
+            skinWeights.importWeightsBatch([(self.skinCluster, fileName)], skipUnchanged=True)
+            setWeightData.assert_not_called()
+
+            skinWeights.importWeightsBatch([(self.skinCluster, fileName)])
+            setWeightData.assert_called_once()
+
+        cmds.skinPercent(self.skinCluster, f"{self.mesh}.vtx[0]", tv=[("jointA", 1.0)])
+        with mock.patch.object(skinWeights, "setWeightData") as setWeightData:
+            skinWeights.importWeightsBatch([(self.skinCluster, fileName)], skipUnchanged=True)
+            setWeightData.assert_called_once()
+
+    def test_influenceOrder(self):
+        """Weights are remapped by influence name when the influence order differs."""
+        data = skinWeights.getWeightData(self.skinCluster)
+        fileName = skinWeights.getWeightFile(self.tempDir, self.mesh)
+        skinWeights.exportWeights(self.skinCluster, fileName)
+
+        cmds.delete(self.skinCluster)
+        skinCluster = cmds.skinCluster(list(reversed(self.joints)), self.mesh, n="body_scls", tsb=True)[0]
+        skinWeights.importWeights(skinCluster, fileName)
+
+        restored = skinWeights.getWeightData(skinCluster).reorder(data.influences)
+        self.assertTrue(abs(restored.weights - data.weights).max() < 1e-6)
+
+    def test_jsonFallback(self):
+        """deformerWeights JSON files are still found and imported."""
+        fileName = skinWeights.getWeightFile(self.tempDir, self.mesh, extension=".json")
+        skinWeights.exportWeights(self.skinCluster, fileName)
+
+        self.assertEqual(skinWeights.findWeightFile(self.tempDir, self.mesh), fileName)
+        skinWeights.importWeights(self.skinCluster, fileName)
+        self.assertTrue(os.path.exists(fileName))
+
+    def test_findPreferredFormat(self):
+        """A file of the requested format is found before a stale file of another format."""
+        fileName = skinWeights.getWeightFile(self.tempDir, self.mesh, extension=".json")
+        skinWeights.exportWeights(self.skinCluster, fileName)
+        stale = skinWeights.getWeightFile(self.tempDir, self.mesh)
+        skinWeights.exportWeights(self.skinCluster, stale)
+
+        self.assertEqual(skinWeights.findWeightFile(self.tempDir, self.mesh), stale)
+        self.assertEqual(skinWeights.findWeightFile(self.tempDir, self.mesh, extension=".json"), fileName)
+        self.assertEqual(skinWeights.findWeightFile(self.tempDir, self.mesh, extension=".wmap"), stale)
@@ -0,0 +1,44 @@
+"""Unit tests for the weightFile library."""
+
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import rigsys.lib.weightFile as weightFile
+
+
+class TestWeightFile(unittest.TestCase):
+    """Test the weightFile library."""
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        weights = rng.random((200, 6)) ** 4
+        weights /= weights.sum(axis=1, keepdims=True)
+        self.data = weightFile.WeightData(weights, [f"joint{i}" for i in range(6)], {"normalizeWeights": 1})
+        self.fileName = os.path.join(tempfile.mkdtemp(), "body_scls.npz")
+
+        return super().setUp()
+
+    def test_patchQuantizedBase(self):
+        """Patches on a quantized, influence capped baseline only hold the rows that changed."""
+        weightFile.write(self.fileName, self.data, maxInfluences=2, quantizeType="uint16")
+
+        current = weightFile.WeightData(self.data.weights.copy(), self.data.influences, self.data.header)
+        current.weights[[3, 50, 120]] = np.eye(6)[0]
+        patchFile = weightFile.getNextPatchFile(self.fileName)
+        rowCount = weightFile.writePatch(patchFile, weightFile.readChain(self.fileName), current)
+        self.assertEqual(rowCount, 3)
+
+        chain = weightFile.readChain(self.fileName)
+        np.testing.assert_allclose(chain.weights[[3, 50, 120]], current.weights[[3, 50, 120]], atol=1e-6)
+
+        # Nothing changed since the patch
+        patchFile = weightFile.getNextPatchFile(self.fileName)
+        self.assertEqual(weightFile.writePatch(patchFile, chain, current), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Unit tests for the weightMirror library."""
+
+
+import tempfile
+import unittest
+from unittest import mock
+
+import maya.cmds as cmds
+
+import rigsys.lib.skinWeights as skinWeights
+import rigsys.lib.weightMirror as weightMirror
+
+
+class TestWeightMirror(unittest.TestCase):
+    """Test the weightMirror library."""
+
+    def setUp(self) -> None:
+        cmds.file(new=True, force=True)
+
+        self.mesh = cmds.polyPlane(n="body", sx=6, sy=2)[0]
+        cmds.select(clear=True)
+        self.joints = [cmds.joint(n="M_Root")]
+        for side, x in (("L", 0.4), ("R", -0.4)):
+            cmds.select(clear=True)
+            self.joints.append(cmds.joint(n=f"{side}_Arm", p=[x, 0, 0]))
+        self.skinCluster = cmds.skinCluster(self.joints, self.mesh, n="body_scls", tsb=True)[0]
+        cmds.skinPercent(self.skinCluster, f"{self.mesh}.vtx[*]", tv=[("M_Root", 1.0)])
+
+        self.cacheDir = tempfile.mkdtemp()
+
+        return super().setUp()
+
+    def test_mirrorSkinWeights(self):
+        """Weights on the +X side are copied to the -X side with L_ and R_ influences swapped."""
+        data = skinWeights.getWeightData(self.skinCluster)
+        positive = data.positions[:, 0] > 1e-3
+        negative = data.positions[:, 0] < -1e-3
+        cmds.skinPercent(self.skinCluster, [f"{self.mesh}.vtx[{i}]" for i in positive.nonzero()[0]],
+                         tv=[("L_Arm", 1.0)])
+
+        weightMirror.mirrorSkinWeights(self.skinCluster, cacheDir=self.cacheDir)
+
+        weights = skinWeights.getWeightData(self.skinCluster).reorder(["M_Root", "L_Arm", "R_Arm"]).weights
+        self.assertTrue((abs(weights[negative, 2] - 1.0) < 1e-6).all())
+        self.assertTrue((abs(weights[positive, 1] - 1.0) < 1e-6).all())
+
+    def test_cachedSymmetryMap(self):
+        """The symmetry map is cached on disk by topology hash."""
+        first = weightMirror.getSymmetryMap(self.skinCluster, cacheDir=self.cacheDir)
+        weightMirror._symmetryMaps.clear()
+        second = weightMirror.getSymmetryMap(self.skinCluster, cacheDir=self.cacheDir)
+
+        self.assertEqual(first.tolist(), second.tolist())
+
+    def test_symmetryMapTolerance(self):
+        """Symmetry maps computed with one tolerance are not reused for another."""
+        weightMirror.getSymmetryMap(self.skinCluster, tolerance=1e-1, cacheDir=self.cacheDir)
+        weightMirror._symmetryMaps.clear()
+
+        with mock.patch.object(weightMirror, "computeSymmetryMap", wraps=weightMirror.computeSymmetryMap) as compute:
+            weightMirror.getSymmetryMap(self.skinCluster, tolerance=1e-6, cacheDir=self.cacheDir)
+            weightMirror.getSymmetryMap(self.skinCluster, tolerance=1e-1, cacheDir=self.cacheDir)
+
+        self.assertEqual(compute.call_count, 1)
+        self.assertEqual(compute.call_args[0][2], 1e-6)
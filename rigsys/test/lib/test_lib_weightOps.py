@@ -0,0 +1,34 @@
+"""Unit tests for the weightOps library."""
+
+
+import unittest
+
+import numpy as np
+
+import rigsys.lib.weightFile as weightFile
+import rigsys.lib.weightOps as weightOps
+
+
+class TestWeightOps(unittest.TestCase):
+    """Test the weightOps library."""
+
+    def setUp(self) -> None:
+        self.data = weightFile.WeightData(
+            np.array([[0.5, 0.25, 0.25, 0.0], [0.2, 0.2, 0.2, 0.4]]),
+            ["jointA", "jointB", "jointC", "jointD"],
+        )
+
+        return super().setUp()
+
+    def test_remapInfluences(self):
+        """Renamed influences keep their weights, merged ones are summed and dropped ones are redistributed."""
+        data = weightOps.remapInfluences(self.data, {"jointA": "jointE", "jointC": "jointB", "jointD": None})
+
+        self.assertEqual(data.influences, ["jointE", "jointB"])
+        self.assertTrue(np.allclose(data.weights, [[0.5, 0.5], [1.0 / 3.0, 2.0 / 3.0]]))
+
+    def test_cleanWeights(self):
+        """Weights are pruned, capped and normalized without touching locked influences."""
+        data = weightOps.cleanWeights(self.data, threshold=0.21, maxInfluences=2, locked=["jointC"])
+
+        self.assertTrue(np.allclose(data.weights, [[0.75, 0.0, 0.25, 0.0], [0.0, 0.0, 0.2, 0.8]]))
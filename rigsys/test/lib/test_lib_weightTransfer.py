@@ -0,0 +1,49 @@
+"""Unit tests for the weightTransfer library."""
+
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import rigsys.lib.weightTransfer as weightTransfer
+
+
+class TestWeightTransfer(unittest.TestCase):
+    """Test the weightTransfer library."""
+
+    def test_denseCluster(self):
+        """A dense cluster next to a sparse surface is queried exactly, with bounded candidate matrices."""
+        rng = np.random.default_rng(0)
+        surface = np.column_stack([rng.uniform(0.0, 10.0, (5000, 2)), np.zeros(5000)])
+        cluster = rng.normal([5.0, 5.0, 0.0], 1e-3, (2000, 3))
+        points = np.concatenate([surface, cluster])
+        queries = np.concatenate([surface[::7] + 1e-3, cluster[::7]])
+
+        budget = 2 ** 16
+        widths = []
+        grid = weightTransfer.PointGrid(points)
+        queryGroup = grid._queryGroup
+
+        def recordWidth(groupPoints, starts, counts, k):
+            distances, indices = queryGroup(groupPoints, starts, counts, k)
+            widths.append((len(groupPoints), max(int(counts.sum(axis=1).max()), k)))
+            return distances, indices
+
+        with mock.patch.object(weightTransfer, "_CANDIDATE_BUDGET", budget), \
+                mock.patch.object(grid, "_queryGroup", recordWidth):
+            distances, indices = grid.query(queries, k=4)
+
+        bruteDistances = np.linalg.norm(queries[:, None, :] - points[None, :, :], axis=2)
+        expected = np.sort(bruteDistances, axis=1)[:, :4]
+        np.testing.assert_allclose(distances, expected)
+        np.testing.assert_allclose(np.take_along_axis(bruteDistances, indices, axis=1), expected)
+
+        # Only a single point whose neighbourhood alone exceeds the budget may exceed it
+        self.assertGreater(len(widths), 1)
+        for rows, width in widths:
+            self.assertTrue(rows == 1 or rows * width <= budget)
+
+
+if __name__ == "__main__":
+    unittest.main()
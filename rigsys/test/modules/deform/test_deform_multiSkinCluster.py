@@ -0,0 +1,53 @@
+"""Test the MultiSkinCluster module."""
+
+
+import tempfile
+import unittest
+
+import maya.cmds as cmds
+
+from rigsys import Rig
+import rigsys.lib.skinWeights as skinWeights
+import rigsys.modules.deformer as deformer
+
+
+class TestMultiSkinCluster(unittest.TestCase):
+    """Test the MultiSkinCluster module."""
+
+    def setUp(self) -> None:
+        cmds.file(new=True, force=True)
+
+        self.rig = Rig()
+        self.path = tempfile.mkdtemp()
+
+        self.meshes = [cmds.polyCube(n=f"prop{i}")[0] for i in range(3)]
+        cmds.select(clear=True)
+        self.joints = [cmds.joint(n="jointA"), cmds.joint(n="jointB", p=[0, 1, 0])]
+
+        return super().setUp()
+
+    def test_general(self):
+        """Skin clusters are created for every mesh, and weights round trip using the file headers."""
+        module = deformer.MultiSkinCluster(
+            self.rig, meshes={mesh: self.joints for mesh in self.meshes}, path=self.path, exportSCLS=True
+        )
+        module.run()
+
+        for mesh in self.meshes:
+            self.assertEqual(skinWeights.getSkinCluster(mesh), f"{mesh}_scls")
+        expected = skinWeights.getWeightData("prop0_scls").weights
+
+        cmds.delete([f"{mesh}_scls" for mesh in self.meshes])
+        module = deformer.MultiSkinCluster(self.rig, meshes=self.meshes, path=self.path, importSCLS=True)
+        module.run()
+
+        restored = skinWeights.getWeightData("prop0_scls").weights
+        self.assertTrue(abs(restored - expected).max() < 1e-6)
+
+    def test_missingInfluences(self):
+        """Missing joints are reported before any skinCluster is created."""
+        module = deformer.MultiSkinCluster(self.rig, meshes={"prop0": ["jointA", "missingJoint"]}, path=self.path)
+
+        with self.assertRaises(RuntimeError):
+            module.run()
+        self.assertIsNone(skinWeights.getSkinCluster("prop0"))
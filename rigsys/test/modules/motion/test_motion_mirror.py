@@ -0,0 +1,120 @@
+"""Unit tests for motion module mirroring."""
+
+
+import unittest
+
+import numpy as np
+
+import maya.cmds as cmds
+
+import rigsys.api.api_rig as api_rig
+import rigsys.modules.motion as motion
+
+
+class TestMirror(unittest.TestCase):
+    """Test ModuleBase.doMirror on motion modules."""
+
+    def setUp(self) -> None:
+        self.rig = api_rig.Rig()
+        self.module = motion.TestMotionModule(self.rig, side="L", label="Arm", parent="L_Spine", mirror=True,
+                                              selectedSocket="L_Spine_End")
+        self.module.proxies["Proxy1"].position = [2.0, 1.0, 0.0]
+
+        return super().setUp()
+
+    def test_doMirror(self):
+        """The mirrored module is rebuilt from mirrored constructor arguments, leaving the original untouched."""
+        mirrored = self.module.doMirror()
+
+        self.assertEqual(mirrored.getFullName(), "R_Arm")
+        self.assertEqual(mirrored.parent, "R_Spine")
+        self.assertEqual(mirrored.selectedSocket, "R_Spine_End")
+        self.assertEqual(mirrored.aimAxis, "-x")
+        self.assertFalse(mirrored.mirror)
+        self.assertIs(mirrored._rig, self.rig)
+
+        self.assertEqual(mirrored.proxies["Proxy1"].side, "R")
+        self.assertEqual(mirrored.proxies["Proxy1"].position, [-2.0, 1.0, 0.0])
+        self.assertEqual(self.module.proxies["Proxy1"].side, "L")
+        self.assertEqual(self.module.proxies["Proxy1"].position, [2.0, 1.0, 0.0])
+
+    def test_mirrorSpec(self):
+        """Name fields are mirrored, immutable data is shared, and build time changes are not fed back."""
+        ctrlScale = [1.0, 2.0, 1.0]
+        module = motion.Limb(self.rig, side="L", label="Arm", parent="L_Spine", selectedSocket="L_Spine_End",
+                             ctrlShapes="L_circle", ctrlScale=ctrlScale, mirror=True)
+        module.selectedPlug = "Local"
+
+        mirrored = module.doMirror()
+
+        self.assertEqual(mirrored.parent, "R_Spine")
+        self.assertEqual(mirrored.selectedSocket, "R_Spine_End")
+        self.assertEqual(mirrored.selectedPlug, "")
+        self.assertEqual(mirrored.ctrlShapes, "L_circle")
+        self.assertIs(mirrored.ctrlScale, ctrlScale)
+        self.assertIs(mirrored.nameSet, module.nameSet)
+        for moduleType in motion.moduleTypes.values():
+            self.assertIn("mirrorFields", vars(moduleType), moduleType.__name__)
+
+    def test_duplicateMirror(self):
+        """The mirrored module is duplicated from the built module, with renamed nodes at the mirrored position."""
+        cmds.file(new=True, force=True)
+        module = motion.TestMotionModule(self.rig, side="L", label="Arm", mirror=True)
+        module.proxies["Proxy1"].position = [2.0, 1.0, 0.0]
+        self.rig.motionModules = {"L_Arm": module}
+
+        self.rig.build(duplicateMirrors=True)
+        mirrored = self.rig.motionModules["R_Arm"]
+
+        self.assertIsNotNone(module._nodeTracker)
+        self.assertEqual(mirrored.sockets["SomeSocket"], "R_Arm_SomeSocket")
+        self.assertEqual(mirrored.plugs["SomePlug"], "R_Arm_SomePlug")
+        self.assertEqual(cmds.listRelatives("R_Arm_grp", parent=True), [self.rig.name])
+        matrix = cmds.xform("R_Arm_grp", query=True, worldSpace=True, matrix=True)
+        expected = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, -2.0, 1.0, 0.0, 1.0]
+        self.assertEqual([round(value, 4) for value in matrix], expected)
+
+    def test_duplicateMirrorFK(self):
+        """Duplicated FK joints and controls match the ones of a rebuilt R side, without negative scale."""
+        positions = {"Start": [2.0, 10.0, 0.0], "1": [4.0, 10.0, -1.0], "End": [6.0, 10.0, 0.0],
+                     "UpVector": [4.0, 10.0, -6.0]}
+        nodes = ["R_Finger_Start", "R_Finger_1", "R_Finger_Start_CTRL", "R_Finger_1_CTRL"]
+        matrices = {}
+        for duplicateMirrors in (False, True):
+            module = motion.FK(self.rig, side="L", label="Finger", segments=2, mirror=True)
+            for key, position in positions.items():
+                module.proxies[key].position = position
+            self.rig.motionModules = {"L_Finger": module}
+
+            self.rig.build(duplicateMirrors=duplicateMirrors)
+            matrices[duplicateMirrors] = {
+                node: np.array(cmds.xform(node, query=True, worldSpace=True, matrix=True)).reshape(4, 4)
+                for node in nodes
+            }
+
+        self.assertTrue(self.rig.motionModules["R_Finger"].canDuplicateFromMirror())
+        for node in nodes:
+            rebuilt, duplicated = matrices[False][node], matrices[True][node]
+            self.assertTrue(np.allclose(duplicated, rebuilt, atol=1e-3), node)
+            self.assertGreater(np.linalg.det(duplicated[:3, :3]), 0.0, node)
+
+    def test_duplicateMirrorRibbon(self):
+        """A Limb's ribbon pins are world space driven, so its mirror is rebuilt with the pins on the R side."""
+        cmds.file(new=True, force=True)
+        module = motion.Limb(self.rig, side="L", label="Arm", mirror=True, numberOfJoints=5)
+        positions = {"Root": [1.0, 10.0, 0.0], "Start": [2.0, 10.0, 0.0], "Mid": [5.0, 10.0, -1.0],
+                     "End": [8.0, 10.0, 0.0]}
+        for key, position in positions.items():
+            module.proxies[key].position = position
+        self.rig.motionModules = {"L_Arm": module}
+
+        self.rig.build(duplicateMirrors=True)
+        mirrored = self.rig.motionModules["R_Arm"]
+
+        self.assertFalse(mirrored.canDuplicateFromMirror())
+        for i in range(5):
+            left = cmds.xform(f"L_Arm_{i}", query=True, worldSpace=True, translation=True)
+            right = cmds.xform(f"R_Arm_{i}", query=True, worldSpace=True, translation=True)
+            self.assertGreater(left[0], 0.0)
+            for leftValue, rightValue, sign in zip(left, right, (-1.0, 1.0, 1.0)):
+                self.assertAlmostEqual(rightValue, sign * leftValue, places=3)
@@ -65,3 +65,23 @@ class TestRig(unittest.TestCase):
         }
 
         rig.build(usedSavedProxyData=False)
+
+    def test_nodeBudgets(self):
+        """Test node tracking and budget enforcement."""
+        rig = api_rig.Rig()
+        rig.motionModules = {
+            "M_Root": motion.Root(
+                rig,
+                side="M",
+                label="Root",
+            ),
+        }
+
+        rig.build(trackNodes=True)
+
+        self.assertIn("M_Root", rig.nodeReport)
+        self.assertGreater(rig.nodeReport["M_Root"]["total"], 0)
+        self.assertIn("joint", rig.nodeReport["M_Root"]["types"])
+
+        with self.assertRaises(Exception):
+            rig.build(nodeBudgets={"M_Root": {"total": 1}})
@@ -0,0 +1,121 @@
+"""Encode component indices as compact range strings, and decode them back.
+
+cmds commands accept component ranges such as "pCubeShape1.vtx[0:999]" or "surfaceShape1.cv[0:3][0:7]" in place of one
+name per component. These functions turn index arrays into as few range strings as possible, and back.
+
+Example usage:
+
+import rigsys.utils.componentCodec as componentCodec
+
+componentCodec.encode("pCubeShape1", "vtx", [0, 1, 2, 3, 7])
+# ['pCubeShape1.vtx[0:3]', 'pCubeShape1.vtx[7]']
+componentCodec.encodeGrid("surfaceShape1", "cv", [(0, 0), (0, 1), (1, 0), (1, 1)])
+# ['surfaceShape1.cv[0:1][0:1]']
+componentCodec.decode(["pCubeShape1.vtx[0:3]", "pCubeShape1.vtx[7]"])
+# ('pCubeShape1', 'vtx', array([0, 1, 2, 3, 7]))
+"""
+
+import re
+
+import numpy as np
+
+_COMPONENT_PATTERN = re.compile(r"^(?P<node>.+)\.(?P<component>\w+)(?P<indices>(\[[^\]]+\])+)$")
+
+
+def getRanges(indices) -> list:
+    """Return the sorted, unique indices as a list of inclusive (start, stop) runs of consecutive indices."""
+    indices = np.unique(np.asarray(indices, dtype=np.int64))
+    if not len(indices):
+        return []
+
+    breaks = np.flatnonzero(np.diff(indices) != 1)
+    starts = indices[np.concatenate(([0], breaks + 1))]
+    stops = indices[np.concatenate((breaks, [len(indices) - 1]))]
+    return list(zip(starts.tolist(), stops.tolist()))
+
+
+def _formatRange(start, stop):
+    """Return "[start:stop]", or "[start]" for a single index."""
+    return f"[{start}]" if start == stop else f"[{start}:{stop}]"
+
+
+def encode(node: str, component: str, indices) -> list:
+    """Return range strings covering single indexed components, such as vertices or curve CVs.
+
+    Args:
+        node (str): The shape.
+        component (str): The component type, such as "vtx", "cv", "e" or "f".
+        indices (iterable): The component indices.
+    """
+    return [f"{node}.{component}{_formatRange(start, stop)}" for start, stop in getRanges(indices)]
+
+
+def encodeGrid(node: str, component: str, indices) -> list:
+    """Return range strings covering double indexed components, such as surface CVs.
+
+    Runs of V indices are found per U index, then consecutive U indices with the same V runs are merged, so full
+    rectangular blocks become a single "cv[u0:u1][v0:v1]" string.
+
+    Args:
+        node (str): The shape.
+        component (str): The component type, such as "cv".
+        indices (iterable): (u, v) index pairs.
+    """
+    indices = np.unique(np.asarray(indices, dtype=np.int64).reshape(-1, 2), axis=0)
+    if not len(indices):
+        return []
+
+    uValues, starts = np.unique(indices[:, 0], return_index=True)
+    vRuns = [tuple(getRanges(vIndices)) for vIndices in np.split(indices[:, 1], starts[1:])]
+
+    results = []
+    blockStart = 0
+    for index in range(1, len(uValues) + 1):
+        if index < len(uValues) and uValues[index] == uValues[index - 1] + 1 and vRuns[index] == vRuns[blockStart]:
+            continue
+
+        uRange = _formatRange(int(uValues[blockStart]), int(uValues[index - 1]))
+        results.extend(f"{node}.{component}{uRange}{_formatRange(*vRun)}" for vRun in vRuns[blockStart])
+        blockStart = index
+
+    return results
+
+
+def decode(components) -> tuple:
+    """Return the indices named by one or more component strings, as produced by encode or encodeGrid.
+
+    All strings must name the same node and component type. Wildcards ("[*]") are not supported, as they need the
+    component count.
+
+    Returns:
+        tuple: (node, component, indices), where indices is a 1D array for single indexed components and an (N, 2)
+            array of (u, v) pairs for double indexed components.
+    """
+    if isinstance(components, str):
+        components = [components]
+
+    node = component = None
+    indices = []
+    for name in components:
+        match = _COMPONENT_PATTERN.match(name)
+        if match is None:
+            raise ValueError(f"{name} is not a component name.")
+        if node is not None and (match.group("node"), match.group("component")) != (node, component):
+            raise ValueError(f"{name} does not match {node}.{component}")
+        node, component = match.group("node"), match.group("component")
+
+        axes = []
+        for token in re.findall(r"\[([^\]]+)\]", match.group("indices")):
+            if token == "*":
+                raise ValueError(f"Wildcards are not supported: {name}")
+            start, _, stop = token.partition(":")
+            axes.append(np.arange(int(start), int(stop or start) + 1))
+
+        if len(axes) == 1:
+            indices.append(axes[0])
+        else:
+            indices.append(np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, len(axes)))
+
+    if not indices:
+        return None, None, np.array([], dtype=np.int64)
+    return node, component, np.concatenate(indices)